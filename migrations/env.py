@@ -8,13 +8,18 @@ from sqlalchemy import engine_from_config, pool
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # Import all models
-from src.core.database import Base
+from src.core.database import DATABASE_URL, Base
 from src.core.models import *
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
+# Migrate the same database the application opens (QUOTES_DATABASE_URL or
+# data/quotes.db next to the package) rather than a path relative to the
+# current working directory. ConfigParser treats '%' as interpolation.
+config.set_main_option('sqlalchemy.url', DATABASE_URL.replace('%', '%%'))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
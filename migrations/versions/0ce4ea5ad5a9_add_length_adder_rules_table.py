@@ -0,0 +1,115 @@
+"""add length_adder_rules table
+
+Revision ID: 0ce4ea5ad5a9
+Revises: d47a6498d914
+Create Date: 2026-10-16 20:04:52.118630
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0ce4ea5ad5a9'
+down_revision: Union[str, None] = 'd47a6498d914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The extra length adders previously hardcoded in ExtraLengthStrategy.
+# Kept local to the migration so it does not change with the pricing code.
+DEFAULT_RULES = [
+    {
+        'material_code': 'U',
+        'base_length': 4.0,
+        'product_base_length': None,
+        'unit': 'inch',
+        'rate': 40.0,
+        'rounding': 'exact',
+        'notes': 'UHMW: $40/inch beyond 4"',
+    },
+    {
+        'material_code': 'T',
+        'base_length': 4.0,
+        'product_base_length': None,
+        'unit': 'inch',
+        'rate': 50.0,
+        'rounding': 'exact',
+        'notes': 'Teflon: $50/inch beyond 4"',
+    },
+    {
+        'material_code': 'S',
+        'base_length': None,
+        'product_base_length': 10.0,
+        'unit': 'inch',
+        'rate': 3.75,
+        'rounding': 'exact',
+        'notes': '316SS: $3.75/inch beyond a 10" base length',
+    },
+    {
+        'material_code': 'H',
+        'base_length': None,
+        'product_base_length': None,
+        'unit': 'foot',
+        'rate': 110.0,
+        'rounding': 'floor',
+        'notes': 'Halar: $110 per full foot beyond the base length',
+    },
+    {
+        'material_code': 'TS',
+        'base_length': None,
+        'product_base_length': None,
+        'unit': 'foot',
+        'rate': 110.0,
+        'rounding': 'floor',
+        'notes': 'Teflon Sleeve: $110 per full foot beyond the base length',
+    },
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'length_adder_rules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('product_family', sa.String(), nullable=True),
+        sa.Column('material_code', sa.String(length=10), nullable=False),
+        sa.Column('base_length', sa.Float(), nullable=True),
+        sa.Column('product_base_length', sa.Float(), nullable=True),
+        sa.Column('unit', sa.String(), nullable=False),
+        sa.Column('rate', sa.Float(), nullable=False),
+        sa.Column('rounding', sa.String(), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['material_code'], ['materials.code']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_length_adder_rules_product_family'),
+        'length_adder_rules',
+        ['product_family'],
+        unique=False,
+    )
+
+    op.bulk_insert(
+        sa.table(
+            'length_adder_rules',
+            sa.column('material_code', sa.String()),
+            sa.column('base_length', sa.Float()),
+            sa.column('product_base_length', sa.Float()),
+            sa.column('unit', sa.String()),
+            sa.column('rate', sa.Float()),
+            sa.column('rounding', sa.String()),
+            sa.column('notes', sa.Text()),
+        ),
+        DEFAULT_RULES,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_length_adder_rules_product_family'),
+        table_name='length_adder_rules',
+    )
+    op.drop_table('length_adder_rules')
@@ -0,0 +1,42 @@
+"""add precomputed_prices table
+
+Revision ID: 5f2c8e1b7a93
+Revises: 0ce4ea5ad5a9
+Create Date: 2026-10-16 22:41:07.352918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c8e1b7a93'
+down_revision: Union[str, None] = '0ce4ea5ad5a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'precomputed_prices',
+        sa.Column('product_family_id', sa.Integer(), nullable=False),
+        sa.Column('voltage', sa.String(), nullable=False),
+        sa.Column('material_code', sa.String(length=10), nullable=False),
+        sa.Column('length', sa.Float(), nullable=False),
+        sa.Column('connection', sa.String(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('price_cents', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['product_family_id'], ['product_families.id']),
+        sa.PrimaryKeyConstraint(
+            'product_family_id', 'voltage', 'material_code', 'length', 'connection'
+        ),
+        sqlite_with_rowid=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('precomputed_prices')
@@ -0,0 +1,85 @@
+"""add option_product_families table
+
+Revision ID: 6a321f46b555
+Revises: 53bc43d2c651
+Create Date: 2026-10-16 09:12:31.402118
+
+"""
+
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6a321f46b555'
+down_revision: Union[str, None] = '53bc43d2c651'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _parse_product_families(value):
+    """Normalize a stored options.product_families value to a list of names.
+
+    Kept local to the migration so it does not change with the models.
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith('['):
+            try:
+                return _parse_product_families(json.loads(text))
+            except ValueError:
+                pass
+        families = text.split(',')
+    else:
+        families = value
+    names = (str(f).strip() for f in families if f)
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'option_product_families',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('option_id', sa.Integer(), nullable=False),
+        sa.Column('product_family', sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(['option_id'], ['options.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_option_product_families_family_option',
+        'option_product_families',
+        ['product_family', 'option_id'],
+        unique=True,
+    )
+
+    # Backfill from the JSON column
+    bind = op.get_bind()
+    options = bind.execute(sa.text('SELECT id, product_families FROM options'))
+    links = [
+        {'option_id': option_id, 'product_family': family}
+        for option_id, product_families in options
+        for family in _parse_product_families(product_families)
+    ]
+    if links:
+        op.bulk_insert(
+            sa.table(
+                'option_product_families',
+                sa.column('option_id', sa.Integer()),
+                sa.column('product_family', sa.String()),
+            ),
+            links,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_option_product_families_family_option',
+        table_name='option_product_families',
+    )
+    op.drop_table('option_product_families')
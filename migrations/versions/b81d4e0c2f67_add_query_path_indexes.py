@@ -0,0 +1,61 @@
+"""add query path indexes
+
+Revision ID: b81d4e0c2f67
+Revises: 5f2c8e1b7a93
+Create Date: 2026-10-16 23:58:12.604381
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81d4e0c2f67'
+down_revision: Union[str, None] = '5f2c8e1b7a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_quote_items_quote_product',
+        'quote_items',
+        ['quote_id', 'product_id'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_quote_item_options_quote_item_id'),
+        'quote_item_options',
+        ['quote_item_id'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_quotes_date_created'), 'quotes', ['date_created'], unique=False
+    )
+    op.create_index(
+        'ix_material_options_family_material_available',
+        'material_options',
+        ['product_family_id', 'material_code', 'is_available'],
+        unique=False,
+    )
+    # The name lookups of ix_options_name are served by the composite index
+    op.create_index(
+        'ix_options_name_category', 'options', ['name', 'category'], unique=False
+    )
+    op.drop_index(op.f('ix_options_name'), table_name='options')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_options_name'), 'options', ['name'], unique=False)
+    op.drop_index('ix_options_name_category', table_name='options')
+    op.drop_index(
+        'ix_material_options_family_material_available', table_name='material_options'
+    )
+    op.drop_index(op.f('ix_quotes_date_created'), table_name='quotes')
+    op.drop_index(
+        op.f('ix_quote_item_options_quote_item_id'), table_name='quote_item_options'
+    )
+    op.drop_index('ix_quote_items_quote_product', table_name='quote_items')
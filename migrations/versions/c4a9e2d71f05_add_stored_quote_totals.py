@@ -0,0 +1,68 @@
+"""add stored quote totals
+
+Revision ID: c4a9e2d71f05
+Revises: b81d4e0c2f67
+Create Date: 2026-10-17 01:12:46.918253
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9e2d71f05'
+down_revision: Union[str, None] = 'b81d4e0c2f67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOTAL_COLUMNS = ('subtotal_cents', 'discount_total_cents', 'total_cents')
+
+# Backfill, kept local to the migration so it does not change with the models
+# (same arithmetic as src.core.models.quote.refresh_totals)
+BACKFILL = (
+    """
+    UPDATE quote_items SET subtotal_cents =
+        CAST(round(unit_price * 100) AS INTEGER) * coalesce(nullif(quantity, 0), 1)
+        + (SELECT coalesce(sum(CAST(round(price * 100) AS INTEGER)
+                               * coalesce(quantity, 1)), 0)
+           FROM quote_item_options
+           WHERE quote_item_options.quote_item_id = quote_items.id)
+    """,
+    """
+    UPDATE quote_items SET
+        discount_total_cents = CAST(round(
+            subtotal_cents * coalesce(discount_percent, 0.0) / 100.0) AS INTEGER),
+        total_cents = subtotal_cents - CAST(round(
+            subtotal_cents * coalesce(discount_percent, 0.0) / 100.0) AS INTEGER)
+    """,
+    """
+    UPDATE quotes SET
+        subtotal_cents = (SELECT coalesce(sum(subtotal_cents), 0)
+                          FROM quote_items WHERE quote_items.quote_id = quotes.id),
+        discount_total_cents = (SELECT coalesce(sum(discount_total_cents), 0)
+                                FROM quote_items WHERE quote_items.quote_id = quotes.id),
+        total_cents = (SELECT coalesce(sum(total_cents), 0)
+                       FROM quote_items WHERE quote_items.quote_id = quotes.id)
+    """,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('quote_items', 'quotes'):
+        for column in TOTAL_COLUMNS:
+            op.add_column(
+                table,
+                sa.Column(column, sa.Integer(), server_default='0', nullable=False),
+            )
+    for statement in BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('quotes', 'quote_items'):
+        for column in reversed(TOTAL_COLUMNS):
+            op.drop_column(table, column)
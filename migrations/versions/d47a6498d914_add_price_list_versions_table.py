@@ -0,0 +1,48 @@
+"""add price_list_versions table
+
+Revision ID: d47a6498d914
+Revises: 6a321f46b555
+Create Date: 2026-10-16 19:31:08.517204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd47a6498d914'
+down_revision: Union[str, None] = '6a321f46b555'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'price_list_versions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.String(), nullable=False),
+        sa.Column('effective_date', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('snapshot', sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('version'),
+    )
+    op.create_index(
+        op.f('ix_price_list_versions_effective_date'),
+        'price_list_versions',
+        ['effective_date'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_price_list_versions_effective_date'),
+        table_name='price_list_versions',
+    )
+    op.drop_table('price_list_versions')
@@ -0,0 +1,57 @@
+"""add catalog revision
+
+Revision ID: f3b8a61d2c47
+Revises: c4a9e2d71f05
+Create Date: 2026-10-17 09:36:18.205714
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8a61d2c47'
+down_revision: Union[str, None] = 'c4a9e2d71f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables the price book is loaded from (src.core.models.CATALOG_MODELS), kept
+# local to the migration so it does not change with the models
+CATALOG_TABLES = (
+    'products',
+    'materials',
+    'material_options',
+    'standard_lengths',
+    'options',
+    'option_product_families',
+    'length_adder_rules',
+)
+OPERATIONS = ('insert', 'update', 'delete')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    catalog_revision = op.create_table(
+        'catalog_revision',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.bulk_insert(catalog_revision, [{'id': 1, 'revision': 0}])
+    for table in CATALOG_TABLES:
+        for operation in OPERATIONS:
+            op.execute(
+                f'CREATE TRIGGER IF NOT EXISTS catalog_revision_{table}_{operation} '
+                f'AFTER {operation.upper()} ON {table} BEGIN '
+                f'UPDATE catalog_revision SET revision = revision + 1 WHERE id = 1; END'
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CATALOG_TABLES:
+        for operation in OPERATIONS:
+            op.execute(f'DROP TRIGGER IF EXISTS catalog_revision_{table}_{operation}')
+    op.drop_table('catalog_revision')
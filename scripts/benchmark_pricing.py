@@ -0,0 +1,550 @@
+"""
+Pricing benchmark.
+
+Seeds a temporary SQLite database with the business configuration
+(scripts/data/seeds/options/init_business_config.py) and every product variant
+seed (scripts/data/seeds/product_variants), then times the pricing entry
+points across every family, voltage, material and length:
+
+- calculate_product_price
+- PricingService.calculate_price, with material names (one service) and with
+  material codes (a new service per call, so standard configurations are
+  looked up in the precomputed price table)
+- ConfigurationService._update_price
+- ConfigurationService.select_option (length changes, incremental repricing)
+- the first price of a fresh process, with and without a PriceMemo (each
+  sample runs in a new Python process; imports are not timed)
+
+For each it reports p50/p95 latency, SQL statements per call and errors as
+JSON, both overall and per product family. The services do not raise on
+invalid configurations (they return 0.0 or a fallback price), so their results
+are checked against calculate_product_price and every mismatch is an error. The grid and seed data are fixed, so runs are
+comparable over time; pass --compare with an earlier report to fail on
+regressions.
+
+Usage:
+    python scripts/benchmark_pricing.py [--repeat N] [--output FILE]
+        [--compare BASELINE] [--tolerance 0.25] [--min-delta-ms 0.5]
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import sqlalchemy
+from sqlalchemy import create_engine
+
+import src.core.database as database
+from scripts.data.seeds.options.init_business_config import init_business_config
+from scripts.data.seeds.product_variants import seed_all_product_variants
+from src.core.database import Base, SessionLocal
+from src.core.models import (
+    Material,
+    MaterialOption,
+    Option,
+    OptionProductFamily,
+    Product,
+    ProductFamily,
+    ProductVariant,
+)
+from src.core.pricing import (
+    PricingEngine,
+    build_price_table,
+    calculate_product_price,
+)
+from src.core.pricing.trace import count_statements
+from src.core.services.configuration_service import ConfigurationService
+from src.core.services.pricing_service import PricingService
+from src.core.services.product_service import ProductService
+
+REPORT_VERSION = 1
+
+# Probe lengths in inches: base lengths, standard and non-standard lengths, and
+# lengths past the Halar limit
+LENGTHS = [4, 6, 10, 12, 15, 18, 24, 30, 36, 48, 60, 72, 84, 96, 120]
+
+# The seeds do not include materials, so the benchmark catalog defines them:
+# (code, name, base length, adder per inch, adder per foot,
+#  has non-standard length surcharge, non-standard length surcharge)
+MATERIALS = [
+    ("S", "316SS", 10.0, 0.0, 45.0, False, 0.0),
+    ("H", "Halar", 10.0, 0.0, 110.0, True, 300.0),
+    ("TS", "Teflon Sleeve", 10.0, 0.0, 110.0, True, 300.0),
+    ("U", "UHMWPE", 4.0, 40.0, 0.0, False, 0.0),
+    ("T", "Teflon", 4.0, 50.0, 0.0, False, 0.0),
+    ("C", "Cable", 12.0, 0.0, 45.0, False, 0.0),
+    ("CPVC", "CPVC", 4.0, 50.0, 0.0, False, 0.0),
+]
+
+
+def seed_catalog(db_path: Path):
+    """
+    Create and seed the benchmark database.
+
+    The seed scripts use the application's SessionLocal and init_db, so both
+    are pointed at the temporary database while seeding.
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    database.engine = engine
+    SessionLocal.configure(bind=engine)
+    Base.metadata.create_all(engine)
+
+    # The seed scripts print progress; keep stdout for the report
+    with contextlib.redirect_stdout(sys.stderr):
+        init_business_config()
+        seed_all_product_variants()
+
+    db = SessionLocal()
+    try:
+        for code, name, base_length, per_inch, per_foot, surcharge, amount in MATERIALS:
+            db.add(
+                Material(
+                    code=code,
+                    name=name,
+                    base_length=base_length,
+                    length_adder_per_inch=per_inch,
+                    length_adder_per_foot=per_foot,
+                    has_nonstandard_length_surcharge=surcharge,
+                    nonstandard_length_surcharge=amount,
+                )
+            )
+
+        # Products and material options mirror the seeded variants
+        material_adders = {
+            link.product_family: option.adders or {}
+            for option, link in db.query(Option, OptionProductFamily)
+            .join(OptionProductFamily)
+            .filter(Option.name == "Material")
+        }
+        families = {f.id: f.name for f in db.query(ProductFamily)}
+        seen_materials = set()
+        for variant in db.query(ProductVariant).order_by(ProductVariant.id):
+            db.add(
+                Product(
+                    model_number=variant.model_number,
+                    description=variant.description,
+                    base_price=variant.base_price,
+                    base_length=variant.base_length,
+                    voltage=variant.voltage,
+                    material=variant.material,
+                    product_family_id=variant.product_family_id,
+                )
+            )
+            key = (variant.product_family_id, variant.material)
+            if key not in seen_materials:
+                seen_materials.add(key)
+                adders = material_adders.get(families[variant.product_family_id], {})
+                db.add(
+                    MaterialOption(
+                        product_family_id=variant.product_family_id,
+                        material_code=variant.material,
+                        display_name=variant.material,
+                        base_price=float(adders.get(variant.material, 0.0)),
+                        is_available=1,
+                    )
+                )
+        db.commit()
+        build_price_table(db)
+    finally:
+        db.close()
+    return engine
+
+
+def _summarize(samples):
+    """Summarize (elapsed seconds, statements, failed) samples."""
+    if not samples:
+        return {"calls": 0}
+    elapsed = np.array([s[0] for s in samples]) * 1000.0
+    statements = np.array([s[1] for s in samples])
+    return {
+        "calls": len(samples),
+        "errors": sum(1 for s in samples if s[2]),
+        "p50_ms": round(float(np.percentile(elapsed, 50)), 4),
+        "p95_ms": round(float(np.percentile(elapsed, 95)), 4),
+        "mean_ms": round(float(elapsed.mean()), 4),
+        "max_ms": round(float(elapsed.max()), 4),
+        "queries_per_call": round(float(statements.mean()), 2),
+    }
+
+
+class _Recorder:
+    """Times calls and counts their SQL statements, per family."""
+
+    def __init__(self, counter):
+        self.counter = counter
+        self.samples = defaultdict(list)
+
+    def time(self, family: str, func, *args, check=None, **kwargs):
+        """
+        Time one call; it fails if it raises or ``check(result)`` is false.
+        """
+        before = self.counter.count
+        failed = False
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter() - start
+        if not failed and check is not None:
+            failed = not check(result)
+        self.samples[family].append((elapsed, self.counter.count - before, failed))
+
+    def report(self):
+        all_samples = [s for samples in self.samples.values() for s in samples]
+        result = _summarize(all_samples)
+        result["by_family"] = {
+            family: _summarize(samples)
+            for family, samples in sorted(self.samples.items())
+        }
+        return result
+
+
+def _grid(db):
+    """Get (family id, family name, product) for every seeded product."""
+    families = {f.id: f.name for f in db.query(ProductFamily)}
+    products = db.query(Product).order_by(Product.id).all()
+    return [(p.product_family_id, families[p.product_family_id], p) for p in products]
+
+
+def _expected_prices(db, grid):
+    """
+    Get the calculate_product_price price of every grid configuration.
+
+    The services price a family, voltage and material, so the expected price
+    is that of the product they resolve to (a family can have several
+    products for one voltage and material). Configurations that cannot be
+    priced map to None, so the services' 0.0 and fallback prices for them
+    count as errors.
+    """
+    engine = PricingEngine(db)
+    expected = {}
+    for family_id, _family, product in grid:
+        try:
+            resolved, material_override = engine.resolve_product(
+                family_id, product.voltage, product.material
+            )
+        except ValueError:
+            resolved = None
+        for length in LENGTHS:
+            price = None
+            if resolved is not None:
+                try:
+                    price = calculate_product_price(
+                        db, resolved.id, float(length), material_override
+                    )
+                except ValueError:
+                    pass
+            expected[product.id, length] = price
+    return expected
+
+
+def bench_calculate_product_price(db, grid, repeat):
+    with count_statements(db) as counter:
+        recorder = _Recorder(counter)
+        for _ in range(repeat):
+            for _family_id, family, product in grid:
+                for length in LENGTHS:
+                    recorder.time(
+                        family, calculate_product_price, db, product.id, length
+                    )
+    return recorder.report()
+
+
+def bench_pricing_service(db, grid, repeat, material_codes=False):
+    """
+    Time PricingService.calculate_price.
+
+    With material names every call goes through one service (and its engine);
+    with material codes each call gets a new service, which looks standard
+    configurations up in the precomputed price table before loading an engine.
+    """
+    expected = _expected_prices(db, grid)
+    names = {code: name for code, name, *_ in MATERIALS}
+    service = PricingService(db)
+
+    def calculate_price(**kwargs):
+        return (PricingService(db) if material_codes else service).calculate_price(
+            **kwargs
+        )
+
+    with count_statements(db) as counter:
+        recorder = _Recorder(counter)
+        for _ in range(repeat):
+            for family_id, family, product in grid:
+                material = product.material
+                if not material_codes:
+                    material = names.get(material, material)
+                for length in LENGTHS:
+                    price = expected[product.id, length]
+                    recorder.time(
+                        family,
+                        calculate_price,
+                        product_family_id=family_id,
+                        material=material,
+                        length=float(length),
+                        voltage=product.voltage,
+                        check=lambda result, price=price: result == price,
+                    )
+    return recorder.report()
+
+
+def _start_configuration(service, family_id, family, product):
+    service.start_configuration(
+        product_family_id=family_id,
+        product_family_name=family,
+        base_product_info={
+            "base_price": product.base_price,
+            "voltage": product.voltage,
+            "material": product.material,
+            "base_length": product.base_length,
+        },
+    )
+    service.current_config.selected_options.update(
+        {"Voltage": product.voltage, "Material": product.material}
+    )
+
+
+def _final_price_check(service, price):
+    """
+    Check a configuration's final price against the expected price.
+
+    _update_price does not raise; it sets FALLBACK_PRICE (or the base price)
+    when pricing fails, which differs from the expected price.
+    """
+
+    def check(_result):
+        return service.current_config.final_price == price
+
+    return check
+
+
+def bench_update_price(db, grid, repeat):
+    expected = _expected_prices(db, grid)
+    service = ConfigurationService(db, ProductService(db))
+    with count_statements(db) as counter:
+        recorder = _Recorder(counter)
+        for _ in range(repeat):
+            for family_id, family, product in grid:
+                _start_configuration(service, family_id, family, product)
+                for length in LENGTHS:
+                    service.current_config.selected_options["Length"] = length
+                    recorder.time(
+                        family,
+                        service._update_price,
+                        check=_final_price_check(service, expected[product.id, length]),
+                    )
+    return recorder.report()
+
+
+def bench_select_length(db, grid, repeat):
+    expected = _expected_prices(db, grid)
+    service = ConfigurationService(db, ProductService(db))
+    with count_statements(db) as counter:
+        recorder = _Recorder(counter)
+        for _ in range(repeat):
+            for family_id, family, product in grid:
+                _start_configuration(service, family_id, family, product)
+                for length in LENGTHS:
+                    recorder.time(
+                        family,
+                        service.select_option,
+                        "Length",
+                        length,
+                        check=_final_price_check(service, expected[product.id, length]),
+                    )
+    return recorder.report()
+
+
+# Run in a fresh process per sample: prints [seconds, statements, failed] of
+# creating an engine and pricing one product
+_FIRST_PRICE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.core.pricing.engine import PricingEngine
+from src.core.pricing.price_memo import default_price_memo
+from src.core.pricing.trace import count_statements
+
+db = sessionmaker(bind=create_engine({url!r}))()
+failed = False
+with count_statements(db) as counter:
+    start = time.perf_counter()
+    try:
+        memo = default_price_memo(db) if {memo!r} else None
+        PricingEngine(db, memo=memo).price_product({product_id!r}, 24.0)
+    except Exception:
+        failed = True
+    elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, counter.count, failed]))
+"""
+
+# Fresh processes per first-price benchmark
+FIRST_PRICE_SAMPLES = 5
+
+
+def bench_first_price(db, grid, repeat, memo):
+    """Time the first price of fresh processes on the benchmark database."""
+    code = _FIRST_PRICE.format(
+        root=str(Path(__file__).resolve().parent.parent),
+        url=str(db.get_bind().url),
+        memo=memo,
+        product_id=grid[0][2].id,
+    )
+    samples = []
+    for _ in range(FIRST_PRICE_SAMPLES * repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(tuple(json.loads(output.splitlines()[-1])))
+    return _summarize(samples)
+
+
+BENCHMARKS = {
+    "calculate_product_price": bench_calculate_product_price,
+    "PricingService.calculate_price": bench_pricing_service,
+    "PricingService.calculate_price (material codes)": partial(
+        bench_pricing_service, material_codes=True
+    ),
+    "ConfigurationService._update_price": bench_update_price,
+    "ConfigurationService.select_option": bench_select_length,
+    "first price (fresh process)": partial(bench_first_price, memo=False),
+    "first price (fresh process, PriceMemo)": partial(bench_first_price, memo=True),
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(repeat: int):
+    """Seed a temporary catalog and run every benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = seed_catalog(Path(tmp) / "benchmark.db")
+        db = SessionLocal()
+        try:
+            grid = _grid(db)
+            report = {
+                "version": REPORT_VERSION,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "environment": {
+                    "git_commit": _git_commit(),
+                    "python": platform.python_version(),
+                    "sqlalchemy": sqlalchemy.__version__,
+                    "platform": platform.platform(),
+                },
+                "parameters": {"repeat": repeat, "lengths": LENGTHS},
+                "catalog": {
+                    "families": len({family for _, family, _ in grid}),
+                    "products": len(grid),
+                },
+                "results": {},
+            }
+            for name, bench in BENCHMARKS.items():
+                # Warm up caches and the connection pool before timing
+                bench(db, grid[:1], 1)
+                db.expire_all()
+                report["results"][name] = bench(db, grid, repeat)
+        finally:
+            db.close()
+            engine.dispose()
+    return report
+
+
+def compare(report, baseline, tolerance: float, min_delta_ms: float):
+    """
+    Compare a report against a baseline report.
+
+    Latency regresses when it grows by more than ``tolerance`` (relative) and
+    ``min_delta_ms`` (absolute, to ignore timer noise on sub-millisecond
+    calls). Statement and error counts are deterministic, so any increase
+    regresses.
+
+    Returns:
+        list: Descriptions of the metrics that regressed
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("calls"):
+            continue
+        if result["errors"] > base["errors"]:
+            regressions.append(f"{name} errors: {base['errors']} -> {result['errors']}")
+        for metric in ("p50_ms", "p95_ms"):
+            old, new = base[metric], result[metric]
+            if new > old * (1.0 + tolerance) and new - old > min_delta_ms:
+                regressions.append(f"{name} {metric}: {old} -> {new}")
+        old, new = base["queries_per_call"], result["queries_per_call"]
+        if new > old + 0.005:
+            regressions.append(f"{name} queries_per_call: {old} -> {new}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the grid")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="baseline report to compare")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative latency regression when comparing (default 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="ignore latency regressions smaller than this (default 0.5)",
+    )
+    args = parser.parse_args()
+
+    # Pricing code logs every call; keep logging out of the timings
+    logging.disable(logging.CRITICAL)
+
+    report = run(args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(
+            report,
+            json.loads(args.compare.read_text()),
+            args.tolerance,
+            args.min_delta_ms,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
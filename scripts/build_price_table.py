@@ -0,0 +1,49 @@
+"""
+Precompute the prices of standard configurations.
+
+Prices every voltage, material, standard length and connection combination of
+each product family and stores the results in the precomputed_prices table
+(see src/core/pricing/price_table.py), so standard configurations are priced
+with a single lookup. The table is emptied whenever the catalog is edited
+through the application; rerun this script afterwards, and after bulk imports.
+
+Usage:
+    python scripts/build_price_table.py [--family ID ...]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import SessionLocal
+from src.core.pricing.price_table import build_price_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--family",
+        type=int,
+        action="append",
+        dest="families",
+        metavar="ID",
+        help="product family ID to build (repeatable; default: all families)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        built = build_price_table(db, product_family_ids=args.families)
+    finally:
+        db.close()
+
+    for family_id, rows in built.items():
+        print(f"Product family {family_id}: {rows} configurations")
+    print(f"Precomputed {sum(built.values())} prices")
+
+
+if __name__ == "__main__":
+    main()
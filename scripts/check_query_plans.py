@@ -0,0 +1,207 @@
+"""
+Check that the hot quote and catalog queries use their indexes.
+
+Runs the queries behind the dashboard, quote loading, material selection,
+standard length checks and option lookups, captures the SQL they execute and
+asserts with EXPLAIN QUERY PLAN that each one reaches its table through the
+expected index instead of scanning it (the indexes are added by migration
+b81d4e0c2f67, except ix_standard_lengths_material_code, which the initial
+schema already has). Only reads from the database; exits with status 1 if a query
+does not use its index.
+
+Usage:
+    python scripts/check_query_plans.py [--database URL] [--verbose]
+"""
+
+import argparse
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Tuple
+
+# Add the project root directory to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.core.database import create_sqlite_engine, engine as default_engine
+from src.core.models import Material, Option, ProductFamily, Quote, StandardLength
+from src.core.services.product_service import ProductService
+from src.core.services.quote_service import QuoteService
+
+# (SQL, parameters) of an executed statement
+Statement = Tuple[str, Any]
+
+
+@dataclass(frozen=True)
+class PlanCheck:
+    """
+    A query path and the index its plan must use.
+
+    Attributes:
+        index: Name of the index the plan must use
+        description: What the queries do
+        match: Text identifying the captured statements to check
+        run: Runs the queries against a session
+    """
+
+    index: str
+    description: str
+    match: str
+    run: Callable[[Session], Any]
+
+
+def _first(db: Session, column, default):
+    """Get a sample key from the database, or a default if the table is empty."""
+    value = db.execute(select(column).limit(1)).scalar()
+    return default if value is None else value
+
+
+def _standard_lengths(db: Session) -> None:
+    """Load a material's standard lengths, as its length checks do."""
+    material = db.query(Material).first()
+    if material is not None:
+        material.is_standard_length(24.0)
+    else:
+        db.query(StandardLength).filter(StandardLength.material_code == "S").all()
+
+
+CHECKS = [
+    PlanCheck(
+        index="ix_quote_items_quote_product",
+        description="quote load: line items of a quote",
+        match="JOIN quote_items AS",
+        run=lambda db: QuoteService.get_full_quote_details(
+            db, _first(db, Quote.id, 0)
+        ),
+    ),
+    PlanCheck(
+        index="ix_quote_item_options_quote_item_id",
+        description="quote load: options of each line item",
+        match="JOIN quote_item_options AS",
+        run=lambda db: QuoteService.get_full_quote_details(
+            db, _first(db, Quote.id, 0)
+        ),
+    ),
+    PlanCheck(
+        index="ix_quotes_date_created",
+        description="dashboard: recent quotes and month-over-month totals",
+        match="quotes.date_created",
+        run=QuoteService.get_dashboard_statistics,
+    ),
+    PlanCheck(
+        index="ix_quote_items_quote_product",
+        description="dashboard: line item value of the month's quotes",
+        match="JOIN quotes ON quotes.id = quote_items.quote_id",
+        run=QuoteService.get_dashboard_statistics,
+    ),
+    PlanCheck(
+        index="ix_material_options_family_material_available",
+        description="material options of a product family",
+        match="FROM material_options",
+        run=lambda db: ProductService(db).get_material_options(
+            _first(db, ProductFamily.id, 0)
+        ),
+    ),
+    PlanCheck(
+        index="ix_standard_lengths_material_code",
+        description="standard lengths of a material",
+        match="FROM standard_lengths",
+        run=_standard_lengths,
+    ),
+    PlanCheck(
+        index="ix_options_name_category",
+        description="option lookup by name and category (catalog seeding)",
+        match="FROM options",
+        run=lambda db: db.query(Option)
+        .filter_by(name="Connection", category="Connection")
+        .first(),
+    ),
+]
+
+
+@contextmanager
+def captured_statements(engine: Engine) -> Iterator[List[Statement]]:
+    """Capture the statements executed on an engine while the context is open."""
+    statements: List[Statement] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def query_plan(db: Session, statement: str, parameters: Any) -> List[str]:
+    """Get the EXPLAIN QUERY PLAN steps of a statement."""
+    rows = (
+        db.connection()
+        .exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        .fetchall()
+    )
+    return [row[-1] for row in rows]
+
+
+def run_check(db: Session, check: PlanCheck) -> Tuple[bool, List[List[str]]]:
+    """
+    Run a check's queries and inspect their plans.
+
+    Returns:
+        Tuple[bool, List[List[str]]]: Whether every matching statement uses the
+        index (and at least one matched), and the plans of the matching
+        statements
+    """
+    with captured_statements(db.get_bind()) as statements:
+        check.run(db)
+    plans = [
+        query_plan(db, statement, parameters)
+        for statement, parameters in statements
+        if check.match in " ".join(statement.split())
+    ]
+    passed = bool(plans) and all(
+        any(check.index in step.split() for step in plan) for plan in plans
+    )
+    return passed, plans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--database", metavar="URL", help="database URL (default: the application's)"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="print the plans of every query"
+    )
+    args = parser.parse_args()
+
+    engine = create_sqlite_engine(args.database) if args.database else default_engine
+    failed = 0
+    with Session(bind=engine) as db:
+        for check in CHECKS:
+            passed, plans = run_check(db, check)
+            failed += not passed
+            print(f"{'ok  ' if passed else 'FAIL'} {check.index}: {check.description}")
+            if args.verbose or not passed:
+                if not plans:
+                    print(f"       no query matched {check.match!r}")
+                for plan in plans:
+                    for step in plan:
+                        print(f"       {step}")
+                    print()
+        db.rollback()
+
+    if failed:
+        print(f"{failed} of {len(CHECKS)} query paths do not use their index")
+        sys.exit(1)
+    print(f"All {len(CHECKS)} query paths use their index")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from src.core.database import SessionLocal, init_db
+from src.core.models.length_adder_rule import LengthAdderRule
 from src.core.models.option import Option
 from src.core.models.product_family import ProductFamily
 from src.core.models.standard_length import StandardLength
@@ -736,6 +737,22 @@ def init_business_config():
         ]
         db.add_all(standard_lengths)
 
+        # Add extra length pricing rules (defaults for every product family)
+        length_adder_rules = [
+            LengthAdderRule(material_code='U', base_length=4.0, unit='inch', rate=40.0),
+            LengthAdderRule(material_code='T', base_length=4.0, unit='inch', rate=50.0),
+            LengthAdderRule(
+                material_code='S', product_base_length=10.0, unit='inch', rate=3.75
+            ),
+            LengthAdderRule(
+                material_code='H', unit='foot', rate=110.0, rounding='floor'
+            ),
+            LengthAdderRule(
+                material_code='TS', unit='foot', rate=110.0, rounding='floor'
+            ),
+        ]
+        db.add_all(length_adder_rules)
+
         # Commit all changes
         db.commit()
         print('Business configuration data initialized successfully!')
@@ -3,17 +3,29 @@ Product variant seed data.
 This package contains seed data for all product variants.
 """
 
-from .ls2000_variants import seed_ls2000_variants
-from .ls6000_variants import seed_ls6000_variants
-from .ls7000_2_variants import seed_ls7000_2_variants
-from .ls7000_variants import seed_ls7000_variants
-from .ls8000_2_variants import seed_ls8000_2_variants
+from .seed_fs10000_variants import seed_fs10000_variants
+from .seed_ls2000_variants import seed_ls2000_variants
+from .seed_ls2100_variants import seed_ls2100_variants
+from .seed_ls6000_variants import seed_ls6000_variants
+from .seed_ls7000_2_variants import seed_ls7000_2_variants
+from .seed_ls7000_variants import seed_ls7000_variants
+from .seed_ls7500_variants import seed_ls7500_variants
+from .seed_ls8000_2_variants import seed_ls8000_2_variants
+from .seed_ls8000_variants import seed_ls8000_variants
+from .seed_ls8500_variants import seed_ls8500_variants
+from .seed_lt9000_variants import seed_lt9000_variants
 
 
-def seed_all_product_variants(db):
+def seed_all_product_variants():
     """Seed all product variants in the database."""
-    seed_ls2000_variants(db)
-    seed_ls6000_variants(db)
-    seed_ls7000_variants(db)
-    seed_ls7000_2_variants(db)
-    seed_ls8000_2_variants(db)
+    seed_ls2000_variants()
+    seed_ls2100_variants()
+    seed_ls6000_variants()
+    seed_ls7000_variants()
+    seed_ls7000_2_variants()
+    seed_ls7500_variants()
+    seed_ls8000_variants()
+    seed_ls8000_2_variants()
+    seed_ls8500_variants()
+    seed_lt9000_variants()
+    seed_fs10000_variants()
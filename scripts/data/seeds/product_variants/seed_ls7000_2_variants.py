@@ -8,7 +8,8 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
 from src.core.database import SessionLocal
-from src.core.models.product_variant import ProductFamily, ProductVariant
+from src.core.models.product_family import ProductFamily
+from src.core.models.product_variant import ProductVariant
 
 
 def seed_ls7000_2_variants():
@@ -0,0 +1,59 @@
+"""
+Rebuild the stored totals of quotes and quote items.
+
+Recomputes the subtotal, discount and total of every line item from its unit
+price, quantity, options and discount, and the totals of every quote from its
+line items, in one transaction (see refresh_totals in src/core/models/quote.py).
+Stored totals are kept up to date on every ORM flush; run this after imports or
+manual edits that wrote quote_items or quote_item_options directly.
+
+Usage:
+    python scripts/rebuild_quote_totals.py [--quote ID ...]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import func, select
+
+from src.core.database import SessionLocal
+from src.core.models import Quote
+from src.core.models.quote import refresh_totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--quote",
+        type=int,
+        action="append",
+        dest="quotes",
+        metavar="ID",
+        help="quote ID to rebuild (repeatable; default: all quotes)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        refresh_totals(db.connection(), quote_ids=args.quotes)
+        db.commit()
+        rebuilt = (
+            len(args.quotes)
+            if args.quotes
+            else db.execute(select(func.count(Quote.id))).scalar()
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"Rebuilt the totals of {rebuilt} quotes")
+
+
+if __name__ == "__main__":
+    main()
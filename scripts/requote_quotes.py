@@ -0,0 +1,83 @@
+"""
+Reprice open quotes against a published price list.
+
+Reprices every line item of every draft or sent quote against a price list
+version (see src/core/pricing/price_lists.py), writes the new unit prices back
+in batched transactions and saves a per-item diff report as CSV. Quotes are
+sharded across a process pool; each worker reads the database over its own
+read-only connection.
+
+Usage:
+    python scripts/requote_quotes.py VERSION [--workers N] [--shard-size N]
+        [--batch-size N] [--dry-run] [--report FILE]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import DATA_DIR, SessionLocal
+from src.core.services.requote_service import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_SHARD_SIZE,
+    RequoteService,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("version", help="price list version label, e.g. 2026-04")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="worker processes (default: CPU count; 0 reprices in-process)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help=f"quotes per worker task (default {DEFAULT_SHARD_SIZE})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"line items per write-back transaction (default {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report changes without writing them"
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="diff report CSV (default: data/requote_<version>.csv)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = RequoteService.requote_open_quotes(
+            db,
+            args.version,
+            workers=args.workers,
+            shard_size=args.shard_size,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+
+    report_path = args.report or DATA_DIR / f"requote_{args.version}.csv"
+    report.write_csv(str(report_path))
+    print(report.summary())
+    print(f"Diff report written to {report_path}")
+
+
+if __name__ == "__main__":
+    main()
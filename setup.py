@@ -8,6 +8,7 @@ setup(
         'PySide6>=6.4.0',
         'SQLAlchemy>=2.0.0',
         'alembic>=1.15.0',
+        'numpy>=1.24.0',
     ],
     python_requires='>=3.8',
 )
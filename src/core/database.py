@@ -1,28 +1,213 @@
 """
 Database connection and session management.
+
+The application database is a SQLite file shared by every window and
+background worker of the application. Engines come from create_sqlite_engine,
+which tunes each new connection for that workload:
+
+- WAL journaling, so readers never block on the writer (and vice versa)
+- synchronous=NORMAL, which is durable under WAL and avoids an fsync per commit
+- a memory-mapped I/O window and a larger page cache for catalog and quote reads
+- in-memory temporary tables and indexes
+- a busy timeout, so a writer waits for another writer instead of failing
+  with "database is locked"
+
+WAL keeps its index in shared memory, so every process using the database
+must run on the same host. It is not safe on a network share (SMB/NFS): when
+several users open one database file over the network, set
+QUOTES_SQLITE_JOURNAL_MODE=DELETE (rollback journaling relies on the share's
+file locking instead, which must work correctly for SQLite to be safe there)
+and QUOTES_SQLITE_SYNCHRONOUS=FULL, since NORMAL is only durable under WAL.
+
+Every SQLiteSettings field can be overridden from the environment as
+QUOTES_SQLITE_<FIELD>, e.g. QUOTES_SQLITE_JOURNAL_MODE=DELETE or
+QUOTES_SQLITE_MMAP_SIZE=0, like the database URL (QUOTES_DATABASE_URL).
+
+Connections are pooled (QueuePool); in-memory databases share one connection
+(StaticPool), since each new connection would see an empty database.
+
+Sessions:
+    SessionLocal() creates an independent session whose lifetime the caller
+    owns (long-lived dialogs, background workers). Short units of work use
+    ``with session_scope() as db:``, which hands out the calling thread's
+    scoped session and closes it when the outermost scope on that thread ends.
 """
 
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import Iterator, List, Mapping, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
-# Ensure data directory exists
-DATA_DIR = Path("data")
+# Ensure data directory exists (next to src/, whatever the working directory)
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 if not DATA_DIR.exists():
     DATA_DIR.mkdir(parents=True)
 
+# The database URL can be overridden, e.g. to point at a shared drive
+DATABASE_URL = os.environ.get("QUOTES_DATABASE_URL", f"sqlite:///{DATA_DIR}/quotes.db")
+
+
+@dataclass(frozen=True)
+class SQLiteSettings:
+    """
+    Connection settings applied to every new SQLite connection.
+
+    Attributes:
+        journal_mode: Journal mode (None leaves the database's mode alone,
+            e.g. for read-only connections)
+        synchronous: Sync mode ("NORMAL" is safe with WAL)
+        mmap_size: Bytes of the database file to memory-map (0 disables)
+        cache_size: Page cache size; negative values are KiB (SQLite's
+            convention), positive values pages
+        temp_store: Where temporary tables and indexes live
+        busy_timeout: Seconds to wait for a lock before raising
+        pool_size: Connections kept open in the pool
+        max_overflow: Extra connections allowed under load, closed when returned
+        pool_timeout: Seconds to wait for a pooled connection
+    """
+
+    # WAL needs every connection on one host; use DELETE on a network share
+    journal_mode: Optional[str] = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout: float = 30.0
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+
+    def pragmas(self) -> List[str]:
+        """Get the PRAGMA statements for a new connection, in order."""
+        statements = []
+        if self.journal_mode:
+            statements.append(f"PRAGMA journal_mode={self.journal_mode}")
+        statements += [
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            f"PRAGMA cache_size={int(self.cache_size)}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}",
+        ]
+        return statements
+
+    @classmethod
+    def from_environment(
+        cls, environ: Mapping[str, str] = os.environ, prefix: str = "QUOTES_SQLITE_"
+    ) -> "SQLiteSettings":
+        """
+        Get settings with overrides from environment variables.
+
+        Each field is read from ``<prefix><FIELD>`` (e.g. QUOTES_SQLITE_JOURNAL_MODE)
+        and converted to the field's type; an empty journal mode leaves the
+        database's mode alone. Unset variables keep the defaults.
+
+        Raises:
+            ValueError: If a numeric variable is not a number
+        """
+        overrides = {}
+        for setting in fields(cls):
+            variable = f"{prefix}{setting.name.upper()}"
+            value = environ.get(variable)
+            if value is None:
+                continue
+            value = value.strip()
+            if setting.name == "journal_mode":
+                overrides[setting.name] = value.upper() or None
+            elif isinstance(setting.default, str):
+                overrides[setting.name] = value.upper()
+            else:
+                try:
+                    overrides[setting.name] = type(setting.default)(value)
+                except ValueError:
+                    raise ValueError(
+                        f"{variable} must be a number, got {value!r}"
+                    ) from None
+        return cls(**overrides)
+
+
+# Defaults, with any QUOTES_SQLITE_* overrides from the environment
+DEFAULT_SQLITE_SETTINGS = SQLiteSettings.from_environment()
+
+
+def create_sqlite_engine(
+    url: str = DATABASE_URL,
+    settings: SQLiteSettings = DEFAULT_SQLITE_SETTINGS,
+    **kwargs,
+) -> Engine:
+    """
+    Create an engine for a SQLite database with tuned connections.
+
+    Args:
+        url: SQLite database URL
+        settings: Pragmas and pool policy
+        **kwargs: Extra create_engine arguments (override the pool policy)
+
+    Returns:
+        Engine: Engine whose connections all have the settings applied
+    """
+    database = make_url(url).database
+    connect_args = {"check_same_thread": False, "timeout": settings.busy_timeout}
+    connect_args.update(kwargs.pop("connect_args", {}))
+    if not database or database == ":memory:" or "mode=memory" in url:
+        pool_args = {"poolclass": StaticPool}
+    else:
+        pool_args = {
+            "poolclass": QueuePool,
+            "pool_size": settings.pool_size,
+            "max_overflow": settings.max_overflow,
+            "pool_timeout": settings.pool_timeout,
+        }
+    pool_args.update(kwargs)
+    engine = create_engine(url, connect_args=connect_args, **pool_args)
+
+    pragmas = settings.pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
 # Create database engine
-DATABASE_URL = f"sqlite:///{DATA_DIR}/quotes.db"
-engine = create_engine(DATABASE_URL)
+engine = create_sqlite_engine(DATABASE_URL)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# One session per thread for short units of work (see session_scope)
+ScopedSession = scoped_session(SessionLocal)
+_scope_depth = threading.local()
+
 # Create base class for models
 Base = declarative_base()
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db", "init_db"]
+__all__ = [
+    "Base",
+    "DATA_DIR",
+    "DEFAULT_SQLITE_SETTINGS",
+    "SQLiteSettings",
+    "ScopedSession",
+    "SessionLocal",
+    "create_sqlite_engine",
+    "engine",
+    "get_db",
+    "init_db",
+    "session_scope",
+]
 
 
 def get_db():
@@ -34,6 +219,34 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Get the calling thread's session for a unit of work.
+
+    Scopes nest: inner scopes on the same thread share the outer scope's
+    session, and the session is closed (returning its connection to the pool)
+    when the outermost scope exits. Uncommitted changes are rolled back if
+    the scope raises.
+
+    Example:
+        >>> with session_scope() as db:
+        ...     stats = QuoteService.get_dashboard_statistics(db)
+    """
+    depth = getattr(_scope_depth, "value", 0)
+    _scope_depth.value = depth + 1
+    db = ScopedSession()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        _scope_depth.value = depth
+        if depth == 0:
+            ScopedSession.remove()
+
+
 def init_db():
     """Initialize database, creating tables if they don't exist"""
     Base.metadata.create_all(bind=engine)
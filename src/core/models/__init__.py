@@ -3,15 +3,18 @@ Database models for the application.
 """
 
 from src.core.models.base_model import BaseModel
+from src.core.models.break_table import BreakTable
 from src.core.models.connection import Connection
 from src.core.models.connection_option import ConnectionOption
 from src.core.models.customer import Customer
 from src.core.models.material import Material, MaterialAvailability, StandardLength
+from src.core.models.length_adder_rule import LengthAdderRule
 from src.core.models.material_option import MaterialOption
-from src.core.models.option import Option, QuoteItemOption
+from src.core.models.option import Option, OptionProductFamily, QuoteItemOption
 from src.core.models.product import Product
 from src.core.models.product_family import ProductFamily
 from src.core.models.product_variant import ProductVariant
+from src.core.models.standard_length import StandardLengthIndex
 from src.core.models.quote import Quote, QuoteItem
 from src.core.models.spare_part import SparePart
 from src.core.models.voltage_option import VoltageOption
@@ -24,16 +27,22 @@ from src.core.models.o_ring import O_Ring
 from src.core.models.exotic_metal import ExoticMetal
 from src.core.models.identification import Identification
 from src.core.models.price_component import PriceComponent
+from src.core.models.price_list_version import PriceListVersion
+from src.core.models.precomputed_price import PrecomputedPrice
+from src.core.models.catalog_revision import CatalogRevision
 
 __all__ = [
     "BaseModel",
+    "BreakTable",
     "Connection",
     "ConnectionOption",
     "Customer",
+    "LengthAdderRule",
     "Material",
     "MaterialAvailability",
     "MaterialOption",
     "Option",
+    "OptionProductFamily",
     "Product",
     "ProductFamily",
     "ProductVariant",
@@ -42,6 +51,7 @@ __all__ = [
     "QuoteItemOption",
     "SparePart",
     "StandardLength",
+    "StandardLengthIndex",
     "VoltageOption",
     "Cable",
     "Enclosure",
@@ -52,4 +62,7 @@ __all__ = [
     "ExoticMetal",
     "Identification",
     "PriceComponent",
+    "PriceListVersion",
+    "PrecomputedPrice",
+    "CatalogRevision",
 ]
@@ -0,0 +1,142 @@
+"""
+Pre-sorted price break tables.
+
+Price components and spare parts store their quantity, length, volume and
+weight price breaks as JSON objects mapping a threshold (as a string) to a
+unit price. BreakTable turns such an object into parallel sorted arrays of
+thresholds and unit prices once, so a lookup is a binary search instead of
+re-parsing and re-sorting the keys on every call. It also prices a whole
+vector of values at once for large orders.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class BreakTable:
+    """
+    Sorted threshold/unit price table for one set of price breaks.
+
+    A value gets the unit price of the highest threshold it meets; values
+    below every threshold get the caller's default unit price.
+
+    Attributes:
+        thresholds (Tuple[float, ...]): Break thresholds, ascending
+        unit_prices (Tuple[float, ...]): Unit price for each threshold
+
+    Example:
+        >>> table = BreakTable.from_breaks({"10": 4.5, "50": 3.5})
+        >>> table.unit_price(20, default=5.0)
+        4.5
+    """
+
+    __slots__ = ("thresholds", "unit_prices", "_threshold_array", "_price_array")
+
+    def __init__(self, thresholds: Tuple[float, ...], unit_prices: Tuple[float, ...]):
+        self.thresholds = thresholds
+        self.unit_prices = unit_prices
+        self._threshold_array = np.asarray(thresholds, dtype=np.float64)
+        # Slot 0 holds the default unit price, filled in per lookup
+        self._price_array = np.concatenate(([np.nan], unit_prices)).astype(np.float64)
+
+    @classmethod
+    def from_breaks(cls, breaks: Optional[Dict[Any, float]]) -> "BreakTable":
+        """
+        Build a table from a JSON break mapping.
+
+        Args:
+            breaks: Mapping of threshold (string or number) to unit price
+
+        Returns:
+            BreakTable: Table sorted by threshold; empty if breaks is empty
+        """
+        table = {
+            float(threshold): float(price)
+            for threshold, price in (breaks or {}).items()
+        }
+        thresholds = tuple(sorted(table))
+        return cls(thresholds, tuple(table[t] for t in thresholds))
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+    def unit_price(self, value: float, default: float) -> float:
+        """
+        Get the unit price for a value.
+
+        Args:
+            value: Quantity, length, volume or weight
+            default: Unit price below the lowest threshold
+
+        Returns:
+            float: Applicable unit price
+        """
+        index = bisect_right(self.thresholds, value)
+        return self.unit_prices[index - 1] if index else default
+
+    def price(self, value: float, default: float) -> float:
+        """Get the extended price (unit price times value) for a value."""
+        return self.unit_price(value, default) * value
+
+    def unit_prices_many(self, values, default: float) -> np.ndarray:
+        """
+        Get the unit price for each of a vector of values.
+
+        Args:
+            values: Array-like of quantities, lengths, volumes or weights
+            default: Unit price below the lowest threshold
+
+        Returns:
+            np.ndarray: Unit price per value
+        """
+        values = np.asarray(values, dtype=np.float64)
+        indexes = np.searchsorted(self._threshold_array, values, side="right")
+        prices = self._price_array.copy()
+        prices[0] = default
+        return prices[indexes]
+
+    def prices_many(self, values, default: float) -> np.ndarray:
+        """Get the extended price for each of a vector of values."""
+        values = np.asarray(values, dtype=np.float64)
+        return self.unit_prices_many(values, default) * values
+
+    def __repr__(self) -> str:
+        breaks = ", ".join(
+            f"{t:g}: {p:g}" for t, p in zip(self.thresholds, self.unit_prices)
+        )
+        return f"<BreakTable({{{breaks}}})>"
+
+
+EMPTY_BREAK_TABLE = BreakTable((), ())
+
+
+def cached_break_table(target, attribute: str) -> BreakTable:
+    """
+    Get the break table for a JSON breaks attribute, building it on first use.
+
+    Tables are cached in the instance ``__dict__``; models drop the cache with
+    :func:`invalidate_break_tables` when a breaks attribute is reassigned or
+    the instance is expired. In-place edits of the JSON dict are not tracked,
+    so reassign the attribute to change breaks.
+
+    Args:
+        target: Model instance
+        attribute: Name of the JSON breaks column
+
+    Returns:
+        BreakTable: Cached table for the attribute
+    """
+    tables = target.__dict__.setdefault("_break_tables", {})
+    table = tables.get(attribute)
+    if table is None:
+        breaks = getattr(target, attribute)
+        table = BreakTable.from_breaks(breaks) if breaks else EMPTY_BREAK_TABLE
+        tables[attribute] = table
+    return table
+
+
+def invalidate_break_tables(target, *args) -> None:
+    """Drop an instance's cached break tables (event listener)."""
+    target.__dict__.pop("_break_tables", None)
@@ -0,0 +1,101 @@
+"""
+CatalogRevision model counting changes to the pricing catalog.
+
+This module defines the CatalogRevision model for Babbitt International's quoting
+system. The table holds a single counter that SQLite triggers on every catalog
+table (CATALOG_MODELS) increment on each insert, update or delete, so it also
+counts bulk imports and changes made by other processes that bypass the ORM.
+
+Reading the counter is a one-row lookup, which makes it a cheap fingerprint of
+the catalog: a price book snapshot stored with the revision it was loaded at
+(see src/core/pricing/price_memo.py) is current exactly as long as the revision
+has not changed.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import Column, Integer, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.core.database import Base
+from src.core.models.precomputed_price import CATALOG_MODELS
+
+
+class CatalogRevision(Base):
+    """
+    SQLAlchemy model representing the change counter of the pricing catalog.
+
+    The table has exactly one row (id 1). Its revision is maintained by
+    triggers, never by the application.
+
+    Attributes:
+        id (int): Always 1
+        revision (int): Number of catalog rows inserted, updated or deleted
+    """
+
+    __tablename__ = 'catalog_revision'
+
+    id = Column(Integer, primary_key=True)
+    revision = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """
+        Return a string representation of the CatalogRevision.
+        Returns:
+            str: A string showing the revision
+        """
+        return f"<CatalogRevision(revision={self.revision})>"
+
+
+def catalog_revision_triggers(table: str) -> List[str]:
+    """
+    Build the statements creating the revision triggers of a catalog table.
+
+    Args:
+        table: Name of the catalog table
+
+    Returns:
+        List[str]: One CREATE TRIGGER statement per insert, update and delete
+    """
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS catalog_revision_{table}_{operation.lower()} "
+        f"AFTER {operation} ON {table} BEGIN "
+        f"UPDATE catalog_revision SET revision = revision + 1 WHERE id = 1; END"
+        for operation in ('INSERT', 'UPDATE', 'DELETE')
+    ]
+
+
+def catalog_revision(db: Session) -> Optional[int]:
+    """
+    Get the current revision of the pricing catalog.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        Optional[int]: Revision of the catalog, or None if the database has no
+        catalog_revision table (not migrated yet)
+    """
+    try:
+        return db.execute(
+            text('SELECT revision FROM catalog_revision WHERE id = 1')
+        ).scalar()
+    except OperationalError:
+        return None
+
+
+@event.listens_for(CatalogRevision.__table__, 'after_create')
+def _insert_revision_row(table, connection, **kw):
+    """Insert the single revision row when the table is created."""
+    connection.execute(table.insert().values(id=1, revision=0))
+
+
+def _create_revision_triggers(table, connection, **kw):
+    """Create the revision triggers when a catalog table is created."""
+    for statement in catalog_revision_triggers(table.name):
+        connection.exec_driver_sql(statement)
+
+
+for _model in CATALOG_MODELS:
+    event.listen(_model.__table__, 'after_create', _create_revision_triggers)
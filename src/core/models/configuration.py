@@ -4,7 +4,7 @@ from typing import Any, Dict
 
 from sqlalchemy.orm import Session
 
-from src.core.models.option import Option
+from src.core.models.option import Option, OptionProductFamily
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,7 @@ class Configuration:
 
     # Calculated values
     final_price: float = 0.0
+    price_ledger: Dict[str, int] = field(default_factory=dict)  # Cents per component
     final_description: str = ''
     model_number: str = ''
     quantity: int = 1  # Default quantity is 1
@@ -45,9 +46,10 @@ class Configuration:
         # Filter options by name and product family
         option_details = (
             self.db.query(Option)
+            .join(OptionProductFamily)
             .filter(
                 Option.name == option_name,
-                Option.product_families == self.product_family_name,
+                OptionProductFamily.product_family == self.product_family_name,
             )
             .first()
         )
@@ -0,0 +1,70 @@
+"""
+LengthAdderRule model for storing extra length pricing rules.
+
+This module defines the LengthAdderRule model for Babbitt International's quoting
+system. Each rule says how a product family prices probe length beyond the base
+length for one material: the base length the adder starts from, whether it is
+charged per inch or per foot, the rate, and how partial units are rounded.
+
+Rules are compiled into per-family adder functions when the pricing catalog is
+loaded (see src/core/pricing/length_rules.py), so changing a rate is a data
+change, not a code release.
+"""
+
+from sqlalchemy import Column, Float, ForeignKey, Integer, String, Text
+
+from src.core.database import Base
+
+LENGTH_UNITS = ('inch', 'foot')
+ROUNDING_MODES = ('exact', 'floor', 'ceil')
+
+
+class LengthAdderRule(Base):
+    """
+    SQLAlchemy model representing an extra length pricing rule.
+
+    A rule with no product family is the default for every family; a rule for
+    a family takes precedence over the defaults for the same material. When
+    several rules match, rules restricted to a product base length are tried
+    before unrestricted ones.
+
+    Attributes:
+        id (int): Primary key
+        product_family (str): Product family name, or None for every family
+        material_code (str): Material the rule prices
+        base_length (float): Length in inches the adder starts from, or None to
+            start from the product's base length
+        product_base_length (float): Only apply to products with this base
+            length (None applies to every product)
+        unit (str): "inch" or "foot"
+        rate (float): Adder per unit of extra length
+        rounding (str): How partial units are charged: "exact" (prorated),
+            "floor" (whole units only) or "ceil" (partial units charged in full)
+        notes (str): Description of the rule
+
+    Example:
+        >>> rule = LengthAdderRule(material_code="H", unit="foot", rate=110.0,
+        ...                        rounding="floor")
+        >>> print(rule)
+    """
+
+    __tablename__ = 'length_adder_rules'
+
+    id = Column(Integer, primary_key=True)
+    product_family = Column(String, nullable=True, index=True)
+    material_code = Column(String(10), ForeignKey('materials.code'), nullable=False)
+    base_length = Column(Float, nullable=True)
+    product_base_length = Column(Float, nullable=True)
+    unit = Column(String, nullable=False, default='inch')
+    rate = Column(Float, nullable=False)
+    rounding = Column(String, nullable=False, default='exact')
+    notes = Column(Text)
+
+    def __repr__(self):
+        """
+        Return a string representation of the LengthAdderRule.
+        Returns:
+            str: A string showing the family, material, rate and unit
+        """
+        family = self.product_family or '*'
+        return f"<LengthAdderRule(family='{family}', material='{self.material_code}', rate={self.rate}/{self.unit})>"
@@ -10,7 +10,7 @@ from sqlalchemy.orm import relationship, validates
 from sqlalchemy.exc import IntegrityError
 
 from src.core.database import Base
-from src.core.models.standard_length import StandardLength
+from src.core.models.standard_length import StandardLength, StandardLengthIndex
 
 
 class Material(Base):
@@ -118,9 +118,16 @@ class Material(Base):
 
     def is_standard_length(self, length: float) -> bool:
         """Check if a given length is standard for this material."""
-        if not self.standard_lengths:
-            return False
-        return any(abs(sl.length - length) < 0.001 for sl in self.standard_lengths)
+        return self.standard_length_index.is_standard(self.code, length)
+
+    @property
+    def standard_length_index(self) -> StandardLengthIndex:
+        """Sorted index of this material's standard lengths, built on first use."""
+        index = self.__dict__.get("_standard_length_index")
+        if index is None:
+            index = StandardLengthIndex.from_rows(self.standard_lengths)
+            self.__dict__["_standard_length_index"] = index
+        return index
 
     def is_available_for_product(self, product_type: str) -> bool:
         """Check if this material is available for a given product type."""
@@ -134,6 +141,16 @@ class Material(Base):
         return f"<Material(code='{self.code}', name='{self.name}')>"
 
 
+@event.listens_for(Material.standard_lengths, "append")
+@event.listens_for(Material.standard_lengths, "remove")
+@event.listens_for(Material.standard_lengths, "bulk_replace")
+@event.listens_for(Material, "expire")
+@event.listens_for(Material, "refresh")
+def _invalidate_standard_length_index(target, *args):
+    """Drop a material's cached standard length index when its lengths change."""
+    target.__dict__.pop("_standard_length_index", None)
+
+
 class MaterialAvailability(Base):
     """Model for tracking material availability by product type."""
 
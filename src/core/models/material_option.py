@@ -10,7 +10,7 @@ Supports:
 - Material-specific pricing adders
 """
 
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String
 
 from src.core.database import Base
 
@@ -36,6 +36,14 @@ class MaterialOption(Base):
     """
 
     __tablename__ = 'material_options'
+    __table_args__ = (
+        Index(
+            'ix_material_options_family_material_available',
+            'product_family_id',
+            'material_code',
+            'is_available',
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     product_family_id = Column(
@@ -4,6 +4,7 @@ Option model for storing product add-ons and their pricing.
 This module defines models for product options (add-ons) and their association
 with quote line items. It includes:
 - Option: Represents a configurable add-on or feature for a product
+- OptionProductFamily: Indexed association of options to compatible product families
 - QuoteItemOption: Junction table for tracking which options are added to which quote items
 
 These models support:
@@ -14,17 +15,43 @@ These models support:
 - Structured choices, adders, and rules for dynamic configuration
 """
 
+import json
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from sqlalchemy import Column, Float, ForeignKey, Integer, String, Text, DateTime
-from sqlalchemy import Boolean
+from sqlalchemy import Boolean, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import JSON
 from pydantic import BaseModel as PydanticBaseModel, Field, validator
 
+from src.core.database import Base
 from src.core.models.base_model import BaseModel
 
 
+def parse_product_families(value: Any) -> Tuple[str, ...]:
+    """
+    Normalize an Option.product_families value to a tuple of family names.
+
+    The column has held JSON lists, JSON-encoded strings, single family names
+    and comma-separated names; all are accepted.
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            try:
+                return parse_product_families(json.loads(text))
+            except ValueError:
+                pass
+        families = text.split(",")
+    else:
+        families = value
+    return tuple(
+        dict.fromkeys(str(f).strip() for f in families if f and str(f).strip())
+    )
+
+
 class Option(BaseModel):
     """
     SQLAlchemy model representing a configurable product option (add-on).
@@ -54,9 +81,10 @@ class Option(BaseModel):
     """
 
     __tablename__ = "options"
+    __table_args__ = (Index("ix_options_name_category", "name", "category"),)
 
     # Core fields
-    name = Column(String(100), nullable=False, index=True)
+    name = Column(String(100), nullable=False)  # indexed by ix_options_name_category
     description = Column(Text)
     category = Column(String(50), index=True)
     sort_order = Column(Integer, default=0)
@@ -82,6 +110,9 @@ class Option(BaseModel):
     quote_items = relationship(
         "QuoteItemOption", back_populates="option", cascade="all, delete-orphan"
     )
+    family_links = relationship(
+        "OptionProductFamily", back_populates="option", cascade="all, delete-orphan"
+    )
 
     @validator("price_type")
     def validate_price_type(cls, v):
@@ -125,6 +156,60 @@ class Option(BaseModel):
         return f"<Option(id={self.id}, name='{self.name}', price={self.price}, choices={self.choices})>"
 
 
+class OptionProductFamily(Base):
+    """
+    SQLAlchemy model linking an option to a compatible product family.
+
+    Normalized, indexed form of Option.product_families, kept in sync whenever
+    that column is set. Looking up the options for a family is an indexed point
+    query instead of a LIKE scan over the JSON column, and family names match
+    exactly (LS7000 does not match LS7000/2).
+
+    Attributes:
+        id (int): Primary key
+        option_id (int): Foreign key to the option
+        product_family (str): Product family name (e.g., "LS2000", "LS7000/2")
+        option (Option): Related option object
+    """
+
+    __tablename__ = "option_product_families"
+    __table_args__ = (
+        Index(
+            "ix_option_product_families_family_option",
+            "product_family",
+            "option_id",
+            unique=True,
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    option_id = Column(
+        Integer, ForeignKey("options.id", ondelete="CASCADE"), nullable=False
+    )
+    product_family = Column(String(100), nullable=False)
+
+    option = relationship("Option", back_populates="family_links")
+
+    def __repr__(self):
+        """Return a string representation of the OptionProductFamily."""
+        return f"<OptionProductFamily(option_id={self.option_id}, product_family='{self.product_family}')>"
+
+
+@event.listens_for(Option.product_families, "set")
+def _sync_family_links(target, value, oldvalue, initiator):
+    """Update an option's family links when its product_families change."""
+    families = parse_product_families(value)
+    # Keep the links of families still listed: replacing them would insert the
+    # new rows before the old ones are deleted and violate the unique index
+    links = {link.product_family: link for link in target.family_links}
+    for family, link in links.items():
+        if family not in families:
+            target.family_links.remove(link)
+    for family in families:
+        if family not in links:
+            target.family_links.append(OptionProductFamily(product_family=family))
+
+
 class QuoteItemOption(BaseModel):
     """
     SQLAlchemy model representing an option added to a quote line item.
@@ -147,7 +232,9 @@ class QuoteItemOption(BaseModel):
 
     __tablename__ = "quote_item_options"
 
-    quote_item_id = Column(Integer, ForeignKey("quote_items.id"), nullable=False)
+    quote_item_id = Column(
+        Integer, ForeignKey("quote_items.id"), nullable=False, index=True
+    )
     option_id = Column(Integer, ForeignKey("options.id"), nullable=False)
     quantity = Column(Integer, default=1)
     price = Column(Float, nullable=False)
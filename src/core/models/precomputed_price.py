@@ -0,0 +1,97 @@
+"""
+PrecomputedPrice model for storing precomputed configuration prices.
+
+This module defines the PrecomputedPrice model for Babbitt International's quoting
+system. Each row is the price of one standard configuration of a product family
+(voltage, material, standard length and connection), computed once by
+src/core/pricing/price_table.py so common configurations are priced with a
+single keyed lookup instead of loading the pricing catalog.
+
+The table is emptied whenever a catalog row is added, changed or deleted
+through the ORM, so it never serves prices from an older catalog; rebuild it
+with scripts/build_price_table.py (also after bulk imports that bypass the ORM).
+"""
+
+from sqlalchemy import Column, Float, ForeignKey, Integer, String, event
+from sqlalchemy.orm import Session
+
+from src.core.database import Base
+from src.core.models.length_adder_rule import LengthAdderRule
+from src.core.models.material import Material
+from src.core.models.material_option import MaterialOption
+from src.core.models.option import Option, OptionProductFamily
+from src.core.models.product import Product
+from src.core.models.standard_length import StandardLength
+
+# Models the precomputed prices are derived from (the PriceBook tables)
+CATALOG_MODELS = (
+    Product,
+    Material,
+    MaterialOption,
+    StandardLength,
+    Option,
+    OptionProductFamily,
+    LengthAdderRule,
+)
+
+
+class PrecomputedPrice(Base):
+    """
+    SQLAlchemy model representing the precomputed price of a configuration.
+
+    The key columns form the primary key of a WITHOUT ROWID table, so the
+    table is stored as one b-tree ordered by the key and a lookup reads the
+    price from the index entry itself.
+
+    Attributes:
+        product_family_id (int): ID of the product family
+        voltage (str): Voltage
+        material_code (str): Material code
+        length (float): Length in inches
+        connection (str): Connection option adder key (e.g. 'Flange_150#_2"'),
+            or '' for no connection
+        product_id (int): Product the configuration is priced from
+        price_cents (int): Price of the configuration in cents
+
+    Example:
+        >>> price = PrecomputedPrice(product_family_id=1, voltage="115VAC",
+        ...                          material_code="S", length=24.0, connection="",
+        ...                          product_id=3, price_cents=49750)
+        >>> print(price)
+    """
+
+    __tablename__ = 'precomputed_prices'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    product_family_id = Column(
+        Integer, ForeignKey('product_families.id'), primary_key=True
+    )
+    voltage = Column(String, primary_key=True)
+    material_code = Column(String(10), primary_key=True)
+    length = Column(Float, primary_key=True)
+    connection = Column(String, primary_key=True, default='')
+    product_id = Column(Integer, nullable=False)
+    price_cents = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        """
+        Return a string representation of the PrecomputedPrice.
+        Returns:
+            str: A string showing the configuration and its price in cents
+        """
+        return (
+            f"<PrecomputedPrice(family={self.product_family_id}, voltage='{self.voltage}', "
+            f"material='{self.material_code}', length={self.length}, "
+            f"connection='{self.connection}', price_cents={self.price_cents})>"
+        )
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_on_catalog_change(session, flush_context):
+    """Empty the precomputed prices when a flush changes the pricing catalog."""
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, CATALOG_MODELS):
+            if instance in session.dirty and not session.is_modified(instance):
+                continue
+            session.connection().execute(PrecomputedPrice.__table__.delete())
+            return
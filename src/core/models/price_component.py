@@ -9,10 +9,15 @@ from sqlalchemy import (
     Text,
     Enum,
 )
+from sqlalchemy import event
 from sqlalchemy.orm import relationship
 from .base_model import BaseModel
+from .break_table import BreakTable, cached_break_table, invalidate_break_tables
+from src.utils.conditions import compile_condition
 import enum
 
+import numpy as np
+
 
 class PriceType(enum.Enum):
     """Enum for different types of price components."""
@@ -80,6 +85,7 @@ class PriceComponent(BaseModel):
         self._validate_name()
         self._validate_price()
         self._validate_breaks()
+        self._validate_conditions()
 
     def _validate_code(self):
         """Validate price component code format."""
@@ -126,6 +132,22 @@ class PriceComponent(BaseModel):
                     if value < 0:
                         raise ValueError(f"Break value cannot be negative: {value}")
 
+    def _validate_conditions(self):
+        """Validate that every condition compiles."""
+        for condition in self.conditions or {}:
+            compile_condition(condition)
+
+    _BREAK_ATTRIBUTES = {
+        PriceType.QUANTITY_BASED: "quantity_breaks",
+        PriceType.LENGTH_BASED: "length_breaks",
+        PriceType.VOLUME_BASED: "volume_breaks",
+        PriceType.WEIGHT_BASED: "weight_breaks",
+    }
+
+    def break_table(self, break_type: str) -> BreakTable:
+        """Get the cached sorted break table for "quantity", "length", etc."""
+        return cached_break_table(self, f"{break_type}_breaks")
+
     def calculate_price(
         self,
         quantity: float = 1.0,
@@ -147,36 +169,45 @@ class PriceComponent(BaseModel):
             return self.base_value / 100.0
 
         elif self.price_type == PriceType.QUANTITY_BASED:
-            return self._calculate_break_price(quantity, self.quantity_breaks)
+            return self._calculate_break_price(quantity, self.break_table("quantity"))
 
         elif self.price_type == PriceType.LENGTH_BASED and length is not None:
-            return self._calculate_break_price(length, self.length_breaks)
+            return self._calculate_break_price(length, self.break_table("length"))
 
         elif self.price_type == PriceType.VOLUME_BASED and volume is not None:
-            return self._calculate_break_price(volume, self.volume_breaks)
+            return self._calculate_break_price(volume, self.break_table("volume"))
 
         elif self.price_type == PriceType.WEIGHT_BASED and weight is not None:
-            return self._calculate_break_price(weight, self.weight_breaks)
+            return self._calculate_break_price(weight, self.break_table("weight"))
 
         elif self.price_type == PriceType.CONDITIONAL:
             return self._calculate_conditional_price(quantity, length, volume, weight)
 
         return 0.0
 
-    def _calculate_break_price(self, value: float, breaks: dict) -> float:
+    def _calculate_break_price(self, value: float, table: BreakTable) -> float:
         """Calculate price based on break points."""
-        if not breaks:
-            return self.base_value * value
+        return table.price(value, self.base_value)
 
-        # Sort break points in descending order
-        sorted_breaks = sorted([float(k) for k in breaks.keys()], reverse=True)
+    def calculate_break_prices(self, values) -> np.ndarray:
+        """
+        Calculate break prices for a vector of values in one pass.
 
-        # Find applicable break point
-        for break_point in sorted_breaks:
-            if value >= break_point:
-                return breaks[str(break_point)] * value
+        The values are quantities, lengths, volumes or weights according to
+        the component's price type.
 
-        return self.base_value * value
+        Args:
+            values: Array-like of values to price
+
+        Returns:
+            np.ndarray: Extended price per value
+        """
+        attribute = self._BREAK_ATTRIBUTES.get(self.price_type)
+        if attribute is None:
+            raise ValueError(f"{self.price_type} does not use price breaks")
+        if not self.is_active:
+            return np.zeros(np.shape(values))
+        return cached_break_table(self, attribute).prices_many(values, self.base_value)
 
     def _calculate_conditional_price(
         self, quantity: float, length: float, volume: float, weight: float
@@ -192,6 +223,34 @@ class PriceComponent(BaseModel):
 
         return self.base_value
 
+    def calculate_conditional_prices(
+        self, quantity=1.0, length=None, volume=None, weight=None
+    ) -> np.ndarray:
+        """
+        Calculate the conditional price for a vector of inputs.
+
+        Inputs may be arrays or scalars and are broadcast together; None or NaN
+        means the input is not given. Each row gets the price of the first
+        condition it satisfies, or the base value.
+        """
+        shape = np.broadcast_shapes(
+            *(np.shape(v) for v in (quantity, length, volume, weight) if v is not None)
+        )
+        prices = np.full(shape, self.base_value, dtype=np.float64)
+        unmatched = np.ones(shape, dtype=bool)
+        for condition, price in (self.conditions or {}).items():
+            try:
+                compiled = compile_condition(condition)
+            except ValueError:
+                continue
+            matched = compiled.evaluate_many(quantity, length, volume, weight)
+            matched &= unmatched
+            prices[matched] = price
+            unmatched &= ~matched
+            if not unmatched.any():
+                break
+        return prices
+
     def _evaluate_condition(
         self,
         condition: str,
@@ -200,22 +259,12 @@ class PriceComponent(BaseModel):
         volume: float,
         weight: float,
     ) -> bool:
-        """Evaluate a condition string."""
-        # This is a simplified implementation
-        # In a real system, you would use a proper condition parser
+        """Evaluate a condition string; invalid conditions are False."""
         try:
-            # Replace variables with actual values
-            condition = condition.replace("quantity", str(quantity))
-            if length is not None:
-                condition = condition.replace("length", str(length))
-            if volume is not None:
-                condition = condition.replace("volume", str(volume))
-            if weight is not None:
-                condition = condition.replace("weight", str(weight))
-
-            return eval(condition)
-        except:
+            compiled = compile_condition(condition)
+        except ValueError:
             return False
+        return compiled(quantity, length, volume, weight)
 
     def is_compatible_with_material(self, material_code: str) -> bool:
         """Check if price component is compatible with a material."""
@@ -243,6 +292,17 @@ class PriceComponent(BaseModel):
         return self.conditions
 
 
+@event.listens_for(PriceComponent.quantity_breaks, "set")
+@event.listens_for(PriceComponent.length_breaks, "set")
+@event.listens_for(PriceComponent.volume_breaks, "set")
+@event.listens_for(PriceComponent.weight_breaks, "set")
+@event.listens_for(PriceComponent, "expire")
+@event.listens_for(PriceComponent, "refresh")
+def _invalidate_break_tables(target, *args):
+    """Drop a component's cached break tables when its breaks change."""
+    invalidate_break_tables(target)
+
+
 def init_price_components(db):
     """Initialize price components in the database."""
     components = [
@@ -0,0 +1,80 @@
+"""
+PriceListVersion model for storing effective-dated price list snapshots.
+
+This module defines the PriceListVersion model for Babbitt International's quoting
+system. Each version is an immutable snapshot of the pricing catalog (products,
+materials, material premiums, standard lengths and options) that takes effect on
+a given date.
+
+Supports:
+- Repricing historical quotes against the price list in effect at the time
+- Comparing price lists side by side
+"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    String,
+    Text,
+    event,
+    inspect,
+)
+
+from src.core.database import Base
+
+
+class PriceListVersion(Base):
+    """
+    SQLAlchemy model representing an immutable, effective-dated price list.
+
+    The snapshot holds the catalog rows a PriceBook is built from, keyed by
+    table name (see PriceBook.query_rows). Versions are never edited: publish
+    a new version with a later effective date instead.
+
+    Attributes:
+        id (int): Primary key
+        version (str): Unique version label (e.g., "2026-04")
+        effective_date (date): First day the price list is in effect
+        created_at (datetime): When the version was published
+        notes (str): Description of the changes in this version
+        snapshot (dict): Catalog rows by table name
+
+    Example:
+        >>> version = PriceListVersion(version="2026-04", effective_date=date(2026, 4, 1),
+        ...                            snapshot=PriceBook.query_rows(db))
+        >>> print(version)
+    """
+
+    __tablename__ = 'price_list_versions'
+
+    id = Column(Integer, primary_key=True)
+    version = Column(String, unique=True, nullable=False)
+    effective_date = Column(Date, unique=True, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    notes = Column(Text)
+    snapshot = Column(JSON, nullable=False)
+
+    def __repr__(self):
+        """
+        Return a string representation of the PriceListVersion.
+        Returns:
+            str: A string showing the version label and effective date
+        """
+        return f"<PriceListVersion(version='{self.version}', effective_date='{self.effective_date}')>"
+
+
+@event.listens_for(PriceListVersion, 'before_update')
+def _reject_changes(mapper, connection, target):
+    """Reject changes to a published price list (only the notes may change)."""
+    state = inspect(target)
+    for attribute in ('version', 'effective_date', 'snapshot'):
+        if state.attrs[attribute].history.has_changes():
+            raise ValueError(
+                f'Price list {target.version} is immutable; '
+                'publish a new version instead'
+            )
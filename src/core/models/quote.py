@@ -10,14 +10,50 @@ These models support:
 - Quote and line item storage
 - Relationships to customers, products, and options
 - Calculation of totals, discounts, and option pricing
+
+Totals are accumulated in integer cents (see src/utils/money.py) so large
+quotes do not drift; the float properties are exact conversions of the cent
+columns.
+
+The subtotal, discount and total of every line item and quote are stored in
+the quote_items and quotes tables, so listing quotes reads one row per quote
+instead of loading every item and option. Whenever a flush adds, changes or
+deletes a quote item or item option, the stored totals of the affected items
+and quotes are recomputed in SQL in the same transaction (see
+refresh_totals). Changes made with bulk UPDATE statements bypass the flush;
+call refresh_totals for the affected quotes afterwards, or rebuild every
+quote with scripts/rebuild_quote_totals.py.
 """
 
 from datetime import datetime
-
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from typing import Iterable, Optional, Set, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    cast,
+    event,
+    func,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, relationship
+from sqlalchemy.orm.util import identity_key
 
 from src.core.database import Base
+from src.core.models.option import QuoteItemOption
+from src.utils.money import cents_column, from_cents, percent_of, to_cents
+
+# Stored total columns of Quote and QuoteItem, in cents
+TOTAL_COLUMNS = ('subtotal_cents', 'discount_total_cents', 'total_cents')
 
 
 class Quote(Base):
@@ -25,8 +61,8 @@ class Quote(Base):
     SQLAlchemy model representing a customer quote (header).
 
     Stores metadata about a quote, including the customer, creation/expiration dates,
-    status, and associated line items. Provides a property to calculate the total
-    value of the quote.
+    status, and associated line items. The quote's totals (the sums of its line
+    items' totals) are stored with it and refreshed on flush.
 
     Attributes:
         id (int): Primary key
@@ -36,11 +72,16 @@ class Quote(Base):
         expiration_date (datetime): Expiration date for the quote
         status (str): Quote status ("draft", "sent", "accepted", "rejected")
         notes (str): Additional notes or comments
+        subtotal_cents (int): Sum of the line item subtotals, in cents
+        discount_total_cents (int): Sum of the line item discounts, in cents
+        total_cents (int): Sum of the line item totals, in cents
         customer (Customer): Related customer object
         items (List[QuoteItem]): List of line items in the quote
 
     Example:
         >>> quote = Quote(quote_number="Q-2024-001", customer_id=1)
+        >>> db.add(quote)
+        >>> db.commit()
         >>> print(quote.total)
     """
 
@@ -49,11 +90,18 @@ class Quote(Base):
     id = Column(Integer, primary_key=True, index=True)
     quote_number = Column(String, unique=True, index=True, nullable=False)
     customer_id = Column(Integer, ForeignKey('customers.id'), nullable=False)
-    date_created = Column(DateTime, default=datetime.now)
+    date_created = Column(DateTime, default=datetime.now, index=True)
     expiration_date = Column(DateTime)
     status = Column(String, default='draft')  # "draft", "sent", "accepted", "rejected"
     notes = Column(Text)
 
+    # Stored totals, maintained by refresh_totals
+    subtotal_cents = Column(Integer, nullable=False, default=0, server_default='0')
+    discount_total_cents = Column(
+        Integer, nullable=False, default=0, server_default='0'
+    )
+    total_cents = Column(Integer, nullable=False, default=0, server_default='0')
+
     # Relationships
     customer = relationship('Customer', back_populates='quotes')
     items = relationship(
@@ -68,14 +116,44 @@ class Quote(Base):
         """
         return f"<Quote(id={self.id}, quote_number='{self.quote_number}', status='{self.status}')>"
 
+    def calculate_totals(self) -> Tuple[int, int, int]:
+        """
+        Calculate the quote's totals from its line items, without the stored values.
+
+        Useful for quotes that have not been flushed yet.
+
+        Returns:
+            Tuple[int, int, int]: Subtotal, discount and total in cents
+        """
+        totals = [item.calculate_totals() for item in self.items]
+        return tuple(sum(column) for column in zip(*totals)) or (0, 0, 0)
+
+    @property
+    def subtotal(self):
+        """
+        Get the subtotal of the quote before discounts (sum of all line items).
+        Returns:
+            float: Subtotal of the quote
+        """
+        return from_cents(self.subtotal_cents or 0)
+
+    @property
+    def discount_total(self):
+        """
+        Get the total discount of the quote (sum of all line items).
+        Returns:
+            float: Total discount of the quote
+        """
+        return from_cents(self.discount_total_cents or 0)
+
     @property
     def total(self):
         """
-        Calculate the total amount for the quote (sum of all line items).
+        Get the total amount for the quote (sum of all line items).
         Returns:
             float: Total value of the quote
         """
-        return sum(item.total for item in self.items)
+        return from_cents(self.total_cents or 0)
 
 
 class QuoteItem(Base):
@@ -83,8 +161,8 @@ class QuoteItem(Base):
     SQLAlchemy model representing a line item in a quote.
 
     Each QuoteItem stores a specific product configuration, including quantity,
-    pricing, material, voltage, and any options. Provides properties for subtotal,
-    discount, and total calculations.
+    pricing, material, voltage, and any options, along with its subtotal,
+    discount and total, which are refreshed on flush.
 
     Attributes:
         id (int): Primary key
@@ -97,16 +175,24 @@ class QuoteItem(Base):
         voltage (str): Voltage specification (if applicable)
         description (str): Custom description for the line item
         discount_percent (float): Discount percentage applied
+        subtotal_cents (int): Base price times quantity plus options, in cents
+        discount_total_cents (int): Discount on the subtotal, in cents
+        total_cents (int): Subtotal less discount, in cents
         quote (Quote): Parent quote object
         product (ProductVariant): Related product variant
         options (List[QuoteItemOption]): List of option line items
 
     Example:
         >>> item = QuoteItem(product_id=1, quantity=2, unit_price=500.0)
-        >>> print(item.total)
+        >>> item.calculate_totals()
+        (100000, 0, 100000)
     """
 
     __tablename__ = 'quote_items'
+    __table_args__ = (
+        # Loading a quote's items; product_id covers the dashboard's product joins
+        Index('ix_quote_items_quote_product', 'quote_id', 'product_id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     quote_id = Column(Integer, ForeignKey('quotes.id'), nullable=False)
@@ -123,6 +209,13 @@ class QuoteItem(Base):
     # Pricing
     discount_percent = Column(Float, default=0.0)
 
+    # Stored totals, maintained by refresh_totals
+    subtotal_cents = Column(Integer, nullable=False, default=0, server_default='0')
+    discount_total_cents = Column(
+        Integer, nullable=False, default=0, server_default='0'
+    )
+    total_cents = Column(Integer, nullable=False, default=0, server_default='0')
+
     # Relationships
     quote = relationship('Quote', back_populates='items')
     product = relationship('ProductVariant', back_populates='quote_items')
@@ -138,54 +231,251 @@ class QuoteItem(Base):
         """
         return f'<QuoteItem(id={self.id}, product_id={self.product_id}, quantity={self.quantity})>'
 
+    @property
+    def options_total_cents(self):
+        """
+        Calculate the total price in cents for all options in this line item.
+
+        Sums up the price of each option multiplied by its quantity (one if not
+        set, as in refresh_totals). This represents the total cost of all add-ons
+        and customizations for this line item.
+
+        Returns:
+            int: Total value of all options in cents
+        """
+        return sum(
+            to_cents(option.price) * (1 if option.quantity is None else option.quantity)
+            for option in self.options
+        )
+
     @property
     def options_total(self):
         """
         Calculate the total price for all options in this line item.
 
-        Sums up the price of each option multiplied by its quantity. This represents
-        the total cost of all add-ons and customizations for this line item.
-
         Returns:
             float: Total value of all options
         """
-        return sum(option.price * option.quantity for option in self.options)
+        return from_cents(self.options_total_cents)
 
-    @property
-    def subtotal(self):
+    def calculate_totals(self) -> Tuple[int, int, int]:
         """
-        Calculate the subtotal before discount.
+        Calculate the line item's totals from its price, quantity and options.
 
         Combines the base price (unit price * quantity) with the total cost of all
-        options. This represents the full price before any discounts are applied.
+        options into the subtotal, applies the discount percentage rounded to the
+        cent, and subtracts it. This is what refresh_totals computes in SQL; use
+        it for items that have not been flushed yet.
+
+        Returns:
+            Tuple[int, int, int]: Subtotal, discount and total in cents
+        """
+        subtotal = (
+            to_cents(self.unit_price) * (self.quantity or 1) + self.options_total_cents
+        )
+        discount = percent_of(subtotal, self.discount_percent)
+        return subtotal, discount, subtotal - discount
+
+    @property
+    def subtotal(self):
+        """
+        Get the subtotal before discount.
 
         Returns:
             float: Subtotal before discount
         """
-        return (self.unit_price or 0) * (self.quantity or 1) + self.options_total
+        return from_cents(self.subtotal_cents or 0)
 
     @property
     def discount_amount(self):
         """
-        Calculate the discount amount for this line item.
-
-        Applies the discount percentage to the subtotal to determine the actual
-        discount value in currency units.
+        Get the discount amount for this line item.
 
         Returns:
             float: Discount value in currency units
         """
-        return self.subtotal * ((self.discount_percent or 0) / 100)
+        return from_cents(self.discount_total_cents or 0)
 
     @property
     def total(self):
         """
-        Calculate the total for this line item with discount applied.
-
-        Subtracts the discount amount from the subtotal to get the final price
-        for this line item, including all options and discounts.
+        Get the total for this line item with discount applied.
 
         Returns:
             float: Final total for the line item
         """
-        return self.subtotal - self.discount_amount
+        return from_cents(self.total_cents or 0)
+
+
+def _item_totals_sql():
+    """Build SQL expressions for a line item's subtotal and discount in cents."""
+    options_cents = (
+        select(
+            func.coalesce(
+                func.sum(
+                    cents_column(QuoteItemOption.price)
+                    * func.coalesce(QuoteItemOption.quantity, 1)
+                ),
+                0,
+            )
+        )
+        .where(QuoteItemOption.quote_item_id == QuoteItem.id)
+        .scalar_subquery()
+    )
+    # Same arithmetic as calculate_totals: a zero quantity counts as one
+    subtotal = (
+        cents_column(QuoteItem.unit_price)
+        * func.coalesce(func.nullif(QuoteItem.quantity, 0), 1)
+        + options_cents
+    )
+    discount = cast(
+        func.round(
+            QuoteItem.subtotal_cents
+            * func.coalesce(QuoteItem.discount_percent, 0.0)
+            / 100.0
+        ),
+        Integer,
+    )
+    return subtotal, discount
+
+
+def _quotes_of_items(connection: Connection, item_ids: Set[int]) -> Set[int]:
+    """Get the IDs of the quotes the given line items belong to."""
+    if not item_ids:
+        return set()
+    return set(
+        connection.execute(
+            select(QuoteItem.quote_id).where(QuoteItem.id.in_(item_ids)).distinct()
+        ).scalars()
+    )
+
+
+def refresh_totals(
+    connection: Connection,
+    quote_ids: Optional[Iterable[int]] = None,
+    item_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Recompute stored totals in SQL.
+
+    Refreshes the given line items and the given quotes with all their line
+    items; the quotes of the given line items are refreshed too. With neither
+    argument, every line item and quote is refreshed.
+
+    Args:
+        connection: Connection to execute the updates on (e.g. db.connection())
+        quote_ids: IDs of quotes to refresh
+        item_ids: IDs of line items to refresh
+    """
+    item_filter, quote_filter = [], []
+    if quote_ids is not None or item_ids is not None:
+        item_ids = set(item_ids or ())
+        quote_ids = set(quote_ids or ()) | _quotes_of_items(connection, item_ids)
+        if not quote_ids:
+            return
+        item_filter = [QuoteItem.id.in_(item_ids) | QuoteItem.quote_id.in_(quote_ids)]
+        quote_filter = [Quote.id.in_(quote_ids)]
+
+    subtotal, discount = _item_totals_sql()
+    connection.execute(
+        update(QuoteItem).where(*item_filter).values(subtotal_cents=subtotal)
+    )
+    connection.execute(
+        update(QuoteItem)
+        .where(*item_filter)
+        .values(
+            discount_total_cents=discount,
+            total_cents=QuoteItem.subtotal_cents - discount,
+        )
+    )
+
+    def item_sum(column):
+        return (
+            select(func.coalesce(func.sum(column), 0))
+            .where(QuoteItem.quote_id == Quote.id)
+            .scalar_subquery()
+        )
+
+    connection.execute(
+        update(Quote)
+        .where(*quote_filter)
+        .values(
+            subtotal_cents=item_sum(QuoteItem.subtotal_cents),
+            discount_total_cents=item_sum(QuoteItem.discount_total_cents),
+            total_cents=item_sum(QuoteItem.total_cents),
+        )
+    )
+
+
+def _parent_key(instance) -> Optional[str]:
+    """Get the foreign key attribute tying an item or option to its parent."""
+    if isinstance(instance, QuoteItemOption):
+        return 'quote_item_id'
+    if isinstance(instance, QuoteItem):
+        return 'quote_id'
+    return None
+
+
+@event.listens_for(Session, 'before_flush')
+def _collect_previous_parents(session, flush_context, instances):
+    """Remember the parents changed items and options belonged to before the flush."""
+    quote_ids, item_ids = session.info.setdefault('totals_parents', (set(), set()))
+    stored = {'quote_id': set(), 'quote_item_id': set()}
+    for instance in (*session.dirty, *session.deleted):
+        key = _parent_key(instance)
+        identity = inspect(instance).identity
+        if key is not None and identity is not None:
+            stored[key].add(identity[0])
+    if not stored['quote_id'] and not stored['quote_item_id']:
+        return
+
+    # Read the parents from the database, which still holds them before the
+    # flush: a foreign key reassigned after it expired (e.g. after a commit)
+    # keeps no history of its previous value
+    connection = session.connection()
+    for model, key, ids in (
+        (QuoteItem, 'quote_id', quote_ids),
+        (QuoteItemOption, 'quote_item_id', item_ids),
+    ):
+        if stored[key]:
+            ids.update(
+                connection.execute(
+                    select(getattr(model, key)).where(model.id.in_(stored[key]))
+                ).scalars()
+            )
+
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_changed_totals(session, flush_context):
+    """Recompute the stored totals of the items and quotes a flush changed."""
+    quote_ids, item_ids = session.info.pop('totals_parents', (set(), set()))
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        key = _parent_key(instance)
+        if key is None:
+            continue
+        if key == 'quote_id':
+            if instance not in session.deleted:
+                item_ids.add(instance.id)
+            quote_ids.add(instance.quote_id)
+        else:
+            item_ids.add(instance.quote_item_id)
+    quote_ids.discard(None)
+    item_ids.discard(None)
+    if not quote_ids and not item_ids:
+        return
+
+    connection = session.connection()
+    quote_ids |= _quotes_of_items(connection, item_ids)
+    refresh_totals(connection, quote_ids=quote_ids, item_ids=item_ids)
+    session.info['refreshed_totals'] = (quote_ids, item_ids)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _expire_refreshed_totals(session, flush_context):
+    """Expire the in-memory totals the refresh replaced, so they reload."""
+    quote_ids, item_ids = session.info.pop('refreshed_totals', ((), ()))
+    for model, ids in ((Quote, quote_ids), (QuoteItem, item_ids)):
+        for id_ in ids:
+            instance = session.identity_map.get(identity_key(model, id_))
+            if instance is not None:
+                session.expire(instance, TOTAL_COLUMNS)
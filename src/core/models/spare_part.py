@@ -9,9 +9,13 @@ from sqlalchemy import (
     Text,
     DateTime,
 )
+from sqlalchemy import event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base_model import BaseModel
+from .break_table import BreakTable, cached_break_table, invalidate_break_tables
+
+import numpy as np
 
 
 class SparePart(BaseModel):
@@ -140,25 +144,32 @@ class SparePart(BaseModel):
         """Check if spare part is compatible with a material."""
         return material_code in self.material_dependencies
 
+    @property
+    def price_break_table(self) -> BreakTable:
+        """Sorted table of this part's quantity price breaks, built on first use."""
+        return cached_break_table(self, "price_breaks")
+
     def calculate_price(self, quantity: int = 1) -> float:
         """Calculate price based on quantity and price breaks."""
         if not self.is_active:
             return 0.0
 
-        if not self.price_breaks:
-            return self.base_price * quantity
+        return self.price_break_table.price(quantity, self.base_price)
+
+    def calculate_prices(self, quantities) -> np.ndarray:
+        """
+        Calculate the price for each of a vector of order quantities.
 
-        # Sort break points in descending order
-        sorted_breaks = sorted(
-            [float(k) for k in self.price_breaks.keys()], reverse=True
-        )
+        Args:
+            quantities: Array-like of quantities
 
-        # Find applicable break point
-        for break_point in sorted_breaks:
-            if quantity >= break_point:
-                return self.price_breaks[str(break_point)] * quantity
+        Returns:
+            np.ndarray: Extended price per quantity
+        """
+        if not self.is_active:
+            return np.zeros(np.shape(quantities))
 
-        return self.base_price * quantity
+        return self.price_break_table.prices_many(quantities, self.base_price)
 
     def needs_reorder(self) -> bool:
         """Check if part needs to be reordered."""
@@ -207,6 +218,14 @@ class SparePart(BaseModel):
         }
 
 
+@event.listens_for(SparePart.price_breaks, "set")
+@event.listens_for(SparePart, "expire")
+@event.listens_for(SparePart, "refresh")
+def _invalidate_break_tables(target, *args):
+    """Drop a part's cached price break table when its breaks change."""
+    invalidate_break_tables(target)
+
+
 def init_spare_parts(db):
     """Initialize spare parts in the database."""
     parts = [
@@ -2,14 +2,20 @@
 Standard length model for storing standard length configurations.
 
 This module defines the model for standard lengths used in product configurations.
-It supports storing standard length values and their associated metadata.
+It supports storing standard length values and their associated metadata, and
+provides StandardLengthIndex for fast in-memory standard length lookups.
 """
 
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
 from sqlalchemy import Column, Float, Integer, String, Text, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 
 from src.core.database import Base
 
+DEFAULT_TOLERANCE = 0.001  # inches
+
 
 class StandardLength(Base):
     """
@@ -38,9 +44,11 @@ class StandardLength(Base):
     __tablename__ = "standard_lengths"
 
     id = Column(Integer, primary_key=True)
-    material_code = Column(String(10), ForeignKey("materials.code"), nullable=False)
+    material_code = Column(
+        String(10), ForeignKey("materials.code"), nullable=False, index=True
+    )
     length = Column(Float, nullable=False)
-    tolerance = Column(Float, default=0.001)  # Default tolerance of 0.001 inches
+    tolerance = Column(Float, default=DEFAULT_TOLERANCE)  # Default of 0.001 inches
     description = Column(Text)
     category = Column(String, index=True)  # e.g., "Standard", "Custom"
     notes = Column(Text)
@@ -61,3 +69,156 @@ class StandardLength(Base):
     def is_within_tolerance(self, length: float) -> bool:
         """Check if a given length is within tolerance of this standard length."""
         return abs(self.length - length) <= self.tolerance
+
+
+class StandardLengthIndex:
+    """
+    Sorted, in-memory index of standard lengths for fast length checks.
+
+    Keeps one sorted array of lengths (with a parallel array of tolerances) per
+    (material code, product family) and answers nearest/tolerance queries with
+    a binary search, so checking a length is O(log n) and needs no database
+    access. Lengths stored without a product family apply to every family of
+    that material; a family-specific table takes precedence when present.
+
+    Tolerance windows are assumed not to overlap beyond adjacent standard
+    lengths, so only the two neighbours of a length are checked.
+
+    Example:
+        >>> index = StandardLengthIndex.load(db)
+        >>> index.is_standard("H", 24.0)
+        True
+        >>> index.nearest("H", 30.0)
+        24.0
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, Optional[str], float, Optional[float]]] = (),
+        material_codes: Iterable[str] = (),
+    ):
+        """
+        Build the index.
+
+        Args:
+            entries: (material code, product family or None, length, tolerance)
+            material_codes: Known material codes, including those without any
+                            standard lengths
+        """
+        tables: Dict[Tuple[str, Optional[str]], List[Tuple[float, float]]] = {}
+        for material_code, family, length, tolerance in entries:
+            tolerance = DEFAULT_TOLERANCE if tolerance is None else tolerance
+            tables.setdefault((material_code, family), []).append(
+                (float(length), float(tolerance))
+            )
+
+        self._lengths: Dict[Tuple[str, Optional[str]], Tuple[float, ...]] = {}
+        self._tolerances: Dict[Tuple[str, Optional[str]], Tuple[float, ...]] = {}
+        for key, values in tables.items():
+            values.sort()
+            self._lengths[key] = tuple(length for length, _ in values)
+            self._tolerances[key] = tuple(tolerance for _, tolerance in values)
+
+        self._material_codes = frozenset(material_codes) | {
+            material_code for material_code, _ in tables
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[StandardLength]) -> "StandardLengthIndex":
+        """Build an index from StandardLength objects."""
+        return cls(
+            (row.material_code, None, row.length, row.tolerance) for row in rows
+        )
+
+    @classmethod
+    def load(cls, db: Session) -> "StandardLengthIndex":
+        """
+        Load an index of all standard lengths from the database.
+
+        Args:
+            db: SQLAlchemy database session
+
+        Returns:
+            StandardLengthIndex: Index of every standard length and material code
+        """
+        from src.core.models.material import Material
+
+        rows = db.query(
+            StandardLength.material_code,
+            StandardLength.length,
+            StandardLength.tolerance,
+        )
+        return cls(
+            ((code, None, length, tolerance) for code, length, tolerance in rows),
+            material_codes=(code for (code,) in db.query(Material.code)),
+        )
+
+    def _key(
+        self, material_code: str, product_family: Optional[str]
+    ) -> Tuple[str, Optional[str]]:
+        """Get the table key for a material, preferring the family-specific one."""
+        key = (material_code, product_family)
+        if product_family is not None and key in self._lengths:
+            return key
+        return material_code, None
+
+    def has_material(self, material_code: str) -> bool:
+        """Check if a material code is known to the index."""
+        return material_code in self._material_codes
+
+    def lengths(
+        self, material_code: str, product_family: Optional[str] = None
+    ) -> Tuple[float, ...]:
+        """Get the sorted standard lengths for a material (and family)."""
+        return self._lengths.get(self._key(material_code, product_family), ())
+
+    def tolerances(
+        self, material_code: str, product_family: Optional[str] = None
+    ) -> Tuple[float, ...]:
+        """Get the tolerances parallel to lengths()."""
+        return self._tolerances.get(self._key(material_code, product_family), ())
+
+    def nearest(
+        self, material_code: str, length: float, product_family: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Get the standard length closest to a length.
+
+        Returns:
+            The nearest standard length (the shorter one on a tie), or None if
+            the material has no standard lengths.
+        """
+        lengths = self.lengths(material_code, product_family)
+        if not lengths:
+            return None
+        i = bisect_left(lengths, length)
+        if i == 0:
+            return lengths[0]
+        if i == len(lengths):
+            return lengths[-1]
+        below, above = lengths[i - 1], lengths[i]
+        return below if length - below <= above - length else above
+
+    def match(
+        self, material_code: str, length: float, product_family: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Get the standard length a length matches within tolerance.
+
+        Returns:
+            The matching standard length, or None if the length is not standard.
+        """
+        key = self._key(material_code, product_family)
+        lengths = self._lengths.get(key, ())
+        tolerances = self._tolerances.get(key, ())
+        i = bisect_left(lengths, length)
+        for j in (i, i - 1):
+            if 0 <= j < len(lengths) and abs(lengths[j] - length) <= tolerances[j]:
+                return lengths[j]
+        return None
+
+    def is_standard(
+        self, material_code: str, length: float, product_family: Optional[str] = None
+    ) -> bool:
+        """Check if a length is a standard length for a material (and family)."""
+        return self.match(material_code, length, product_family) is not None
@@ -1,12 +1,52 @@
 # This file makes the src/core/pricing directory a Python package.
 
-from .calculator import calculate_option_price, calculate_product_price
+from .batch import PriceCurve, PricingBatch, price_curve, price_many, price_many_cents
+from .calculator import (
+    PriceCalculator,
+    calculate_option_price,
+    calculate_price_breakdown,
+    calculate_product_price,
+)
 from .context import PricingContext
-from .strategies import PricingStrategy
+from .engine import ConfigurationPrice, PricingEngine
+from .price_book import PriceBook, default_price_book, invalidate_default_price_books
+from .price_lists import (
+    PriceListRegistry,
+    compare_price_lists,
+    price_book_as_of,
+    publish_price_list,
+)
+from .price_memo import PriceMemo, default_price_memo
+from .price_table import build_price_table, lookup_price_cents
+from .strategies import PipelineKey, PricingStrategy
+from .trace import PriceBreakdown, StrategyTrace
 
 __all__ = [
+    'ConfigurationPrice',
+    'PipelineKey',
+    'PriceBook',
+    'PriceBreakdown',
+    'PriceCalculator',
+    'PriceCurve',
+    'PriceListRegistry',
+    'PriceMemo',
+    'PricingBatch',
     'PricingContext',
+    'PricingEngine',
     'PricingStrategy',
+    'StrategyTrace',
+    'build_price_table',
     'calculate_option_price',
+    'calculate_price_breakdown',
     'calculate_product_price',
+    'compare_price_lists',
+    'default_price_book',
+    'default_price_memo',
+    'invalidate_default_price_books',
+    'lookup_price_cents',
+    'price_book_as_of',
+    'price_curve',
+    'price_many',
+    'price_many_cents',
+    'publish_price_list',
 ]
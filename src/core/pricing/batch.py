@@ -0,0 +1,568 @@
+"""
+Vectorized batch pricing for many product configurations at once.
+
+This module prices a columnar batch of configurations (product, length,
+material, connection specs) with NumPy array operations instead of running the
+strategy pipeline once per row. The rules mirror the strategies in
+``src/core/pricing/strategies.py`` and are applied in the same order, so each
+row prices exactly as ``calculate_product_price`` would:
+
+1. Material availability for material overrides
+2. Base price (exotic U/T materials use the 316SS variant's price)
+3. Material premium
+4. Extra length adders (the compiled length rules of the price book)
+5. Non-standard length surcharge (and the Halar length limit)
+6. Connection adders
+
+Per-row work is done on arrays; Python only loops over the distinct
+(product type, material) and (family, connection) keys of the batch. Like the
+strategies, each stage rounds its adders to whole cents and prices accumulate
+as exact int64 cents.
+
+Example:
+    >>> batch = PricingBatch.from_configs(
+    ...     [
+    ...         {"product_id": 1, "length": 24.0, "material": "H"},
+    ...         {"product_id": 1, "length": 36.0, "specs": {"connection_type": "Tri-Clamp",
+    ...                                                   "triclamp_size": '1.5"'}},
+    ...     ]
+    ... )
+    >>> prices = price_many(db, batch)
+
+price_curve prices one configuration over a range of lengths the same way, for
+price sweeps and plots, flagging the lengths that cannot be priced.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.core.models import StandardLengthIndex
+from src.core.pricing.length_rules import INCHES_PER_UNIT, LengthRuleEntry
+from src.core.pricing.price_book import PriceBook, default_price_book
+from src.core.pricing.strategies import connection_adder_key
+from src.utils.money import from_cents, to_cents_array
+
+# Extra length rounding modes (see length_rules), applied to arrays of units
+_ARRAY_ROUNDING = {"exact": np.asarray, "floor": np.floor, "ceil": np.ceil}
+
+# Length rules, mirroring NonStandardLengthSurchargeStrategy
+_HALAR_NONSTANDARD_ADDER = 50.0
+_HALAR_MAX_LENGTH = 72
+
+# Lengths priced by price_curve when none are given: 4" to 240" in 1" steps
+DEFAULT_CURVE_LENGTHS = np.arange(4.0, 241.0)
+
+_HALAR_LENGTH_ERROR = (
+    "Halar coated probes cannot exceed 72 inches. "
+    "Please select Teflon Sleeve for longer lengths."
+)
+
+
+@dataclass
+class PricingBatch:
+    """
+    Columnar batch of product configurations to price.
+
+    All columns must have the same length. ``None`` in ``lengths`` or
+    ``materials`` means "use the product's default", exactly like omitting the
+    argument to ``calculate_product_price``.
+
+    Attributes:
+        product_ids: Product IDs
+        lengths: Lengths in inches
+        materials: Material override codes
+        specs: Connection specs per row (same keys as calculate_product_price specs)
+    """
+
+    product_ids: Sequence[int]
+    lengths: Sequence[Optional[float]]
+    materials: Sequence[Optional[str]]
+    specs: Sequence[Optional[Dict[str, Any]]]
+
+    def __post_init__(self):
+        sizes = {
+            len(self.product_ids),
+            len(self.lengths),
+            len(self.materials),
+            len(self.specs),
+        }
+        if len(sizes) != 1:
+            raise ValueError("All PricingBatch columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    @classmethod
+    def from_configs(cls, configs: Iterable[Dict[str, Any]]) -> "PricingBatch":
+        """
+        Build a batch from row-oriented configuration dicts.
+
+        Args:
+            configs: Dicts with "product_id" and optional "length", "material"
+                     and "specs" keys
+
+        Returns:
+            PricingBatch: The equivalent columnar batch
+        """
+        product_ids: List[int] = []
+        lengths: List[Optional[float]] = []
+        materials: List[Optional[str]] = []
+        specs: List[Optional[Dict[str, Any]]] = []
+        for config in configs:
+            product_ids.append(config["product_id"])
+            lengths.append(config.get("length"))
+            materials.append(config.get("material"))
+            specs.append(config.get("specs"))
+        return cls(product_ids, lengths, materials, specs)
+
+
+class _CatalogArrays:
+    """Per-product and per-material arrays derived from a PriceBook."""
+
+    def __init__(self, book: PriceBook):
+        self.book = book
+        self.products = sorted(book.products.values(), key=lambda p: p.id)
+        self.material_codes = list(book.materials)
+        self.material_pos = {code: i for i, code in enumerate(self.material_codes)}
+
+        family_ids = sorted({p.product_family_id for p in self.products})
+        family_pos = {family_id: i for i, family_id in enumerate(family_ids)}
+        self.product_types = sorted({p.product_type for p in self.products})
+        type_pos = {name: i for i, name in enumerate(self.product_types)}
+        self.connection_families = sorted({p.model_series for p in self.products})
+        connection_pos = {
+            name: i for i, name in enumerate(self.connection_families)
+        }
+
+        products = self.products
+        self.ids = np.array([p.id for p in products], dtype=np.int64)
+        self.base_price = np.array([p.base_price for p in products], dtype=np.float64)
+        self.base_length = np.array(
+            [float(p.base_length or 0.0) for p in products], dtype=np.float64
+        )
+        self.default_length = np.array(
+            [np.nan if p.base_length is None else p.base_length for p in products],
+            dtype=np.float64,
+        )
+        self.material = np.array(
+            [self.material_pos.get(p.material, -1) for p in products], dtype=np.intp
+        )
+        self.family = np.array(
+            [family_pos[p.product_family_id] for p in products], dtype=np.intp
+        )
+        self.product_type = np.array(
+            [type_pos[p.product_type] for p in products],
+            dtype=np.intp,
+        )
+        self.connection_family = np.array(
+            [connection_pos[p.model_series] for p in products],
+            dtype=np.intp,
+        )
+        s_products = [book.find_product(p.model_number, p.voltage, "S") for p in products]
+        self.s_base_price = np.array(
+            [np.nan if s is None else s.base_price for s in s_products],
+            dtype=np.float64,
+        )
+
+        materials = [book.materials[code] for code in self.material_codes]
+        self.has_surcharge = np.array(
+            [m.has_nonstandard_length_surcharge for m in materials], dtype=bool
+        )
+        self.surcharge = np.array(
+            [m.nonstandard_length_surcharge for m in materials], dtype=np.float64
+        )
+
+        self.premiums = np.zeros(
+            (len(family_ids), len(self.material_codes)), dtype=np.float64
+        )
+        for (family_id, code), premium in book.material_premiums.items():
+            if family_id in family_pos and code in self.material_pos:
+                self.premiums[family_pos[family_id], self.material_pos[code]] = premium
+
+    def is_material(self, materials: np.ndarray, code: str) -> np.ndarray:
+        """Mask of rows whose material index is the given material code."""
+        return materials == self.material_pos.get(code, -1)
+
+
+def _rule_adders(
+    rules: Sequence[LengthRuleEntry], lengths: np.ndarray, base_length: np.ndarray
+) -> np.ndarray:
+    """Vectorized compiled length adder: first matching rule per row wins."""
+    adders = np.zeros(len(lengths))
+    pending = np.ones(len(lengths), dtype=bool)
+    for rule in rules:
+        rows = pending
+        if rule.product_base_length is not None:
+            rows = pending & (base_length == rule.product_base_length)
+        start = base_length if rule.base_length is None else rule.base_length
+        units = np.maximum(lengths - start, 0.0) / INCHES_PER_UNIT[rule.unit]
+        adders[rows] = (_ARRAY_ROUNDING[rule.rounding](units) * rule.rate)[rows]
+        pending = pending & ~rows
+        if not pending.any():
+            break
+    return adders
+
+
+def _length_adders(
+    catalog: _CatalogArrays,
+    materials: np.ndarray,
+    product_types: np.ndarray,
+    lengths: np.ndarray,
+    base_length: np.ndarray,
+) -> np.ndarray:
+    """Vectorized ExtraLengthStrategy."""
+    adders = np.zeros(len(lengths))
+    pairs = np.stack([materials, product_types], axis=1)
+    for code_idx, type_idx in np.unique(pairs, axis=0):
+        rules = catalog.book.get_length_rules(
+            catalog.product_types[type_idx], catalog.material_codes[code_idx]
+        )
+        if rules:
+            rows = (materials == code_idx) & (product_types == type_idx)
+            adders[rows] = _rule_adders(rules, lengths[rows], base_length[rows])
+    return adders
+
+
+def _is_standard(
+    index: StandardLengthIndex,
+    material_code: str,
+    product_family: str,
+    lengths: np.ndarray,
+) -> np.ndarray:
+    """Vectorized StandardLengthIndex.is_standard for one material and family."""
+    table = np.asarray(index.lengths(material_code, product_family), dtype=np.float64)
+    if not table.size:
+        return np.zeros(len(lengths), dtype=bool)
+    tolerances = np.asarray(index.tolerances(material_code, product_family))
+    i = np.searchsorted(table, lengths)
+    above = np.minimum(i, len(table) - 1)
+    below = np.maximum(i - 1, 0)
+    return (np.abs(table[above] - lengths) <= tolerances[above]) | (
+        np.abs(table[below] - lengths) <= tolerances[below]
+    )
+
+
+def _nonstandard_surcharges(
+    catalog: _CatalogArrays,
+    materials: np.ndarray,
+    product_types: np.ndarray,
+    lengths: np.ndarray,
+) -> np.ndarray:
+    """Vectorized NonStandardLengthSurchargeStrategy (without the Halar limit)."""
+    surcharge = np.zeros(len(lengths))
+    pairs = np.stack([materials, product_types], axis=1)
+    for code_idx, type_idx in np.unique(pairs, axis=0):
+        code = catalog.material_codes[code_idx]
+        rows = (materials == code_idx) & (product_types == type_idx)
+        standard = _is_standard(
+            catalog.book.standard_lengths,
+            code,
+            catalog.product_types[type_idx],
+            lengths[rows],
+        )
+        if code == "H":
+            surcharge[rows] = np.where(standard, 0.0, _HALAR_NONSTANDARD_ADDER)
+        elif catalog.has_surcharge[code_idx]:
+            surcharge[rows] = np.where(standard, 0.0, catalog.surcharge[code_idx])
+    return surcharge
+
+
+def price_many(
+    db: Session,
+    batch: PricingBatch,
+    price_book: Optional[PriceBook] = None,
+    strict: bool = True,
+) -> np.ndarray:
+    """
+    Calculate prices for a whole batch of configurations.
+
+    Args:
+        db: SQLAlchemy database session (only used to get a price book)
+        batch: Configurations to price
+        price_book: Catalog snapshot to price against (default: the shared
+            default book of the database, see default_price_book)
+        strict: If True, raise for the first invalid row. If False, invalid rows
+                are priced as NaN.
+
+    Returns:
+        np.ndarray: float64 array of prices, one per row of the batch (see
+        price_many_cents for exact cents)
+
+    Raises:
+        ValueError: If strict and any row has an unknown product or material, an
+                    unavailable material, or a length beyond the material's limit.
+    """
+    cents, errors = _price_cents(db, batch, price_book, strict)
+    price = from_cents(cents.astype(np.float64))
+    price[list(errors)] = np.nan
+    return price
+
+
+def price_many_cents(
+    db: Session,
+    batch: PricingBatch,
+    price_book: Optional[PriceBook] = None,
+) -> np.ndarray:
+    """
+    Calculate exact prices in cents for a whole batch of configurations.
+
+    Takes the same arguments as price_many (always strict). Sum the result
+    for exact batch totals.
+
+    Returns:
+        np.ndarray: int64 array of prices in cents, one per row of the batch
+
+    Raises:
+        ValueError: If any row has an unknown product or material, an
+                    unavailable material, or a length beyond the material's limit.
+    """
+    cents, _ = _price_cents(db, batch, price_book, strict=True)
+    return cents
+
+
+@dataclass(frozen=True)
+class PriceCurve:
+    """
+    Prices of one configuration over a range of lengths.
+
+    Attributes:
+        lengths: Lengths in inches (float64)
+        cents: Price at each length in cents (int64; 0 where invalid)
+        errors: Why each invalid length cannot be priced, by index into lengths
+    """
+
+    lengths: np.ndarray
+    cents: np.ndarray
+    errors: Mapping[int, str]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Mask of lengths that can be priced."""
+        valid = np.ones(len(self.lengths), dtype=bool)
+        valid[list(self.errors)] = False
+        return valid
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Price at each length in dollars (NaN where invalid, which plots as a gap)."""
+        prices = from_cents(self.cents.astype(np.float64))
+        prices[list(self.errors)] = np.nan
+        return prices
+
+    def invalid_regions(self) -> List[Tuple[float, float, str]]:
+        """
+        Get the runs of consecutive invalid lengths.
+
+        Returns:
+            List[Tuple[float, float, str]]: (first length, last length, error)
+            of each run of consecutive lengths failing with the same error
+        """
+        regions: List[Tuple[float, float, str]] = []
+        previous = None
+        for index in sorted(self.errors):
+            error = self.errors[index]
+            length = float(self.lengths[index])
+            if previous == (index - 1, error):
+                regions[-1] = (regions[-1][0], length, error)
+            else:
+                regions.append((length, length, error))
+            previous = (index, error)
+        return regions
+
+
+def price_curve(
+    db: Session,
+    product_id: int,
+    material: Optional[str] = None,
+    lengths: Optional[Iterable[float]] = None,
+    specs: Optional[Dict[str, Any]] = None,
+    price_book: Optional[PriceBook] = None,
+) -> PriceCurve:
+    """
+    Price one configuration at many lengths in a single vectorized pass.
+
+    Every length is priced exactly as calculate_product_price would price it;
+    lengths that cannot be priced (e.g. Halar beyond 72") are reported instead
+    of raising.
+
+    Args:
+        db: SQLAlchemy database session (only used to get a price book)
+        product_id: Unique identifier of the product
+        material: Material code to override the product's default material
+        lengths: Lengths in inches (default: 4" to 240" in 1" steps)
+        specs: Connection specs (same keys as calculate_product_price specs)
+        price_book: Catalog snapshot to price against (default: the shared
+            default book of the database, see default_price_book)
+
+    Returns:
+        PriceCurve: Price at each length, with the invalid lengths flagged
+
+    Example:
+        >>> curve = price_curve(db, product_id, "H", np.arange(4, 241))
+        >>> plot(curve.lengths, curve.prices)
+        >>> curve.invalid_regions()
+        [(73.0, 240.0, 'Halar coated probes cannot exceed 72 inches. ...')]
+    """
+    lengths = np.asarray(
+        DEFAULT_CURVE_LENGTHS if lengths is None else list(lengths), dtype=np.float64
+    )
+    n = len(lengths)
+    batch = PricingBatch([product_id] * n, lengths, [material] * n, [specs] * n)
+    cents, errors = _price_cents(db, batch, price_book, strict=False)
+    cents[list(errors)] = 0
+    return PriceCurve(lengths=lengths, cents=cents, errors=MappingProxyType(errors))
+
+
+def _price_cents(
+    db: Session,
+    batch: PricingBatch,
+    price_book: Optional[PriceBook],
+    strict: bool,
+) -> Tuple[np.ndarray, Dict[int, str]]:
+    """Price a batch in int64 cents; also return the error of each invalid row."""
+    book = price_book if price_book is not None else default_price_book(db)
+    n = len(batch)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), {}
+
+    catalog = _CatalogArrays(book)
+
+    # First error per row, in the order the strategy pipeline would raise them
+    errors: Dict[int, str] = {}
+
+    def fail(rows: np.ndarray, message: Callable[[int], str]) -> None:
+        for row in rows:
+            errors.setdefault(int(row), message(int(row)))
+
+    # Resolve products
+    product_ids = np.asarray(batch.product_ids, dtype=np.int64)
+    if not catalog.products:
+        raise ValueError(f"Product with ID {int(product_ids[0])} not found")
+    pos = np.minimum(np.searchsorted(catalog.ids, product_ids), len(catalog.ids) - 1)
+    found = catalog.ids[pos] == product_ids
+    fail(
+        np.flatnonzero(~found),
+        lambda row: f"Product with ID {int(product_ids[row])} not found",
+    )
+    prod = np.where(found, pos, 0)
+
+    # Effective length
+    lengths = np.array(
+        [np.nan if length is None else length for length in batch.lengths],
+        dtype=np.float64,
+    )
+    lengths = np.where(np.isnan(lengths), catalog.default_length[prod], lengths)
+    lengths = np.nan_to_num(lengths, nan=0.0)
+
+    # Effective material
+    overrides = np.array([code or "" for code in batch.materials], dtype=object)
+    override_codes, override_inverse = np.unique(overrides, return_inverse=True)
+    override_lookup = np.array(
+        [catalog.material_pos.get(code, -1) if code else -2 for code in override_codes],
+        dtype=np.intp,
+    )
+    override = override_lookup[override_inverse.ravel()]
+    has_override = override != -2
+    material = np.where(has_override, override, catalog.material[prod])
+    fail(
+        np.flatnonzero(found & (material == -1)),
+        lambda row: "Material "
+        f"{overrides[row] or catalog.products[prod[row]].material} not found",
+    )
+    valid = found & (material >= 0)
+    materials = np.where(valid, material, 0)
+
+    # 1. Material availability
+    check = valid & has_override
+    if check.any():
+        pairs = np.stack([catalog.product_type[prod[check]], override[check]], axis=1)
+        keys, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        allowed = np.empty(len(keys), dtype=bool)
+        for i, (type_idx, code_idx) in enumerate(keys):
+            option = book.find_option(
+                "Material", "Material", catalog.product_types[type_idx]
+            )
+            allowed[i] = bool(option) and (
+                catalog.material_codes[code_idx] in option.choices
+            )
+        fail(
+            np.flatnonzero(check)[~allowed[inverse.ravel()]],
+            lambda row: f"Material {overrides[row]} is not available for product "
+            f"type {catalog.product_types[catalog.product_type[prod[row]]]}",
+        )
+
+    # 2. Base price
+    exotic = catalog.is_material(materials, "U") | catalog.is_material(materials, "T")
+    s_price = catalog.s_base_price[prod]
+    price = to_cents_array(
+        np.where(exotic & ~np.isnan(s_price), s_price, catalog.base_price[prod])
+    )
+
+    # 3. Material premium
+    price += to_cents_array(catalog.premiums[catalog.family[prod], materials])
+
+    # 4. Extra length
+    price += to_cents_array(
+        _length_adders(
+            catalog,
+            materials,
+            catalog.product_type[prod],
+            lengths,
+            catalog.base_length[prod],
+        )
+    )
+
+    # 5. Non-standard length surcharge
+    price += to_cents_array(
+        _nonstandard_surcharges(catalog, materials, catalog.product_type[prod], lengths)
+    )
+    fail(
+        np.flatnonzero(
+            valid
+            & catalog.is_material(materials, "H")
+            & (lengths > _HALAR_MAX_LENGTH)
+        ),
+        lambda row: _HALAR_LENGTH_ERROR,
+    )
+
+    # 6. Connection adders
+    connection_keys = np.array(
+        [connection_adder_key(specs or {}) or "" for specs in batch.specs],
+        dtype=object,
+    )
+    priced = connection_keys != ""
+    if priced.any():
+        key_names, key_inverse = np.unique(
+            connection_keys[priced], return_inverse=True
+        )
+        pairs = np.stack(
+            [catalog.connection_family[prod[priced]], key_inverse.ravel()], axis=1
+        )
+        keys, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        adders = np.zeros(len(keys))
+        for i, (family_idx, key_idx) in enumerate(keys):
+            option = book.find_option(
+                "Connection", "Connection", catalog.connection_families[family_idx]
+            )
+            if option:
+                adders[i] = option.adders.get(key_names[key_idx], 0.0)
+        price[priced] += to_cents_array(adders)[inverse.ravel()]
+
+    if errors and strict:
+        first = min(errors)
+        raise ValueError(f"Row {first}: {errors[first]}")
+    return price, errors
@@ -6,30 +6,25 @@ It orchestrates a series of pricing strategies to calculate the final price,
 ensuring that complex business rules for materials, lengths, and options are applied correctly.
 """
 
-from typing import Any, Dict, List, Optional
+import time
+from datetime import date
+from typing import Any, Dict, Optional
 
 from sqlalchemy.orm import Session
 
 from src.core.pricing.context import PricingContext
-from src.core.pricing.strategies import (
-    BasePriceStrategy,
-    ConnectionOptionStrategy,
-    ExtraLengthStrategy,
-    MaterialAvailabilityStrategy,
-    MaterialPremiumStrategy,
-    NonStandardLengthSurchargeStrategy,
-    PricingStrategy,
-)
+from src.core.pricing.engine import PricingEngine
+from src.core.pricing.pipeline import PriceCalculator, default_calculator
+from src.core.pricing.price_book import PriceBook
+from src.core.pricing.price_lists import price_book_as_of
+from src.core.pricing.trace import PriceBreakdown, count_statements
 
-
-class PriceCalculator:
-    def __init__(self, strategies: List[PricingStrategy]):
-        self.strategies = strategies
-
-    def calculate(self, context: PricingContext) -> float:
-        for strategy in self.strategies:
-            strategy.calculate(context)
-        return context.price
+__all__ = [
+    'PriceCalculator',
+    'calculate_option_price',
+    'calculate_price_breakdown',
+    'calculate_product_price',
+]
 
 
 def calculate_product_price(
@@ -38,12 +33,15 @@ def calculate_product_price(
     length: Optional[float] = None,
     material_override: Optional[str] = None,
     specs: Optional[Dict[str, Any]] = None,
+    price_book: Optional[PriceBook] = None,
+    as_of: Optional[date] = None,
 ) -> float:
     """
     Calculate the total price for a product using a strategy-based calculator.
 
     This function orchestrates the pricing logic for Babbitt International products
-    by applying a series of pricing strategies in a specific order.
+    by applying a series of pricing strategies in a specific order. It delegates
+    to PricingEngine; price many configurations through one engine instead.
 
     Args:
         db: SQLAlchemy database session
@@ -51,38 +49,64 @@ def calculate_product_price(
         length: Length in inches (if applicable)
         material_override: Material code to override the product's default material
         specs: Dictionary containing product specifications including connection options
+        price_book: Catalog snapshot to price against. Pass a shared PriceBook when
+                    pricing many configurations; if omitted, db's shared default
+                    book is used (see default_price_book).
+        as_of: Price against the published price list in effect on this date
+               instead of the current catalog (cannot be combined with price_book)
 
     Returns:
         float: Calculated total price.
 
+    Raises:
+        ValueError: If the product, material, or options are invalid or unavailable,
+                    or no price list is in effect on as_of.
+    """
+    if as_of is not None:
+        if price_book is not None:
+            raise ValueError('Pass either price_book or as_of, not both')
+        price_book = price_book_as_of(db, as_of)
+    engine = PricingEngine(db, price_book)
+    return engine.price_product(product_id, length, material_override, specs)
+
+
+def calculate_price_breakdown(
+    db: Session,
+    product_id: int,
+    length: Optional[float] = None,
+    material_override: Optional[str] = None,
+    specs: Optional[Dict[str, Any]] = None,
+    price_book: Optional[PriceBook] = None,
+) -> PriceBreakdown:
+    """
+    Calculate a product price with a per-strategy trace.
+
+    Takes the same arguments as calculate_product_price and runs the same
+    compiled pipeline once, but returns a PriceBreakdown recording each applied
+    strategy's price delta, wall time and SQL statement count. Use it to find which strategy
+    dominates latency, or to show line-level adders on a quote.
+
+    Returns:
+        PriceBreakdown: Final price and per-strategy trace.
+
     Raises:
         ValueError: If the product, material, or options are invalid or unavailable.
     """
-    # Create the context for this pricing calculation
-    context = PricingContext(
-        db=db,
-        product_id=product_id,
-        length_in=length,
-        material_override_code=material_override,
-        specs=specs or {},
-    )
-
-    # Define the sequence of pricing strategies
-    # The order is critical for correct calculation
-    pricing_strategies = [
-        MaterialAvailabilityStrategy(),
-        BasePriceStrategy(),
-        MaterialPremiumStrategy(),
-        ExtraLengthStrategy(),
-        NonStandardLengthSurchargeStrategy(),
-        ConnectionOptionStrategy(),
-    ]
-
-    # Create and run the calculator
-    calculator = PriceCalculator(pricing_strategies)
-    final_price = calculator.calculate(context)
-
-    return final_price
+    breakdown = PriceBreakdown()
+    start = time.perf_counter()
+    with count_statements(db) as statements:
+        context = PricingContext(
+            db=db,
+            product_id=product_id,
+            length_in=length,
+            material_override_code=material_override,
+            specs=specs or {},
+            price_book=price_book,
+        )
+    breakdown.setup_ms = (time.perf_counter() - start) * 1000.0
+    breakdown.setup_sql_statements = statements.count
+
+    return default_calculator().calculate_with_trace(context, breakdown)
 
 
 def calculate_option_price(
@@ -3,7 +3,13 @@ from typing import Any, Dict, Optional
 
 from sqlalchemy.orm import Session
 
-from src.core.models import Material, Product
+from src.core.pricing.price_book import (
+    MaterialEntry,
+    PriceBook,
+    ProductEntry,
+    default_price_book,
+)
+from src.utils.money import from_cents, to_cents
 
 
 @dataclass
@@ -14,19 +20,37 @@ class PricingContext:
     material_override_code: Optional[str] = None
     specs: Optional[Dict[str, Any]] = field(default_factory=dict)
 
+    # Catalog snapshot the strategies read from; db's default book if not given
+    price_book: Optional[PriceBook] = None
+
     # These fields will be populated by strategies
-    product: Optional[Product] = None
-    material: Optional[Material] = None
+    product: Optional[ProductEntry] = None
+    material: Optional[MaterialEntry] = None
     effective_length_in: Optional[float] = None
 
-    # The price is accumulated through strategies
-    price: float = 0.0
+    # The price is accumulated through strategies, in whole cents
+    price_cents: int = 0
+
+    @property
+    def price(self) -> float:
+        """Accumulated price in dollars."""
+        return from_cents(self.price_cents)
+
+    @price.setter
+    def price(self, value: float):
+        self.price_cents = to_cents(value)
+
+    def add(self, amount: float) -> float:
+        """Add a dollar amount (rounded to the cent) and return the new price."""
+        self.price_cents += to_cents(amount)
+        return self.price
 
     def __post_init__(self):
+        if self.price_book is None:
+            self.price_book = default_price_book(self.db)
+
         # Initial lookup for product
-        self.product = (
-            self.db.query(Product).filter(Product.id == self.product_id).first()
-        )
+        self.product = self.price_book.get_product(self.product_id)
         if not self.product:
             raise ValueError(f'Product with ID {self.product_id} not found')
 
@@ -41,8 +65,6 @@ class PricingContext:
             if self.material_override_code
             else self.product.material
         )
-        self.material = (
-            self.db.query(Material).filter(Material.code == material_code).first()
-        )
+        self.material = self.price_book.get_material(material_code)
         if not self.material:
             raise ValueError(f'Material {material_code} not found')
@@ -0,0 +1,314 @@
+"""
+Unified pricing engine.
+
+Every price in the application comes from PricingEngine:
+calculate_product_price, PricingService.calculate_price and the configuration
+dialog (through ConfigurationService) all delegate to it, so a configuration
+prices the same wherever it is priced.
+
+An engine takes one PriceBook when it is created (the database's shared
+default book unless one is given, see default_price_book, or the memo's stored
+snapshot when given a PriceMemo), which is the whole
+query plan: at most a fixed set of catalog queries. Every configuration priced
+afterwards is resolved and priced against the book without touching the
+database:
+
+1. Resolve the product: either a product ID, or a product family plus voltage
+   and material (a material without its own product is priced as a material
+   override on the family's product for the voltage)
+2. Run the strategy pipeline for the product, length, material and connection
+   (compiled per input shape, see src/core/pricing/pipeline.py)
+3. Add the adders of any other selected options
+
+Prices are accumulated in integer cents (see src/utils/money.py); the dollar
+values returned are exact conversions of the cent totals. An engine given a
+PriceMemo (see src/core/pricing/price_memo.py) reuses the price book and the
+pipeline prices of earlier application runs while the catalog is unchanged.
+
+Example:
+    >>> engine = PricingEngine(db)
+    >>> result = engine.price_configuration(
+    ...     product_family_id=1, voltage="115VAC", material="H", length=24.0
+    ... )
+    >>> result.price, result.product.model_number
+"""
+
+from dataclasses import dataclass
+from typing import Any, Collection, Dict, List, Mapping, Optional, Tuple, Type
+
+from sqlalchemy.orm import Session
+
+from src.core.pricing.context import PricingContext
+from src.core.pricing.pipeline import PriceCalculator, default_calculator
+from src.core.pricing.price_book import PriceBook, ProductEntry, default_price_book
+from src.core.pricing.price_memo import PriceMemo, price_memo_key
+from src.core.pricing.strategies import PricingStrategy
+from src.utils.money import from_cents, to_cents
+
+
+@dataclass(frozen=True)
+class ConfigurationPrice:
+    """
+    Price of a configuration, split into the product and its options.
+
+    Attributes:
+        product: Product the configuration was priced from
+        material_override: Material code priced as an override of the
+            product's material, if any
+        product_cents: Price of the strategy pipeline (product, material,
+            length and connection) in cents
+        option_cents: Adder of each other selected option in cents, by option
+            name
+    """
+
+    product: ProductEntry
+    material_override: Optional[str]
+    product_cents: int
+    option_cents: Mapping[str, int]
+
+    @property
+    def price_cents(self) -> int:
+        """Total price in cents."""
+        return self.product_cents + sum(self.option_cents.values())
+
+    @property
+    def price(self) -> float:
+        """Total price in dollars."""
+        return from_cents(self.price_cents)
+
+
+class PricingEngine:
+    """
+    Prices products and configurations against one catalog snapshot.
+
+    Create one engine per unit of work that should see a consistent catalog
+    (a quote, a configuration session, a batch job) and price everything in it
+    through the engine.
+
+    Attributes:
+        db: SQLAlchemy database session the price book was loaded from
+        price_book: Catalog snapshot every price is calculated against
+        calculator: Runs the strategy pipeline (the shared default calculator
+            unless custom strategies are given)
+        memo: Memo of pipeline prices bound to the price book, if any (never
+            used with custom strategies); also supplies the price book if none
+            is given
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        price_book: Optional[PriceBook] = None,
+        strategies: Optional[List[PricingStrategy]] = None,
+        memo: Optional[PriceMemo] = None,
+    ):
+        self.db = db
+        self.memo = memo if strategies is None else None
+        if price_book is None:
+            price_book = (
+                self.memo.price_book(db)
+                if self.memo is not None
+                else default_price_book(db)
+            )
+        self.price_book = price_book
+        self.calculator = (
+            PriceCalculator(strategies)
+            if strategies is not None
+            else default_calculator()
+        )
+        if self.memo is not None:
+            self.memo.bind(self.price_book.content_hash)
+
+    @property
+    def strategies(self) -> List[PricingStrategy]:
+        """Full strategy pipeline, in order."""
+        return self.calculator.strategies
+
+    def context(
+        self,
+        product_id: int,
+        length: Optional[float] = None,
+        material_override: Optional[str] = None,
+        specs: Optional[Dict[str, Any]] = None,
+    ) -> PricingContext:
+        """Build a pricing context for a product against the engine's price book."""
+        return PricingContext(
+            db=self.db,
+            product_id=product_id,
+            length_in=length,
+            material_override_code=material_override,
+            specs=specs or {},
+            price_book=self.price_book,
+        )
+
+    def price_product_cents(
+        self,
+        product_id: int,
+        length: Optional[float] = None,
+        material_override: Optional[str] = None,
+        specs: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Price a product with the strategy pipeline, in cents.
+
+        Args:
+            product_id: Unique identifier of the product
+            length: Length in inches (defaults to the product's base length)
+            material_override: Material code to override the product's material
+            specs: Product specifications including connection options
+
+        Returns:
+            int: Calculated price in cents
+
+        Raises:
+            ValueError: If the product, material, or options are invalid or
+            unavailable
+        """
+        memo_key = None
+        if self.memo is not None:
+            memo_key = price_memo_key(product_id, length, material_override, specs)
+            cents = self.memo.get(self.price_book.content_hash, memo_key)
+            if cents is not None:
+                return cents
+
+        context = self.context(product_id, length, material_override, specs)
+        self.calculator.calculate(context)
+        if memo_key is not None:
+            self.memo.put(self.price_book.content_hash, memo_key, context.price_cents)
+        return context.price_cents
+
+    def price_components_cents(
+        self,
+        product_id: int,
+        length: Optional[float] = None,
+        material_override: Optional[str] = None,
+        specs: Optional[Dict[str, Any]] = None,
+        strategies: Optional[Collection[Type[PricingStrategy]]] = None,
+    ) -> Dict[Type[PricingStrategy], int]:
+        """
+        Price strategies of a product's pipeline separately, in cents.
+
+        Takes the same arguments as price_product_cents plus the strategy types
+        to price (see PriceCalculator.calculate_components). Not memoized.
+
+        Returns:
+            Dict[Type[PricingStrategy], int]: Component in cents by strategy type
+
+        Raises:
+            ValueError: If the product, material, or options are invalid or
+            unavailable
+        """
+        context = self.context(product_id, length, material_override, specs)
+        return self.calculator.calculate_components(context, strategies)
+
+    def price_product(
+        self,
+        product_id: int,
+        length: Optional[float] = None,
+        material_override: Optional[str] = None,
+        specs: Optional[Dict[str, Any]] = None,
+    ) -> float:
+        """Price a product with the strategy pipeline, in dollars."""
+        return from_cents(
+            self.price_product_cents(product_id, length, material_override, specs)
+        )
+
+    def resolve_product(
+        self,
+        product_family_id: int,
+        voltage: Optional[str] = None,
+        material: Optional[str] = None,
+    ) -> Tuple[ProductEntry, Optional[str]]:
+        """
+        Resolve the product and material override that price a configuration.
+
+        Args:
+            product_family_id: ID of the product family
+            voltage: Voltage (any of the family's voltages if None)
+            material: Material code or name (the product's material if None)
+
+        Returns:
+            Tuple[ProductEntry, Optional[str]]: The product, and the material
+            code to price as an override (None if the product's own material)
+
+        Raises:
+            ValueError: If the family has no product for the voltage
+        """
+        material_code = self.price_book.resolve_material_code(material)
+        product = self.price_book.find_family_product(
+            product_family_id, voltage, material_code
+        )
+        if product is None:
+            raise ValueError(
+                f'No product found for product family {product_family_id} '
+                f'with voltage {voltage}'
+            )
+        if material_code == product.material:
+            material_code = None
+        return product, material_code
+
+    def option_cents(self, product_family: str, option_name: str, value: Any) -> int:
+        """
+        Get the adder for a selected option value, in cents.
+
+        Args:
+            product_family: Product family name the option belongs to
+            option_name: Name of the option
+            value: Selected value
+
+        Returns:
+            int: Adder for the value in cents, or 0 if the option or value has none
+        """
+        if not value:
+            return 0
+        option = self.price_book.find_option_by_name(option_name, product_family)
+        if option is None:
+            return 0
+        return to_cents(option.adders.get(str(value)))
+
+    def price_configuration(
+        self,
+        product_family_id: int,
+        voltage: Optional[str] = None,
+        material: Optional[str] = None,
+        length: Optional[float] = None,
+        specs: Optional[Dict[str, Any]] = None,
+        options: Optional[Mapping[str, Any]] = None,
+        product_family: Optional[str] = None,
+    ) -> ConfigurationPrice:
+        """
+        Price a configuration of a product family.
+
+        Args:
+            product_family_id: ID of the product family
+            voltage: Selected voltage
+            material: Selected material code or name
+            length: Length in inches (defaults to the product's base length)
+            specs: Connection specs (see connection_adder_key)
+            options: Other selected options, priced from their adders
+            product_family: Product family name the options belong to
+                (derived from the product's model number if omitted)
+
+        Returns:
+            ConfigurationPrice: Resolved product and itemized price
+
+        Raises:
+            ValueError: If the configuration cannot be priced
+        """
+        product, material_override = self.resolve_product(
+            product_family_id, voltage, material
+        )
+        product_cents = self.price_product_cents(
+            product.id, length, material_override, specs
+        )
+
+        family = product_family or product.product_type
+        return ConfigurationPrice(
+            product=product,
+            material_override=material_override,
+            product_cents=product_cents,
+            option_cents={
+                name: self.option_cents(family, name, value)
+                for name, value in (options or {}).items()
+            },
+        )
@@ -0,0 +1,180 @@
+"""
+Compiled extra length pricing rules.
+
+Extra length adders are stored as data (the length_adder_rules table, see
+src/core/models/length_adder_rule.py). When a PriceBook is built, the rules are
+compiled into one adder function per (product family, material): precedence,
+base lengths, units and rounding modes are all resolved up front, so pricing a
+length is a dictionary hit and a call with no rule matching left to do.
+
+Example:
+    >>> adders = compile_length_adders(resolve_length_rules(rules))
+    >>> adders[(None, "H")](36.0, 10.0)  # 2 full feet at $110/ft
+    220.0
+"""
+
+import math
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from src.core.models.length_adder_rule import LENGTH_UNITS, ROUNDING_MODES
+
+# adder(effective length, product base length) -> extra length adder in dollars
+LengthAdder = Callable[[float, float], float]
+
+INCHES_PER_UNIT = {'inch': 1.0, 'foot': 12.0}
+
+_ROUNDING = {
+    'exact': float,
+    'floor': lambda units: float(math.floor(units)),
+    'ceil': lambda units: float(math.ceil(units)),
+}
+
+# Rules in effect before they were stored as data. Price list snapshots
+# published before then carry no rules and are priced with these.
+LEGACY_LENGTH_RULES: Tuple[Tuple[Any, ...], ...] = (
+    # (family, material, base length, product base length, unit, rate, rounding)
+    (None, 'U', 4.0, None, 'inch', 40.0, 'exact'),
+    (None, 'T', 4.0, None, 'inch', 50.0, 'exact'),
+    (None, 'S', None, 10.0, 'inch', 3.75, 'exact'),
+    (None, 'H', None, None, 'foot', 110.0, 'floor'),
+    (None, 'TS', None, None, 'foot', 110.0, 'floor'),
+)
+
+
+@dataclass(frozen=True)
+class LengthRuleEntry:
+    """Snapshot of a LengthAdderRule row."""
+
+    product_family: Optional[str]
+    material_code: str
+    base_length: Optional[float]
+    product_base_length: Optional[float]
+    unit: str
+    rate: float
+    rounding: str
+
+    def __post_init__(self):
+        if self.unit not in LENGTH_UNITS:
+            raise ValueError(f'Unknown length adder unit: {self.unit}')
+        if self.rounding not in ROUNDING_MODES:
+            raise ValueError(f'Unknown length adder rounding mode: {self.rounding}')
+
+    def applies_to(self, product_base_length: float) -> bool:
+        """Whether the rule applies to a product with the given base length."""
+        return (
+            self.product_base_length is None
+            or self.product_base_length == product_base_length
+        )
+
+
+def compile_length_rule(rule: LengthRuleEntry) -> LengthAdder:
+    """
+    Compile one rule into an adder function.
+
+    Args:
+        rule: Rule to compile
+
+    Returns:
+        LengthAdder: Function of (effective length, product base length)
+    """
+    inches_per_unit = INCHES_PER_UNIT[rule.unit]
+    round_units = _ROUNDING[rule.rounding]
+    rate = rule.rate
+    fixed_base = rule.base_length
+
+    if fixed_base is None:
+
+        def adder(length: float, product_base_length: float) -> float:
+            extra = length - product_base_length
+            if extra <= 0:
+                return 0.0
+            return round_units(extra / inches_per_unit) * rate
+
+    else:
+
+        def adder(length: float, product_base_length: float) -> float:
+            extra = length - fixed_base
+            if extra <= 0:
+                return 0.0
+            return round_units(extra / inches_per_unit) * rate
+
+    return adder
+
+
+def _compile_chain(rules: Sequence[LengthRuleEntry]) -> LengthAdder:
+    """Compile the rules matching one (family, material), first match wins."""
+    fallback = next((r for r in rules if r.product_base_length is None), None)
+    conditional: Dict[float, LengthAdder] = {}
+    for rule in rules:
+        if rule is fallback:
+            break
+        conditional.setdefault(rule.product_base_length, compile_length_rule(rule))
+    fallback_adder = compile_length_rule(fallback) if fallback else None
+
+    if not conditional:
+        return fallback_adder
+
+    def adder(length: float, product_base_length: float) -> float:
+        rule_adder = conditional.get(product_base_length, fallback_adder)
+        return rule_adder(length, product_base_length) if rule_adder else 0.0
+
+    return adder
+
+
+def resolve_length_rules(
+    rules: Iterable[LengthRuleEntry],
+) -> Dict[Tuple[Optional[str], str], Tuple[LengthRuleEntry, ...]]:
+    """
+    Get the rules that apply to each (family, material), in precedence order.
+
+    Rules for a family come before the defaults (rules with no family);
+    within each, rules restricted to a product base length come first. The
+    defaults alone are resolved under the family None, for families without
+    rules of their own.
+
+    Args:
+        rules: All rules
+
+    Returns:
+        Dict[Tuple[Optional[str], str], Tuple[LengthRuleEntry, ...]]: Rules by
+        (family, material code); pairs without rules are omitted
+    """
+    rules = list(rules)
+    resolved: Dict[Tuple[Optional[str], str], Tuple[LengthRuleEntry, ...]] = {}
+    for family in {r.product_family for r in rules} | {None}:
+        by_material: Dict[str, List[LengthRuleEntry]] = {}
+        for scope in dict.fromkeys((family, None)):
+            scoped = [r for r in rules if r.product_family == scope]
+            scoped.sort(key=lambda r: r.product_base_length is None)
+            for rule in scoped:
+                by_material.setdefault(rule.material_code, []).append(rule)
+        for material_code, chain in by_material.items():
+            resolved[(family, material_code)] = tuple(chain)
+    return resolved
+
+
+def compile_length_adders(
+    rules: Mapping[Tuple[Optional[str], str], Sequence[LengthRuleEntry]],
+) -> Dict[Tuple[Optional[str], str], LengthAdder]:
+    """
+    Compile resolved rules into one adder function per (family, material).
+
+    Args:
+        rules: Rules by (family, material code), as from resolve_length_rules
+
+    Returns:
+        Dict[Tuple[Optional[str], str], LengthAdder]: Adder functions by
+        (family, material)
+    """
+    return {key: _compile_chain(chain) for key, chain in rules.items()}
@@ -0,0 +1,159 @@
+"""
+Compiled pricing strategy pipelines.
+
+PriceCalculator runs the pricing strategies in order, but not all of them on
+every call: strategies that cannot change the price of a configuration (the
+material availability check without a material override, the connection
+adder without a connection spec) are pruned. Which strategies apply depends
+only on the shape of the inputs (PipelineKey), so the pruned pipeline is
+compiled once per key and cached on the calculator.
+
+The product type itself is parsed from the model number once per product,
+when the price book is built (ProductEntry.product_type), so the strategies
+never parse model numbers.
+
+Example:
+    >>> calculator = default_calculator()
+    >>> price = calculator.calculate(engine.context(product_id, 24.0))
+"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Collection, Dict, List, Optional, Tuple, Type
+
+from src.core.pricing.context import PricingContext
+from src.core.pricing.strategies import (
+    BasePriceStrategy,
+    ConnectionOptionStrategy,
+    ExtraLengthStrategy,
+    MaterialAvailabilityStrategy,
+    MaterialPremiumStrategy,
+    NonStandardLengthSurchargeStrategy,
+    PipelineKey,
+    PricingStrategy,
+)
+from src.core.pricing.trace import PriceBreakdown, StrategyTrace, count_statements
+
+
+def default_strategies() -> List[PricingStrategy]:
+    """Build the standard pricing pipeline. The order is critical."""
+    return [
+        MaterialAvailabilityStrategy(),
+        BasePriceStrategy(),
+        MaterialPremiumStrategy(),
+        ExtraLengthStrategy(),
+        NonStandardLengthSurchargeStrategy(),
+        ConnectionOptionStrategy(),
+    ]
+
+
+class PriceCalculator:
+    """
+    Runs a strategy pipeline, compiled and cached per PipelineKey.
+
+    Strategies must be stateless: one calculator (and its strategies) is
+    shared by every engine using the default pipeline.
+
+    Attributes:
+        strategies: Full strategy pipeline, in order
+    """
+
+    def __init__(self, strategies: List[PricingStrategy]):
+        self.strategies = strategies
+        self._lock = threading.Lock()
+        self._pipelines: Dict[PipelineKey, Tuple[PricingStrategy, ...]] = {}
+        self._stages: Dict[
+            PipelineKey, Tuple[Callable[[PricingContext], float], ...]
+        ] = {}
+
+    def pipeline(self, key: PipelineKey) -> Tuple[PricingStrategy, ...]:
+        """Get the compiled pipeline for a key: the strategies that apply, in order."""
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            compiled = tuple(s for s in self.strategies if s.applies(key))
+            with self._lock:
+                pipeline = self._pipelines.setdefault(key, compiled)
+                self._stages.setdefault(key, tuple(s.calculate for s in pipeline))
+        return pipeline
+
+    def calculate(self, context: PricingContext) -> float:
+        key = PipelineKey.for_context(context)
+        stages = self._stages.get(key)
+        if stages is None:
+            self.pipeline(key)
+            stages = self._stages[key]
+        for stage in stages:
+            stage(context)
+        return context.price
+
+    def calculate_components(
+        self,
+        context: PricingContext,
+        strategies: Optional[Collection[Type[PricingStrategy]]] = None,
+    ) -> Dict[Type[PricingStrategy], int]:
+        """
+        Price strategies of the compiled pipeline separately, in cents.
+
+        The strategies are additive: each adds its component whatever the price
+        so far (the base price strategy sets it), so pricing each one from zero
+        gives components that sum to the pipeline price. Callers keeping a
+        ledger of components reprice only those whose inputs changed.
+
+        Args:
+            context: Pricing context to run the strategies on
+            strategies: Strategy types to price (every one in the pipeline if
+                        None); types pruned from the pipeline are left out,
+                        as they add nothing
+
+        Returns:
+            Dict[Type[PricingStrategy], int]: Component in cents by strategy type
+        """
+        components: Dict[Type[PricingStrategy], int] = {}
+        for strategy in self.pipeline(PipelineKey.for_context(context)):
+            if strategies is None or type(strategy) in strategies:
+                context.price_cents = 0
+                strategy.calculate(context)
+                components[type(strategy)] = context.price_cents
+        context.price_cents = sum(components.values())
+        return components
+
+    def calculate_with_trace(
+        self, context: PricingContext, breakdown: Optional[PriceBreakdown] = None
+    ) -> PriceBreakdown:
+        """
+        Run the strategies while recording a per-strategy trace.
+
+        Args:
+            context: Pricing context to run the strategies on
+            breakdown: Breakdown to append the strategy traces to (a new one is
+                       created if omitted)
+
+        Returns:
+            PriceBreakdown: Final price plus the delta, wall time and SQL statement
+            count of every strategy in the compiled pipeline
+        """
+        breakdown = breakdown if breakdown is not None else PriceBreakdown()
+        with count_statements(context.db) as statements:
+            for strategy in self.pipeline(PipelineKey.for_context(context)):
+                price_before = context.price
+                issued_before = statements.count
+                start = time.perf_counter()
+                strategy.calculate(context)
+                breakdown.steps.append(
+                    StrategyTrace(
+                        strategy=type(strategy).__name__,
+                        price_before=price_before,
+                        price_after=context.price,
+                        elapsed_ms=(time.perf_counter() - start) * 1000.0,
+                        sql_statements=statements.count - issued_before,
+                    )
+                )
+        breakdown.final_price = context.price
+        return breakdown
+
+
+@lru_cache(maxsize=None)
+def default_calculator() -> PriceCalculator:
+    """Get the shared calculator for the standard pipeline."""
+    return PriceCalculator(default_strategies())
@@ -0,0 +1,557 @@
+"""
+In-memory price book for the pricing engine.
+
+This module provides an immutable snapshot of the catalog rows the pricing
+strategies need (products, materials, material options, standard lengths,
+configurable options and extra length rules). The snapshot is loaded once with
+one query per table and indexed into dictionaries, so pricing a configuration
+against it does not touch the database at all. Each book carries a content
+hash of its rows, which identifies the catalog state it prices (see
+price_memo.py).
+
+Callers that do not pass a book share the default book of their database
+(default_price_book), so pricing one configuration does not reload the
+catalog. The default book is dropped whenever a flush changes a catalog table
+through the ORM, and reloaded once it is older than DEFAULT_BOOK_MAX_AGE
+seconds, so changes made by another process or by bulk statements are seen
+after at most that long (call invalidate_default_price_books to see them
+at once).
+
+Example:
+    >>> db = SessionLocal()
+    >>> book = PriceBook.load(db)
+    >>> prices = [
+    ...     calculate_product_price(db, item.product_id, item.length, price_book=book)
+    ...     for item in quote.items
+    ... ]
+"""
+
+import hashlib
+import json
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.models import (
+    LengthAdderRule,
+    Material,
+    MaterialOption,
+    Option,
+    OptionProductFamily,
+    Product,
+    StandardLength,
+    StandardLengthIndex,
+)
+from src.core.models.option import parse_product_families
+from src.core.models.precomputed_price import CATALOG_MODELS
+from src.core.pricing.length_rules import (
+    LEGACY_LENGTH_RULES,
+    LengthAdder,
+    LengthRuleEntry,
+    compile_length_adders,
+    resolve_length_rules,
+)
+
+
+def product_type_for(model_number: str) -> str:
+    """Get the product type (family name) from a product model number."""
+    product_type = model_number.split("-")[0]
+
+    # Handle special cases for dual point switches
+    if product_type == "LS7000" and "/2" in model_number:
+        product_type = "LS7000/2"
+    return product_type
+
+
+def catalog_hash(rows: Mapping[str, Iterable[Sequence[Any]]]) -> str:
+    """
+    Get a content hash of catalog rows.
+
+    The hash does not depend on the order of tables or rows, and rows decoded
+    from a JSON snapshot hash like the rows they were encoded from.
+
+    Args:
+        rows: Rows of each catalog table, as returned by PriceBook.query_rows
+
+    Returns:
+        str: Hex SHA-256 digest of the rows
+    """
+    digest = hashlib.sha256()
+    for table in sorted(rows):
+        digest.update(table.encode())
+        for row in sorted(
+            json.dumps(list(row), default=str, sort_keys=True) for row in rows[table]
+        ):
+            digest.update(row.encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ProductEntry:
+    """
+    Snapshot of the Product columns used by the pricing strategies.
+
+    The product type (e.g. "LS7000/2") and model series (the model number
+    prefix, e.g. "LS7000") are parsed from the model number once, when the
+    entry is created.
+    """
+
+    id: int
+    model_number: str
+    base_price: float
+    base_length: Optional[float]
+    voltage: Optional[str]
+    material: Optional[str]
+    product_family_id: int
+    product_type: str = field(init=False, compare=False)
+    model_series: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "product_type", product_type_for(self.model_number))
+        object.__setattr__(self, "model_series", self.model_number.split("-")[0])
+
+
+@dataclass(frozen=True)
+class MaterialEntry:
+    """Snapshot of the Material columns used by the pricing strategies."""
+
+    code: str
+    name: str
+    base_length: Optional[float]
+    length_adder_per_inch: float
+    length_adder_per_foot: float
+    has_nonstandard_length_surcharge: bool
+    nonstandard_length_surcharge: float
+    base_price_adder: float
+
+
+@dataclass(frozen=True)
+class OptionEntry:
+    """Snapshot of an Option row (choices and adders made read-only)."""
+
+    id: int
+    name: str
+    category: Optional[str]
+    product_families: Tuple[str, ...]
+    choices: Tuple[str, ...]
+    adders: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class PriceBook:
+    """
+    Immutable, fully indexed snapshot of the pricing catalog.
+
+    All lookups are dictionary hits. Build a book with ``PriceBook.load(db)``
+    and share it across every price calculated for the same catalog state
+    (e.g. all lines of a quote).
+
+    Attributes:
+        products: Product entries by product ID
+        products_by_config: Product entries by (model_number, voltage, material)
+        family_products: Product entries of each product family ID, by ID
+        materials: Material entries by material code
+        material_codes: Material codes by material name
+        material_premiums: MaterialOption base price by (family ID, material code),
+            available options only
+        standard_lengths: Sorted standard length index by material code
+        options: Option entries by (name, category, product family)
+        options_by_name: Option entries by (name, product family), any category
+        length_rules: Extra length rules by (product family, material code), in
+            precedence order; family None holds the defaults
+        length_adders: Compiled extra length adders, keyed like length_rules
+        content_hash: Content hash of the rows the book was built from (see
+            catalog_hash)
+    """
+
+    products: Mapping[int, ProductEntry]
+    products_by_config: Mapping[Tuple[str, Optional[str], Optional[str]], ProductEntry]
+    family_products: Mapping[int, Tuple[ProductEntry, ...]]
+    materials: Mapping[str, MaterialEntry]
+    material_codes: Mapping[str, str]
+    material_premiums: Mapping[Tuple[int, str], float]
+    standard_lengths: StandardLengthIndex
+    options: Mapping[Tuple[str, Optional[str], str], OptionEntry]
+    options_by_name: Mapping[Tuple[str, str], OptionEntry]
+    length_rules: Mapping[Tuple[Optional[str], str], Tuple[LengthRuleEntry, ...]]
+    length_adders: Mapping[Tuple[Optional[str], str], LengthAdder]
+    content_hash: str = field(default="", compare=False)
+
+    @classmethod
+    def load(cls, db: Session) -> "PriceBook":
+        """
+        Load a price book from the database.
+
+        Issues exactly one query per catalog table and selects only the columns
+        the strategies use, so no ORM objects are hydrated.
+
+        Args:
+            db: SQLAlchemy database session
+
+        Returns:
+            PriceBook: A new immutable snapshot of the catalog
+        """
+        return cls.from_rows(cls.query_rows(db))
+
+    @staticmethod
+    def query_rows(db: Session) -> Dict[str, List[Tuple[Any, ...]]]:
+        """
+        Query the catalog rows a price book is built from.
+
+        The result is plain tuples per table, so it can be stored as a JSON
+        snapshot and rebuilt later with ``from_rows``.
+
+        Args:
+            db: SQLAlchemy database session
+
+        Returns:
+            Dict[str, List[Tuple[Any, ...]]]: Rows of each catalog table
+        """
+        queries = {
+            "products": db.query(
+                Product.id,
+                Product.model_number,
+                Product.base_price,
+                Product.base_length,
+                Product.voltage,
+                Product.material,
+                Product.product_family_id,
+            ).order_by(Product.id),
+            "materials": db.query(
+                Material.code,
+                Material.name,
+                Material.base_length,
+                Material.length_adder_per_inch,
+                Material.length_adder_per_foot,
+                Material.has_nonstandard_length_surcharge,
+                Material.nonstandard_length_surcharge,
+                Material.base_price_adder,
+            ),
+            "material_premiums": db.query(
+                MaterialOption.product_family_id,
+                MaterialOption.material_code,
+                MaterialOption.base_price,
+            )
+            .filter(MaterialOption.is_available == 1)
+            .order_by(MaterialOption.id),
+            "standard_lengths": db.query(
+                StandardLength.material_code,
+                StandardLength.length,
+                StandardLength.tolerance,
+            ),
+            "options": db.query(
+                OptionProductFamily.product_family,
+                Option.id,
+                Option.name,
+                Option.category,
+                Option.product_families,
+                Option.choices,
+                Option.adders,
+            )
+            .join(Option, Option.id == OptionProductFamily.option_id)
+            .order_by(Option.id),
+            "length_rules": db.query(
+                LengthAdderRule.product_family,
+                LengthAdderRule.material_code,
+                LengthAdderRule.base_length,
+                LengthAdderRule.product_base_length,
+                LengthAdderRule.unit,
+                LengthAdderRule.rate,
+                LengthAdderRule.rounding,
+            ).order_by(LengthAdderRule.id),
+        }
+        return {
+            table: [tuple(row) for row in query] for table, query in queries.items()
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Mapping[str, Iterable[Sequence[Any]]]) -> "PriceBook":
+        """
+        Build a price book from catalog rows.
+
+        Args:
+            rows: Rows of each catalog table, as returned by ``query_rows``
+                  (or the same rows decoded from a JSON snapshot). Snapshots
+                  without length rules, and databases whose length rule
+                  table is empty, are priced with LEGACY_LENGTH_RULES.
+
+        Returns:
+            PriceBook: A new immutable snapshot of the catalog
+        """
+        rows = {table: list(table_rows) for table, table_rows in rows.items()}
+        products: Dict[int, ProductEntry] = {}
+        products_by_config: Dict[
+            Tuple[str, Optional[str], Optional[str]], ProductEntry
+        ] = {}
+        family_products: Dict[int, List[ProductEntry]] = {}
+        for row in rows["products"]:
+            entry = ProductEntry(*row)
+            products[entry.id] = entry
+            # Keep the first match, as the previous .first() lookup did
+            products_by_config.setdefault(
+                (entry.model_number, entry.voltage, entry.material), entry
+            )
+            family_products.setdefault(entry.product_family_id, []).append(entry)
+
+        materials = {
+            code: MaterialEntry(
+                code=code,
+                name=name,
+                base_length=base_length,
+                length_adder_per_inch=per_inch or 0.0,
+                length_adder_per_foot=per_foot or 0.0,
+                has_nonstandard_length_surcharge=bool(has_surcharge),
+                nonstandard_length_surcharge=surcharge or 0.0,
+                base_price_adder=base_price_adder or 0.0,
+            )
+            for (
+                code,
+                name,
+                base_length,
+                per_inch,
+                per_foot,
+                has_surcharge,
+                surcharge,
+                base_price_adder,
+            ) in rows["materials"]
+        }
+
+        material_codes: Dict[str, str] = {}
+        for entry in materials.values():
+            material_codes.setdefault(entry.name, entry.code)
+
+        material_premiums: Dict[Tuple[int, str], float] = {}
+        for family_id, material_code, base_price in rows["material_premiums"]:
+            material_premiums.setdefault((family_id, material_code), base_price or 0.0)
+
+        standard_lengths = StandardLengthIndex(
+            (
+                (material_code, None, length, tolerance)
+                for material_code, length, tolerance in rows["standard_lengths"]
+            ),
+            material_codes=materials,
+        )
+
+        options: Dict[Tuple[str, Optional[str], str], OptionEntry] = {}
+        options_by_name: Dict[Tuple[str, str], OptionEntry] = {}
+        entries: Dict[int, OptionEntry] = {}
+        for (
+            product_family,
+            option_id,
+            name,
+            category,
+            product_families,
+            choices,
+            adders,
+        ) in rows["options"]:
+            entry = entries.get(option_id)
+            if entry is None:
+                entry = entries[option_id] = OptionEntry(
+                    id=option_id,
+                    name=name,
+                    category=category,
+                    product_families=parse_product_families(product_families),
+                    choices=tuple(choices or ()),
+                    adders=MappingProxyType(dict(adders or {})),
+                )
+            options.setdefault((entry.name, entry.category, product_family), entry)
+            options_by_name.setdefault((entry.name, product_family), entry)
+
+        length_rules = resolve_length_rules(
+            LengthRuleEntry(*row)
+            # An empty table would otherwise price every extra length at $0
+            for row in rows.get("length_rules") or LEGACY_LENGTH_RULES
+        )
+
+        return cls(
+            products=MappingProxyType(products),
+            products_by_config=MappingProxyType(products_by_config),
+            family_products=MappingProxyType(
+                {
+                    family_id: tuple(entries)
+                    for family_id, entries in family_products.items()
+                }
+            ),
+            materials=MappingProxyType(materials),
+            material_codes=MappingProxyType(material_codes),
+            material_premiums=MappingProxyType(material_premiums),
+            standard_lengths=standard_lengths,
+            options=MappingProxyType(options),
+            options_by_name=MappingProxyType(options_by_name),
+            length_rules=MappingProxyType(length_rules),
+            length_adders=MappingProxyType(compile_length_adders(length_rules)),
+            content_hash=catalog_hash(rows),
+        )
+
+    def get_product(self, product_id: int) -> Optional[ProductEntry]:
+        """Get a product entry by ID."""
+        return self.products.get(product_id)
+
+    def find_product(
+        self, model_number: str, voltage: Optional[str], material: Optional[str]
+    ) -> Optional[ProductEntry]:
+        """Get the product entry for a model number, voltage and material."""
+        return self.products_by_config.get((model_number, voltage, material))
+
+    def find_family_product(
+        self,
+        product_family_id: int,
+        voltage: Optional[str],
+        material: Optional[str],
+    ) -> Optional[ProductEntry]:
+        """
+        Get the product a family prices a voltage and material from.
+
+        Prefers the product with exactly that voltage and material. Otherwise
+        falls back to the family's product for the voltage in Stainless Steel
+        (or any material), which is priced with the material as an override.
+        A voltage of None matches any voltage.
+
+        Returns:
+            Optional[ProductEntry]: Matching product, or None if the family has
+            no product for the voltage
+        """
+        candidates = [
+            entry
+            for entry in self.family_products.get(product_family_id, ())
+            if voltage is None or entry.voltage == voltage
+        ]
+        for preferred in (material, "S"):
+            for entry in candidates:
+                if entry.material == preferred:
+                    return entry
+        return candidates[0] if candidates else None
+
+    def get_material(self, code: str) -> Optional[MaterialEntry]:
+        """Get a material entry by code."""
+        return self.materials.get(code)
+
+    def resolve_material_code(self, material: Optional[str]) -> Optional[str]:
+        """Get the material code for a material code or name (unchanged if unknown)."""
+        if material is None or material in self.materials:
+            return material
+        return self.material_codes.get(material, material)
+
+    def get_material_premium(
+        self, product_family_id: int, material_code: str
+    ) -> Optional[float]:
+        """Get the available material premium for a product family, if any."""
+        return self.material_premiums.get((product_family_id, material_code))
+
+    def get_standard_lengths(self, material_code: str) -> Tuple[float, ...]:
+        """Get the sorted standard lengths for a material."""
+        return self.standard_lengths.lengths(material_code)
+
+    def is_standard_length(
+        self, material_code: str, length: float, product_family: Optional[str] = None
+    ) -> bool:
+        """Check if a length is standard (within tolerance) for a material."""
+        return self.standard_lengths.is_standard(material_code, length, product_family)
+
+    def find_option(
+        self, name: str, category: Optional[str], product_family: str
+    ) -> Optional[OptionEntry]:
+        """Get the option with the given name and category for a product family."""
+        return self.options.get((name, category, product_family))
+
+    def find_option_by_name(
+        self, name: str, product_family: str
+    ) -> Optional[OptionEntry]:
+        """Get the first option with the given name for a product family."""
+        return self.options_by_name.get((name, product_family))
+
+    def length_adder(
+        self, product_family: str, material_code: str
+    ) -> Optional[LengthAdder]:
+        """Get the compiled extra length adder for a family and material, if any."""
+        adder = self.length_adders.get((product_family, material_code))
+        if adder is None:
+            adder = self.length_adders.get((None, material_code))
+        return adder
+
+    def get_length_rules(
+        self, product_family: str, material_code: str
+    ) -> Tuple[LengthRuleEntry, ...]:
+        """Get the extra length rules for a family and material, in precedence order."""
+        rules = self.length_rules.get((product_family, material_code))
+        if rules is None:
+            rules = self.length_rules.get((None, material_code), ())
+        return rules
+
+
+# Seconds a default price book is reused before the catalog is reloaded
+DEFAULT_BOOK_MAX_AGE = 60.0
+
+# (load time, book) of each database bind, see default_price_book
+_default_books: "weakref.WeakKeyDictionary[Any, Tuple[float, PriceBook]]" = (
+    weakref.WeakKeyDictionary()
+)
+_default_books_lock = threading.Lock()
+_default_books_generation = 0
+
+
+def default_price_book(db: Session, max_age: float = DEFAULT_BOOK_MAX_AGE) -> PriceBook:
+    """
+    Get the shared price book of a session's database, loading it if needed.
+
+    Args:
+        db: SQLAlchemy database session
+        max_age: Seconds a cached book is reused before it is reloaded
+
+    Returns:
+        PriceBook: Snapshot of the catalog, shared by every session on the
+        same database bind
+    """
+    bind = db.get_bind()
+    with _default_books_lock:
+        cached = _default_books.get(bind)
+        generation = _default_books_generation
+    if cached is not None and time.monotonic() - cached[0] <= max_age:
+        return cached[1]
+
+    loaded_at = time.monotonic()
+    book = PriceBook.load(db)
+    with _default_books_lock:
+        # Do not cache a book loaded while the catalog was being changed
+        if generation == _default_books_generation:
+            _default_books[bind] = (loaded_at, book)
+    return book
+
+
+def invalidate_default_price_books() -> None:
+    """Drop the default price books, so the next price reloads the catalog."""
+    global _default_books_generation
+    with _default_books_lock:
+        _default_books.clear()
+        _default_books_generation += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_catalog_change(session, flush_context):
+    """Drop the default price books when a flush changes the pricing catalog."""
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, CATALOG_MODELS):
+            if instance in session.dirty and not session.is_modified(instance):
+                continue
+            session.info["catalog_changed"] = True
+            invalidate_default_price_books()
+            return
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_catalog_transaction_end(session):
+    """
+    Drop the default price books again when a catalog change ends.
+
+    Books loaded between the flush and the commit saw the old catalog (other
+    connections) or the uncommitted one (the flushing session).
+    """
+    if session.info.pop("catalog_changed", False):
+        invalidate_default_price_books()
@@ -0,0 +1,174 @@
+"""
+Effective-dated price list versions.
+
+Publishing a price list stores an immutable snapshot of the pricing catalog
+(the rows a PriceBook is built from) under a version label and effective date.
+PriceListRegistry resolves a date to the version in effect with one indexed
+query and keeps every version it has loaded as an in-memory PriceBook, so
+pricing "as of" a date never reloads the catalog. Because versions never change,
+a loaded book never goes stale; versions published by other processes are found
+by the next lookup.
+
+Example:
+    >>> publish_price_list(db, "2026-04", date(2026, 4, 1), notes="April list")
+    >>> db.commit()
+    >>> calculate_product_price(db, product_id, 24.0, as_of=date(2026, 3, 15))
+    >>> prices = compare_price_lists(db, batch, [date(2026, 3, 31), date(2026, 4, 1)])
+"""
+
+import threading
+import weakref
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.core.models import PriceListVersion
+from src.core.pricing.batch import PricingBatch, price_many
+from src.core.pricing.price_book import PriceBook
+
+
+class PriceListRegistry:
+    """
+    Resolves dates to price list versions and caches their price books.
+
+    Only the immutable version snapshots are cached, per database bind; which
+    version is in effect on a date is looked up on every call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._books: "weakref.WeakKeyDictionary[Any, Dict[int, PriceBook]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def version_id_as_of(self, db: Session, as_of: date) -> int:
+        """
+        Get the ID of the price list version in effect on a date.
+
+        Raises:
+            ValueError: If no version is in effect on the date
+        """
+        if isinstance(as_of, datetime):
+            as_of = as_of.date()
+        version_id = (
+            db.query(PriceListVersion.id)
+            .filter(PriceListVersion.effective_date <= as_of)
+            .order_by(PriceListVersion.effective_date.desc())
+            .limit(1)
+            .scalar()
+        )
+        if version_id is None:
+            raise ValueError(f'No price list is in effect on {as_of}')
+        return version_id
+
+    def book(self, db: Session, version_id: int) -> PriceBook:
+        """Get the price book of a version, loading its snapshot on first use."""
+        bind = db.get_bind()
+        with self._lock:
+            book = self._books.get(bind, {}).get(version_id)
+        if book is None:
+            version = db.get(PriceListVersion, version_id)
+            if version is None:
+                raise ValueError(f'Price list version {version_id} not found')
+            book = PriceBook.from_rows(version.snapshot)
+            with self._lock:
+                books = self._books.setdefault(bind, {})
+                book = books.setdefault(version_id, book)
+        return book
+
+    def book_as_of(self, db: Session, as_of: date) -> PriceBook:
+        """Get the price book of the price list in effect on a date."""
+        return self.book(db, self.version_id_as_of(db, as_of))
+
+    def publish(
+        self,
+        db: Session,
+        version: str,
+        effective_date: date,
+        notes: Optional[str] = None,
+    ) -> PriceListVersion:
+        """
+        Snapshot the current catalog as a new price list version.
+
+        The version is flushed but not committed; the caller commits it.
+
+        Args:
+            db: SQLAlchemy database session
+            version: Unique version label (e.g., "2026-04")
+            effective_date: First day the price list is in effect
+            notes: Optional description of the changes
+
+        Returns:
+            PriceListVersion: The published version
+
+        Raises:
+            ValueError: If a version with the label or effective date exists
+        """
+        existing = (
+            db.query(PriceListVersion.id)
+            .filter(
+                (PriceListVersion.version == version)
+                | (PriceListVersion.effective_date == effective_date)
+            )
+            .first()
+        )
+        if existing:
+            raise ValueError(
+                f'A price list version {version} or effective on '
+                f'{effective_date} already exists'
+            )
+
+        snapshot = {
+            table: [list(row) for row in rows]
+            for table, rows in PriceBook.query_rows(db).items()
+        }
+        price_list = PriceListVersion(
+            version=version,
+            effective_date=effective_date,
+            notes=notes,
+            snapshot=snapshot,
+        )
+        db.add(price_list)
+        db.flush()
+        return price_list
+
+
+# Registry shared by calculate_product_price(as_of=...) and the helpers below
+registry = PriceListRegistry()
+
+
+def publish_price_list(
+    db: Session, version: str, effective_date: date, notes: Optional[str] = None
+) -> PriceListVersion:
+    """Snapshot the current catalog as a new price list version (not committed)."""
+    return registry.publish(db, version, effective_date, notes)
+
+
+def price_book_as_of(db: Session, as_of: date) -> PriceBook:
+    """Get the price book of the price list in effect on a date."""
+    return registry.book_as_of(db, as_of)
+
+
+def compare_price_lists(
+    db: Session, batch: PricingBatch, dates: Sequence[date]
+) -> Dict[date, np.ndarray]:
+    """
+    Price one batch of configurations under the price lists of several dates.
+
+    Rows that are invalid under a price list (e.g. a product it does not
+    contain) are NaN in that list's prices.
+
+    Args:
+        db: SQLAlchemy database session
+        batch: Configurations to price
+        dates: Dates whose price lists to price under
+
+    Returns:
+        Dict[date, np.ndarray]: Prices per row of the batch, for each date
+    """
+    return {
+        as_of: price_many(db, batch, price_book_as_of(db, as_of), strict=False)
+        for as_of in dates
+    }
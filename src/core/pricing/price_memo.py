@@ -0,0 +1,391 @@
+"""
+Persistent memo of computed prices.
+
+PriceMemo remembers the strategy pipeline price of every configuration an
+engine prices and keeps it on disk between application runs, so a fresh engine
+answers configurations priced in earlier sessions without running the
+strategies again.
+
+Entries are keyed by the content hash of the catalog they were priced against
+(PriceBook.content_hash) plus a normalized configuration key. Binding the memo
+to a price book with a different hash drops every entry of the old catalog, so
+a catalog change invalidates the memo without any bookkeeping. Lookups and
+stores also carry the content hash of the calling engine's catalog and are
+ignored unless it is the bound one, so an engine still holding an older
+catalog can neither read nor store prices under the current hash. The memo holds
+at most ``max_entries`` prices, evicting the least recently used ones both in
+memory and on disk.
+
+The memo file also keeps the rows of the price book last loaded from its
+database, tagged with the catalog revision they were loaded at (see
+src/core/models/catalog_revision.py). ``price_book()`` rebuilds the book from
+those rows for as long as the revision is unchanged, so a fresh process checks
+one counter instead of querying every catalog table before its first price.
+
+Each database has its own memo file next to it (see ``price_memo_path``), so
+processes pricing different databases never overwrite each other's entries;
+the memo of an in-memory database is never written to disk. The memo is read
+from disk when it is bound and written back by ``save()``; the shared memos
+(``default_price_memo``) are saved when the application exits.
+
+Example:
+    >>> memo = default_price_memo(db)
+    >>> engine = PricingEngine(db, memo=memo)
+    >>> engine.price_product(product_id, 24.0)  # priced, then memoized
+    >>> memo.save()
+"""
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.orm import Session
+
+from src.core.models.catalog_revision import catalog_revision
+from src.core.pricing.price_book import PriceBook, default_price_book
+from src.core.pricing.strategies import connection_adder_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_memo (
+    catalog_hash TEXT NOT NULL,
+    config_key TEXT NOT NULL,
+    price_cents INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (catalog_hash, config_key)
+) WITHOUT ROWID
+"""
+
+_SNAPSHOT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_book_snapshot (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    catalog_revision INTEGER NOT NULL,
+    rows TEXT NOT NULL
+)
+"""
+
+
+def price_memo_path(url: Union[str, URL]) -> Optional[Path]:
+    """
+    Get the memo file of a database.
+
+    The memo of a SQLite database file is stored next to it, e.g.
+    data/quotes.db -> data/quotes_price_memo.db.
+
+    Args:
+        url: URL of the database
+
+    Returns:
+        Optional[Path]: Memo file, or None for an in-memory or non-SQLite
+        database
+    """
+    url = make_url(url)
+    database = url.database or ""
+    if url.get_backend_name() != "sqlite" or database in ("", ":memory:"):
+        return None
+    if database.startswith("file:"):
+        if url.query.get("mode") == "memory":
+            return None
+        database = database[len("file:") :]
+    path = Path(database)
+    return path.with_name(f"{path.stem}_price_memo.db")
+
+
+def price_memo_key(
+    product_id: int,
+    length: Optional[float] = None,
+    material_override: Optional[str] = None,
+    specs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build the normalized memo key of a strategy pipeline configuration.
+
+    Specs are reduced to the connection adder key, the only part of them the
+    strategies price, so equivalent specs share one entry.
+
+    Returns:
+        str: Key of the configuration, e.g. '12|24.0|H|TriClamp_1.5"'
+    """
+    return "|".join(
+        (
+            str(product_id),
+            "" if length is None else repr(float(length)),
+            material_override or "",
+            connection_adder_key(specs or {}) or "",
+        )
+    )
+
+
+class PriceMemo:
+    """
+    LRU memo of prices in cents, persisted to a SQLite file.
+
+    Safe to share between threads; the file is only opened while loading and
+    saving.
+
+    Attributes:
+        path: SQLite file the memo is stored in, or None to keep it in memory
+        max_entries: Maximum number of prices kept
+        catalog_hash: Content hash of the catalog the memo is bound to
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self.catalog_hash: Optional[str] = None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._touched: Dict[str, None] = {}
+        # (catalog revision, book) of the last price book built by price_book
+        self._book: Optional[Tuple[int, PriceBook]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute(_SCHEMA)
+        connection.execute(_SNAPSHOT_SCHEMA)
+        return connection
+
+    def price_book(self, db: Session) -> PriceBook:
+        """
+        Get the price book of the memo's database.
+
+        The catalog is only queried when its revision differs from the one
+        the stored snapshot was loaded at. Databases without a catalog
+        revision, and sessions with uncommitted catalog changes, get the
+        shared default book instead (see default_price_book).
+
+        Args:
+            db: SQLAlchemy database session on the memo's database
+
+        Returns:
+            PriceBook: Snapshot of the catalog at its current revision
+        """
+        # Read the revision before the rows, so a snapshot is never tagged
+        # with a revision older than the rows it holds
+        revision = catalog_revision(db)
+        if revision is None or db.info.get("catalog_changed"):
+            return default_price_book(db)
+
+        with self._lock:
+            if self._book is not None and self._book[0] == revision:
+                return self._book[1]
+
+        rows = self._load_snapshot(revision)
+        if rows is None:
+            rows = PriceBook.query_rows(db)
+            self._save_snapshot(revision, rows)
+        book = PriceBook.from_rows(rows)
+        with self._lock:
+            self._book = (revision, book)
+        return book
+
+    def _load_snapshot(self, revision: int) -> Optional[Dict[str, List[Any]]]:
+        """Read the stored price book rows if they are of the given revision."""
+        if self.path is None or not self.path.exists():
+            return None
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT rows FROM price_book_snapshot WHERE catalog_revision = ?",
+                    (revision,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load price book snapshot {self.path}: {e!s}")
+            return None
+        return json.loads(row[0]) if row is not None else None
+
+    def _save_snapshot(self, revision: int, rows: Dict[str, List[Any]]) -> None:
+        """Store the price book rows of a catalog revision."""
+        if self.path is None:
+            return
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO price_book_snapshot "
+                    "(id, catalog_revision, rows) VALUES (1, ?, ?)",
+                    (revision, json.dumps(rows, default=str)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save price book snapshot {self.path}: {e!s}")
+
+    def bind(self, catalog_hash: str) -> None:
+        """
+        Bind the memo to a catalog, loading its stored prices.
+
+        Does nothing if the memo is already bound to the catalog. Otherwise
+        the prices of the previous catalog are dropped (and deleted from disk
+        on the next save).
+
+        Args:
+            catalog_hash: Content hash of the catalog (PriceBook.content_hash)
+        """
+        with self._lock:
+            if catalog_hash == self.catalog_hash:
+                return
+            self.catalog_hash = catalog_hash
+            self._entries.clear()
+            self._touched.clear()
+            if self.path is None or not self.path.exists():
+                return
+            try:
+                with closing(self._connect()) as connection, connection:
+                    rows = connection.execute(
+                        "SELECT config_key, price_cents FROM price_memo "
+                        "WHERE catalog_hash = ? ORDER BY last_used DESC LIMIT ?",
+                        (catalog_hash, self.max_entries),
+                    ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not load price memo {self.path}: {e!s}")
+                return
+            self._entries.update(reversed(rows))
+            logger.debug(f"Loaded {len(rows)} memoized prices from {self.path}")
+
+    def get(self, catalog_hash: str, key: str) -> Optional[int]:
+        """
+        Get a memoized price in cents, marking it most recently used.
+
+        Returns None if the memo is bound to a different catalog.
+        """
+        with self._lock:
+            if catalog_hash != self.catalog_hash:
+                return None
+            cents = self._entries.get(key)
+            if cents is not None:
+                self._entries.move_to_end(key)
+                self._touched[key] = None
+            return cents
+
+    def put(self, catalog_hash: str, key: str, cents: int) -> None:
+        """
+        Memoize a price in cents, evicting the least recently used if full.
+
+        Ignored if the memo is bound to a different catalog than the one the
+        price was calculated against.
+        """
+        with self._lock:
+            if catalog_hash != self.catalog_hash:
+                return
+            self._entries[key] = cents
+            self._entries.move_to_end(key)
+            self._touched[key] = None
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._touched.pop(evicted, None)
+
+    def save(self) -> None:
+        """
+        Write the prices used since the last save to disk.
+
+        Also deletes the stored prices of other catalogs and the least
+        recently used prices beyond max_entries.
+        """
+        with self._lock:
+            # The directory of a temporary database may be gone by exit
+            if (
+                self.path is None
+                or self.catalog_hash is None
+                or not self.path.parent.is_dir()
+            ):
+                return
+            touched = [
+                (key, self._entries[key])
+                for key in self._entries
+                if key in self._touched
+            ]
+            try:
+                with closing(self._connect()) as connection, connection:
+                    connection.execute(
+                        "DELETE FROM price_memo WHERE catalog_hash != ?",
+                        (self.catalog_hash,),
+                    )
+                    (last_used,) = connection.execute(
+                        "SELECT COALESCE(MAX(last_used), 0) FROM price_memo"
+                    ).fetchone()
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO price_memo "
+                        "(catalog_hash, config_key, price_cents, last_used) "
+                        "VALUES (?, ?, ?, ?)",
+                        (
+                            (self.catalog_hash, key, cents, last_used + i)
+                            for i, (key, cents) in enumerate(touched, 1)
+                        ),
+                    )
+                    connection.execute(
+                        "DELETE FROM price_memo WHERE last_used <= ("
+                        "SELECT last_used FROM price_memo "
+                        "ORDER BY last_used DESC LIMIT 1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not save price memo {self.path}: {e!s}")
+                return
+            self._touched.clear()
+            logger.debug(f"Saved {len(touched)} memoized prices to {self.path}")
+
+    def clear(self) -> None:
+        """Drop every memoized price, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._touched.clear()
+            self._book = None
+            if self.path is None or not self.path.exists():
+                return
+            try:
+                with closing(self._connect()) as connection, connection:
+                    connection.execute("DELETE FROM price_memo")
+                    connection.execute("DELETE FROM price_book_snapshot")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not clear price memo {self.path}: {e!s}")
+
+
+# Shared memos by memo file, and of in-memory databases by bind
+_memos: Dict[Path, PriceMemo] = {}
+_memory_memos: "weakref.WeakKeyDictionary[Any, PriceMemo]" = weakref.WeakKeyDictionary()
+_memos_lock = threading.Lock()
+
+
+def default_price_memo(db: Session) -> PriceMemo:
+    """
+    Get the shared price memo of a session's database, saved at exit.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        PriceMemo: The memo stored next to the database (see price_memo_path),
+        or an in-memory memo for an in-memory database
+    """
+    bind = db.get_bind()
+    path = price_memo_path(bind.engine.url)
+    with _memos_lock:
+        if path is None:
+            memo = _memory_memos.get(bind)
+            if memo is None:
+                memo = _memory_memos[bind] = PriceMemo(None)
+            return memo
+        path = path.resolve()
+        memo = _memos.get(path)
+        if memo is None:
+            memo = _memos[path] = PriceMemo(path)
+            atexit.register(memo.save)
+        return memo
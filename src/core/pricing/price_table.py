@@ -0,0 +1,234 @@
+"""
+Precomputed price table for standard configurations.
+
+Most quoted configurations are a product family at one of its voltages, in one
+of its materials, at a standard length, with or without a priced connection.
+build_price_table enumerates that cross product for each family, prices every
+combination once with the vectorized batch pricer (see batch.py) and stores the
+results in the precomputed_prices table (see
+src/core/models/precomputed_price.py). Pricing a standard configuration is then
+a single primary key lookup that does not load the pricing catalog at all;
+custom lengths, unlisted connections and extra options still go through the
+PricingEngine.
+
+Combinations that cannot be priced (an unavailable material, Halar beyond its
+length limit, ...) are not stored, so they miss the table and get the engine's
+error.
+
+Example:
+    >>> build_price_table(db)
+    {1: 1440, 2: 960}
+    >>> lookup_price_cents(db, 1, "115VAC", "H", 24.0, 'Flange_150#_2"')
+    61250
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from src.core.models import Material, PrecomputedPrice
+from src.core.models.standard_length import DEFAULT_TOLERANCE
+from src.core.pricing.batch import PricingBatch, price_many
+from src.core.pricing.engine import PricingEngine
+from src.core.pricing.price_book import PriceBook, ProductEntry
+from src.core.pricing.strategies import connection_adder_key, connection_specs_for
+from src.utils.money import to_cents_array
+
+logger = logging.getLogger(__name__)
+
+# (voltage, material code, length, connection adder key or '', product)
+_Configuration = Tuple[str, str, float, str, ProductEntry]
+
+
+def _family_configurations(
+    engine: PricingEngine, product_family_id: int
+) -> List[_Configuration]:
+    """Enumerate the standard configurations of a product family."""
+    book = engine.price_book
+    products = book.family_products.get(product_family_id, ())
+    voltages = sorted({p.voltage for p in products if p.voltage is not None})
+    material_codes = sorted(
+        {
+            code
+            for family_id, code in book.material_premiums
+            if family_id == product_family_id
+        }
+        | {p.material for p in products}
+    )
+
+    configurations: List[_Configuration] = []
+    for voltage in voltages:
+        for code in material_codes:
+            if code not in book.materials:
+                continue
+            product, _ = engine.resolve_product(product_family_id, voltage, code)
+            lengths = set(book.standard_lengths.lengths(code, product.product_type))
+            if product.base_length is not None:
+                lengths.add(product.base_length)
+            connection = book.find_option(
+                "Connection", "Connection", product.model_series
+            )
+            connections = [""] + sorted(connection.adders if connection else ())
+            for length in sorted(lengths):
+                for key in connections:
+                    configurations.append((voltage, code, float(length), key, product))
+    return configurations
+
+
+def build_price_table(
+    db: Session,
+    product_family_ids: Optional[Iterable[int]] = None,
+    price_book: Optional[PriceBook] = None,
+) -> Dict[int, int]:
+    """
+    Precompute the prices of the standard configurations of product families.
+
+    The stored rows of each family are replaced in one transaction.
+
+    Args:
+        db: SQLAlchemy database session
+        product_family_ids: Families to build (default: every family with products)
+        price_book: Catalog snapshot to price against; loaded from db if omitted
+
+    Returns:
+        Dict[int, int]: Number of rows stored, by product family ID
+    """
+    engine = PricingEngine(db, price_book=price_book)
+    book = engine.price_book
+    family_ids = (
+        sorted(book.family_products)
+        if product_family_ids is None
+        else list(product_family_ids)
+    )
+
+    built: Dict[int, int] = {}
+    try:
+        for family_id in family_ids:
+            configurations = _family_configurations(engine, family_id)
+            batch = PricingBatch(
+                product_ids=[product.id for *_, product in configurations],
+                lengths=[length for _, _, length, _, _ in configurations],
+                materials=[
+                    None if code == product.material else code
+                    for _, code, _, _, product in configurations
+                ],
+                specs=[connection_specs_for(key) for _, _, _, key, _ in configurations],
+            )
+            prices = price_many(db, batch, price_book=book, strict=False)
+            valid = ~np.isnan(prices)
+            cents = to_cents_array(np.where(valid, prices, 0.0))
+
+            rows = [
+                {
+                    "product_family_id": family_id,
+                    "voltage": voltage,
+                    "material_code": code,
+                    "length": length,
+                    "connection": key,
+                    "product_id": product.id,
+                    "price_cents": int(price_cents),
+                }
+                for (voltage, code, length, key, product), price_cents, ok in zip(
+                    configurations, cents, valid
+                )
+                if ok
+            ]
+            db.execute(
+                delete(PrecomputedPrice).where(
+                    PrecomputedPrice.product_family_id == family_id
+                )
+            )
+            if rows:
+                db.execute(insert(PrecomputedPrice), rows)
+            built[family_id] = len(rows)
+            logger.debug(
+                f"Precomputed {len(rows)} of {len(configurations)} configurations "
+                f"for product family {family_id}"
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return built
+
+
+# Material code of a material code or name; a code takes precedence over a
+# material named like it
+_MATERIAL_CODE = (
+    select(Material.code)
+    .where(
+        or_(
+            Material.code == bindparam("material"),
+            Material.name == bindparam("material"),
+        )
+    )
+    .order_by(Material.code != bindparam("material"))
+    .limit(1)
+    .scalar_subquery()
+)
+
+# Built once; lookups only bind parameters
+_LOOKUP = (
+    select(PrecomputedPrice.price_cents)
+    .where(
+        PrecomputedPrice.product_family_id == bindparam("family_id"),
+        PrecomputedPrice.voltage == bindparam("voltage"),
+        PrecomputedPrice.material_code
+        == func.coalesce(_MATERIAL_CODE, bindparam("material")),
+        PrecomputedPrice.length.between(
+            bindparam("min_length"), bindparam("max_length")
+        ),
+        PrecomputedPrice.connection == bindparam("connection"),
+    )
+    .order_by(func.abs(PrecomputedPrice.length - bindparam("length")))
+    .limit(1)
+)
+
+
+def lookup_price_cents(
+    db: Session,
+    product_family_id: int,
+    voltage: str,
+    material: str,
+    length: float,
+    connection: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Look up the precomputed price of a standard configuration.
+
+    The material may be given by code or name (e.g. "S" or "316SS"), resolved
+    like PriceBook.resolve_material_code, and the length matches a stored
+    standard length within DEFAULT_TOLERANCE (as StandardLengthIndex does), so
+    e.g. 23.9999" from a metric conversion is priced as 24". Both are resolved
+    in the same single query.
+
+    Args:
+        db: SQLAlchemy database session
+        product_family_id: ID of the product family
+        voltage: Voltage
+        material: Material code or name
+        length: Length in inches (a stored standard length, within tolerance)
+        connection: Connection option adder key (e.g. 'Flange_150#_2"') or
+            connection type, or None for no connection
+
+    Returns:
+        Optional[int]: Price of the configuration in cents, or None if it is
+        not in the table (custom length, unknown configuration, or the table has
+        not been built since the catalog last changed)
+    """
+    length = float(length)
+    return db.execute(
+        _LOOKUP,
+        {
+            "family_id": product_family_id,
+            "voltage": voltage,
+            "material": material,
+            "length": length,
+            "min_length": length - DEFAULT_TOLERANCE,
+            "max_length": length + DEFAULT_TOLERANCE,
+            "connection": connection_adder_key(connection_specs_for(connection)) or "",
+        },
+    ).scalar()
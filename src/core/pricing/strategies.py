@@ -1,44 +1,103 @@
 from abc import ABC, abstractmethod
-
-from src.core.models import (
-    Option,
-    Product,
-    StandardLength,
-    MaterialOption,
-    Material,
-)
+from typing import Any, Dict, NamedTuple, Optional
 
 from .context import PricingContext
 
 
+def connection_adder_key(specs: Dict[str, Any]) -> Optional[str]:
+    """
+    Build the Connection option adder key for a set of specs.
+
+    Returns:
+        The adder key (e.g. "Flange_150#_2\"" or "TriClamp_1.5\""), or None if
+        the specs do not describe a priced connection.
+    """
+    connection_type = specs.get("connection_type")
+    if connection_type == "Flange":
+        rating = specs.get("flange_rating")
+        size = specs.get("flange_size")
+        return f"Flange_{rating}_{size}"
+    if connection_type == "Tri-Clamp":
+        size = specs.get("triclamp_size")
+        return f"TriClamp_{size}"
+    return None
+
+
+def connection_specs_for(connection: Optional[str]) -> Dict[str, Any]:
+    """
+    Build connection specs from a Connection option adder key or type.
+
+    The inverse of connection_adder_key: "Flange_150#_2\"" and "TriClamp_1.5\""
+    give the matching flange or Tri-Clamp specs; any other value is taken as
+    a connection type without sizes (e.g. "NPT").
+    """
+    if not connection:
+        return {}
+    parts = connection.split("_")
+    if parts[0] == "Flange" and len(parts) == 3:
+        return {
+            "connection_type": "Flange",
+            "flange_rating": parts[1],
+            "flange_size": parts[2],
+        }
+    if parts[0] == "TriClamp" and len(parts) == 2:
+        return {"connection_type": "Tri-Clamp", "triclamp_size": parts[1]}
+    return {"connection_type": connection}
+
+
+class PipelineKey(NamedTuple):
+    """
+    What a compiled strategy pipeline is specialized for.
+
+    No strategy's applicability depends on the product type (its effect comes
+    from the price book's data for the type), so the type is not part of the
+    key and every product type shares the pipelines.
+
+    Attributes:
+        material_override: Whether a material override is priced
+        connection: Whether the specs describe a priced connection
+    """
+
+    material_override: bool
+    connection: bool
+
+    @classmethod
+    def for_context(cls, context: PricingContext) -> "PipelineKey":
+        """Get the pipeline key of a pricing context."""
+        return cls(
+            material_override=bool(context.material_override_code),
+            connection=connection_adder_key(context.specs or {}) is not None,
+        )
+
+
 class PricingStrategy(ABC):
     @abstractmethod
     def calculate(self, context: PricingContext) -> float:
         """Calculates a price component and returns the new total price."""
         pass
 
+    def applies(self, key: PipelineKey) -> bool:
+        """
+        Whether the strategy can change the price for a pipeline key.
+
+        Strategies that cannot apply are left out of the compiled pipeline.
+        """
+        return True
+
 
 class MaterialAvailabilityStrategy(PricingStrategy):
+    def applies(self, key: PipelineKey) -> bool:
+        return key.material_override
+
     def calculate(self, context: PricingContext) -> float:
         if not context.material_override_code:
             return context.price
 
-        # Get product type from model number
-        product_type = context.product.model_number.split("-")[0]
-
-        # Handle special cases for dual point switches
-        if product_type == "LS7000" and "/2" in context.product.model_number:
-            product_type = "LS7000/2"
+        product_type = context.product.product_type
 
         # Get material option for this product type
-        material_option = (
-            context.db.query(Option)
-            .filter(
-                Option.name == "Material",
-                Option.category == "Material",
-                Option.product_families.like(f"%{product_type}%"),
-            )
-            .first()
+        material_option = context.price_book.find_option(
+            "Material", "Material", product_type
         )
 
         if (
@@ -59,14 +118,8 @@ class BasePriceStrategy(PricingStrategy):
 
         # For exotic materials, price is based on Stainless Steel 'S' version
         if material_code in ["U", "T"]:
-            s_material_product = (
-                context.db.query(Product)
-                .filter(
-                    Product.model_number == context.product.model_number,
-                    Product.voltage == context.product.voltage,
-                    Product.material == "S",
-                )
-                .first()
+            s_material_product = context.price_book.find_product(
+                context.product.model_number, context.product.voltage, "S"
             )
 
             if s_material_product:
@@ -82,76 +135,31 @@ class BasePriceStrategy(PricingStrategy):
 
 class MaterialPremiumStrategy(PricingStrategy):
     def calculate(self, context: PricingContext) -> float:
-        # Get material option for this product type
-        product_type = context.product.model_number.split("-")[0]
-        if product_type == "LS7000" and "/2" in context.product.model_number:
-            product_type = "LS7000/2"
-
         # Get the material option for this product family and material
-        material_option = (
-            context.db.query(MaterialOption)
-            .filter(
-                MaterialOption.product_family_id == context.product.product_family_id,
-                MaterialOption.material_code == context.material.code,
-                MaterialOption.is_available == 1,
-            )
-            .first()
+        material_premium = context.price_book.get_material_premium(
+            context.product.product_family_id, context.material.code
         )
 
-        if material_option:
-            context.price += material_option.base_price
+        if material_premium is not None:
+            context.add(material_premium)
 
         return context.price
 
 
 class ExtraLengthStrategy(PricingStrategy):
     def calculate(self, context: PricingContext) -> float:
-        effective_length = float(context.effective_length_in or 0.0)
-        base_length = float(context.product.base_length or 0.0)
-        material_code = context.material.code
-
-        # For U and T materials, calculate per inch from 4"
-        if material_code in ["U", "T"]:
-            base_length = 4.0
-            if effective_length > base_length:
-                extra_length = effective_length - base_length
-                adder = 40.0 if material_code == "U" else 50.0
-                context.price += extra_length * adder
-            return context.price
-
-        # For S material with 10" base length, use hard-coded thresholds
-        if material_code == "S" and base_length == 10.0:
-            if effective_length <= base_length:
-                return context.price
-
-            extra_length = effective_length - base_length
-            adder = 3.75  # $3.75 per inch for S material
-            context.price += extra_length * adder
-            return context.price
-
-        # For other materials, calculate per foot from base length
-        if effective_length <= base_length:
-            return context.price
-
-        extra_inches = effective_length - base_length
-        full_feet = int(extra_inches / 12)
-
-        if full_feet > 0:
-            # Get the appropriate adder per foot
-            if context.product.model_number.startswith("LS2000"):
-                length_adders = {
-                    "H": 110.0,  # $110/foot
-                    "TS": 110.0,  # $110/foot
-                }
-            else:
-                length_adders = {
-                    "H": 110.0,  # $110/foot
-                    "TS": 110.0,  # $110/foot
-                }
-
-            adder = length_adders.get(material_code, 0.0)
-            context.price += full_feet * adder
-
+        # Length rules are data (length_adder_rules), compiled per family and
+        # material when the price book is built
+        adder = context.price_book.length_adder(
+            context.product.product_type, context.material.code
+        )
+        if adder is not None:
+            context.add(
+                adder(
+                    float(context.effective_length_in or 0.0),
+                    float(context.product.base_length or 0.0),
+                )
+            )
         return context.price
 
 
@@ -159,22 +167,17 @@ class NonStandardLengthSurchargeStrategy(PricingStrategy):
     def calculate(self, context: PricingContext) -> float:
         effective_length = float(context.effective_length_in or 0.0)
         material_code = context.material.code
+        product_type = context.product.product_type
 
         # Special handling for Halar material
         if material_code == "H":
-            # Get standard lengths for Halar from configuration
-            standard_lengths = (
-                context.db.query(StandardLength)
-                .filter(StandardLength.material_code == "H")
-                .all()
+            # Check if length is standard (within tolerance)
+            is_standard = context.price_book.is_standard_length(
+                "H", effective_length, product_type
             )
-            standard_length_values = [sl.length for sl in standard_lengths]
-
-            # Check if length is standard
-            is_standard = effective_length in standard_length_values
 
             if not is_standard:
-                context.price += 50.0  # $50 adder for non-standard lengths
+                context.add(50.0)  # $50 adder for non-standard lengths
 
             # Check Halar length limit
             if effective_length > 72:
@@ -184,59 +187,41 @@ class NonStandardLengthSurchargeStrategy(PricingStrategy):
             return context.price
 
         # For other materials, check if they have a surcharge
-        material = (
-            context.db.query(Material).filter(Material.code == material_code).first()
-        )
+        material = context.material
 
         if material and material.has_nonstandard_length_surcharge:
-            # Check if length is standard
-            standard_lengths = (
-                context.db.query(StandardLength)
-                .filter(StandardLength.material_code == material_code)
-                .all()
-            )
-            standard_length_values = [sl.length for sl in standard_lengths]
-
-            if effective_length not in standard_length_values:
-                context.price += material.nonstandard_length_surcharge
+            # Check if length is standard (within tolerance)
+            if not context.price_book.is_standard_length(
+                material_code, effective_length, product_type
+            ):
+                context.add(material.nonstandard_length_surcharge)
 
         return context.price
 
 
 class ConnectionOptionStrategy(PricingStrategy):
+    def applies(self, key: PipelineKey) -> bool:
+        return key.connection
+
     def calculate(self, context: PricingContext) -> float:
         connection_type = context.specs.get("connection_type")
         if not connection_type:
             return context.price
 
-        # Get connection option from database
-        connection_option = (
-            context.db.query(Option)
-            .filter(
-                Option.name == "Connection",
-                Option.category == "Connection",
-                Option.product_families.like(
-                    f"%{context.product.model_number.split('-')[0]}%"
-                ),
-            )
-            .first()
+        # Get connection option from the price book
+        connection_option = context.price_book.find_option(
+            "Connection", "Connection", context.product.model_series
         )
 
         if not connection_option:
             return context.price
 
         # Get the specific connection price based on type and size
-        if connection_type == "Flange":
-            rating = context.specs.get("flange_rating")
-            size = context.specs.get("flange_size")
-            key = f"Flange_{rating}_{size}"
-        elif connection_type == "Tri-Clamp":
-            size = context.specs.get("triclamp_size")
-            key = f"TriClamp_{size}"
-        else:
+        key = connection_adder_key(context.specs)
+        if key is None:
             return context.price
 
         if key in connection_option.adders:
-            context.price += connection_option.adders[key]
+            context.add(connection_option.adders[key])
 
         return context.price
@@ -0,0 +1,112 @@
+"""
+Price breakdown tracing for the pricing calculator.
+
+This module provides the structured breakdown returned by a traced pricing run:
+for each strategy it records the price before and after, the delta it added,
+the wall time it took and the number of SQL statements it issued. The
+breakdown doubles as the line-level adder list shown on quotes.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@dataclass(frozen=True)
+class StrategyTrace:
+    """
+    Trace of a single pricing strategy run.
+
+    Attributes:
+        strategy (str): Strategy class name
+        price_before (float): Running price before the strategy ran
+        price_after (float): Running price after the strategy ran
+        elapsed_ms (float): Wall time spent in the strategy, in milliseconds
+        sql_statements (int): Number of SQL statements the strategy issued
+    """
+
+    strategy: str
+    price_before: float
+    price_after: float
+    elapsed_ms: float
+    sql_statements: int
+
+    @property
+    def delta(self) -> float:
+        """Price added (or removed) by this strategy."""
+        return self.price_after - self.price_before
+
+
+@dataclass
+class PriceBreakdown:
+    """
+    Structured result of a traced pricing run.
+
+    Attributes:
+        final_price (float): Price after all strategies ran
+        steps (List[StrategyTrace]): One trace per strategy, in pipeline order
+        setup_ms (float): Wall time spent building the pricing context
+        setup_sql_statements (int): SQL statements issued building the context
+    """
+
+    final_price: float = 0.0
+    steps: List[StrategyTrace] = field(default_factory=list)
+    setup_ms: float = 0.0
+    setup_sql_statements: int = 0
+
+    @property
+    def total_ms(self) -> float:
+        """Total wall time, including context setup."""
+        return self.setup_ms + sum(step.elapsed_ms for step in self.steps)
+
+    @property
+    def total_sql_statements(self) -> int:
+        """Total SQL statements issued, including context setup."""
+        return self.setup_sql_statements + sum(
+            step.sql_statements for step in self.steps
+        )
+
+    def adders(self) -> Dict[str, float]:
+        """Get the non-zero price delta of each strategy, keyed by strategy name."""
+        return {step.strategy: step.delta for step in self.steps if step.delta}
+
+    def slowest(self) -> Optional[StrategyTrace]:
+        """Get the strategy that took the most wall time."""
+        return max(self.steps, key=lambda step: step.elapsed_ms, default=None)
+
+
+class StatementCounter:
+    """Running count of SQL statements executed on an engine."""
+
+    def __init__(self):
+        self.count = 0
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+@contextmanager
+def count_statements(db: Session) -> Iterator[StatementCounter]:
+    """
+    Count the SQL statements executed through a session's engine.
+
+    The counter listens on the engine, so statements issued by other sessions
+    on the same engine while the block runs are counted too.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Yields:
+        StatementCounter: Counter whose ``count`` grows as statements run
+    """
+    counter = StatementCounter()
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", counter._on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._on_execute)
+
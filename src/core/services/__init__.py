@@ -8,6 +8,7 @@ from src.core.services.quote_service import QuoteService
 from src.core.services.spare_part_service import SparePartService
 from src.core.services.configuration_service import ConfigurationService
 from src.core.services.pricing_service import PricingService
+from src.core.services.requote_service import RequoteService
 from src.core.services.validation_service import ValidationService
 
 __all__ = [
@@ -17,6 +18,7 @@ __all__ = [
     "SparePartService",
     "ConfigurationService",
     "PricingService",
+    "RequoteService",
     "ValidationService",
 ]
 
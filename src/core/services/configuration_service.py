@@ -3,21 +3,60 @@ Configuration service for managing product configurations.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 from sqlalchemy.orm import Session
 
 from src.core.models.configuration import Configuration
-from src.core.models.connection_option import ConnectionOption
-from src.core.models.material import Material
-from src.core.models.option import Option
-from src.core.models.standard_length import StandardLength
-from src.core.models.voltage_option import VoltageOption
+from src.core.pricing.engine import PricingEngine
+from src.core.pricing.strategies import (
+    BasePriceStrategy,
+    ConnectionOptionStrategy,
+    ExtraLengthStrategy,
+    MaterialAvailabilityStrategy,
+    MaterialPremiumStrategy,
+    NonStandardLengthSurchargeStrategy,
+    PricingStrategy,
+    connection_specs_for,
+)
 from src.core.services.product_service import ProductService
+from src.utils.money import from_cents
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Price components of a configuration and the pricing pipeline strategies
+# that price each one
+PRICE_COMPONENT_STRATEGIES: Dict[str, Tuple[Type[PricingStrategy], ...]] = {
+    "base": (MaterialAvailabilityStrategy, BasePriceStrategy),
+    "material": (MaterialPremiumStrategy,),
+    "length": (ExtraLengthStrategy, NonStandardLengthSurchargeStrategy),
+    "connection": (ConnectionOptionStrategy,),
+}
+
+# Selected options each price component depends on. Voltage and Material pick
+# the product every strategy prices from, so every component depends on them.
+# Any other selected option is priced from its adders as its own component.
+PRICE_COMPONENT_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "base": ("Voltage", "Material"),
+    "material": ("Voltage", "Material"),
+    "length": ("Voltage", "Material", "Length", "Probe Length"),
+    "connection": (
+        "Voltage",
+        "Material",
+        "Connection",
+        "Connection Type",
+        "Rating",
+        "Size",
+    ),
+}
+
+CORE_OPTIONS = frozenset(
+    name for inputs in PRICE_COMPONENT_INPUTS.values() for name in inputs
+)
+
+FALLBACK_PRICE = 500.0
+
 
 class ConfigurationService:
     """
@@ -30,6 +69,7 @@ class ConfigurationService:
         self.db = db
         self.product_service = product_service
         self._current_config: Optional[Configuration] = None
+        self._engine: Optional[PricingEngine] = None
         logger.debug("ConfigurationService initialized")
 
     @property
@@ -49,7 +89,11 @@ class ConfigurationService:
             logger.debug("Current configuration cleared")
 
     def start_configuration(
-        self, product_family_id: int, product_family_name: str, base_product_info: dict
+        self,
+        product_family_id: int,
+        product_family_name: str,
+        base_product_info: dict,
+        update_price: bool = True,
     ):
         """
         Start a new configuration session for a product family.
@@ -58,6 +102,8 @@ class ConfigurationService:
             product_family_id: ID of the product family
             product_family_name: Name of the product family
             base_product_info: Base product information
+            update_price: Whether to price the configuration now; pass False
+                when pricing happens elsewhere (e.g. a background worker)
         """
         logger.debug(
             f"Starting configuration for {product_family_name} (ID: {product_family_id})"
@@ -65,6 +111,8 @@ class ConfigurationService:
         logger.debug(f"Base product info: {base_product_info}")
 
         try:
+            # One price book per configuration session
+            self._engine = PricingEngine(self.db)
             self._current_config = Configuration(
                 db=self.db,
                 product_family_id=product_family_id,
@@ -74,20 +122,23 @@ class ConfigurationService:
             logger.debug("Configuration object created successfully")
 
             # Update price and model number
-            self._update_price()
+            if update_price:
+                self._update_price()
             self._update_model_number()
 
         except Exception as e:
             logger.error(f"Error creating configuration: {e!s}", exc_info=True)
             raise
 
-    def select_option(self, option_name: str, value: any):
+    def select_option(self, option_name: str, value: any, update_price: bool = True):
         """
         Updates the current configuration with a selected option.
 
         Args:
             option_name (str): The name of the option (e.g., "Material", "Length").
             value (any): The selected value for the option.
+            update_price (bool): Whether to reprice now; pass False when pricing
+                happens elsewhere (e.g. a background worker).
         """
         if not self.current_config:
             logger.warning("No current configuration when trying to select option")
@@ -98,9 +149,10 @@ class ConfigurationService:
         # Update the selected option
         self.current_config.selected_options[option_name] = value
 
-        # Update the model number and price
+        # Update the model number and reprice what depends on the option
         self._update_model_number()
-        self._update_price()
+        if update_price:
+            self._update_price(changed_option=option_name)
         logger.debug(f"Updated configuration: {self.current_config.selected_options}")
 
     def _update_model_number(self):
@@ -114,126 +166,142 @@ class ConfigurationService:
         logger.debug("Updating model number")
         self.current_config.model_number = self.generate_model_number()
 
-    def _get_current_variant(self):
-        """Get the current product variant based on selected options."""
-        if not self.current_config:
-            logger.warning("No current configuration when trying to get variant")
-            return None
-
-        try:
-            # Find the specific variant that matches the current selection
-            variant = self.product_service.find_variant(
-                self.db,
-                self.current_config.product_family_id,
-                self.current_config.selected_options,
+    def _product_inputs(self) -> dict:
+        """Get the pricing engine inputs for the current configuration's core options."""
+        options = self.current_config.selected_options
+        base_product = self.current_config.base_product
+
+        length = options.get("Length", options.get("Probe Length"))
+        specs = connection_specs_for(options.get("Connection"))
+        connection_type = options.get("Connection Type")
+        if connection_type:
+            specs = {"connection_type": connection_type}
+            if connection_type == "Tri-Clamp":
+                specs["triclamp_size"] = options.get("Size")
+            else:
+                specs["flange_rating"] = options.get("Rating")
+                specs["flange_size"] = options.get("Size")
+
+        return {
+            "voltage": options.get("Voltage", base_product.get("voltage")),
+            "material": options.get("Material", base_product.get("material")),
+            "length": self._to_float(length, None) or None,
+            "specs": specs,
+        }
+
+    def _price_components(self, components: List[str]) -> Dict[str, int]:
+        """Compute the price in cents of components of the current configuration."""
+        config = self.current_config
+        prices: Dict[str, int] = {}
+
+        # Pipeline components, priced by their strategies in one pass
+        stages = [c for c in components if c in PRICE_COMPONENT_STRATEGIES]
+        if stages:
+            inputs = self._product_inputs()
+            product, material_override = self._engine.resolve_product(
+                config.product_family_id, inputs["voltage"], inputs["material"]
             )
-
-            if not variant:
-                logger.warning(
-                    f"No matching variant found for options: {self.current_config.selected_options}"
+            strategy_cents = self._engine.price_components_cents(
+                product.id,
+                inputs["length"],
+                material_override,
+                inputs["specs"],
+                strategies={
+                    strategy
+                    for stage in stages
+                    for strategy in PRICE_COMPONENT_STRATEGIES[stage]
+                },
+            )
+            for stage in stages:
+                prices[stage] = sum(
+                    strategy_cents.get(strategy, 0)
+                    for strategy in PRICE_COMPONENT_STRATEGIES[stage]
                 )
-                return None
 
-            return variant
+        # Miscellaneous options, priced from the option's adders
+        for component in components:
+            if component not in PRICE_COMPONENT_STRATEGIES:
+                option_name = component.split(":", 1)[1]
+                prices[component] = self._engine.option_cents(
+                    config.product_family_name,
+                    option_name,
+                    config.selected_options.get(option_name),
+                )
+        return prices
+
+    def _dependent_components(self, option_name: str) -> List[str]:
+        """Get the price components that must be recomputed when an option changes."""
+        components = [
+            component
+            for component, inputs in PRICE_COMPONENT_INPUTS.items()
+            if option_name in inputs
+        ]
+        if option_name not in CORE_OPTIONS:
+            components.append(f"option:{option_name}")
+        return components
+
+    def _all_components(self) -> Iterable[str]:
+        """Get every price component of the current configuration."""
+        yield from PRICE_COMPONENT_INPUTS
+        for option_name in self.current_config.selected_options:
+            if option_name not in CORE_OPTIONS:
+                yield f"option:{option_name}"
+
+    def _update_price(self, changed_option: Optional[str] = None):
+        """
+        Update the price based on the current configuration.
 
-        except Exception as e:
-            logger.error(f"Error getting current variant: {e!s}", exc_info=True)
-            return None
+        Prices come from the configuration's PricingEngine, the same engine
+        that prices quotes. The configuration keeps the price in cents of each
+        component (the base, material, length and connection stages of the
+        pricing pipeline, and each other selected option) in its price ledger.
+        When ``changed_option`` is given only the components that depend on it
+        are recomputed; otherwise the whole ledger is rebuilt.
 
-    def _update_price(self):
-        """Update the price based on the current configuration."""
+        Args:
+            changed_option: Name of the option whose value just changed
+        """
+        config = self.current_config
         try:
-            variant = self._get_current_variant()
-            if not variant:
-                logger.error("No variant found for current configuration")
-                # Fallback to base product price
-                base_price = self._to_float(
-                    self.current_config.base_product.get("base_price", 0.0)
+            if self._engine is None:
+                self._engine = PricingEngine(self.db)
+
+            inputs = self._product_inputs()
+            try:
+                self._engine.resolve_product(
+                    config.product_family_id, inputs["voltage"], inputs["material"]
                 )
+            except ValueError as e:
+                logger.error(f"No product found for current configuration: {e!s}")
+                # Fallback to base product price
+                config.price_ledger.clear()
+                base_price = self._to_float(config.base_product.get("base_price", 0.0))
                 if base_price == 0.0:
-                    base_price = 500.0
-                self.current_config.final_price = base_price
-                self.current_config.model_number = ""
+                    base_price = FALLBACK_PRICE
+                config.final_price = base_price
+                config.model_number = ""
                 logger.info(f"Using fallback base price: {base_price}")
                 return
 
-            # Start with the variant's base price
-            final_price = self._to_float(getattr(variant, "base_price", 0.0))
-            if final_price == 0.0:
-                final_price = self._to_float(
-                    self.current_config.base_product.get("base_price", 0.0)
-                )
-            logger.info(f"Base price from variant: {final_price}")
-
-            # Add material price
-            material_name = self.current_config.selected_options.get("Material")
-            if material_name:
-                material = self.db.query(Material).filter_by(name=material_name).first()
-                if material:
-                    final_price += material.base_price
-                    logger.debug(f"Added material base price: {material.base_price}")
-
-            # Add voltage price
-            voltage_name = self.current_config.selected_options.get("Voltage")
-            if voltage_name:
-                voltage = (
-                    self.db.query(VoltageOption).filter_by(name=voltage_name).first()
-                )
-            if voltage:
-                final_price += voltage.price
-                logger.debug(f"Added voltage price: {voltage.price}")
-
-            # Add connection price
-            connection_name = self.current_config.selected_options.get("Connection")
-            if connection_name:
-                connection = (
-                    self.db.query(ConnectionOption)
-                    .filter_by(name=connection_name)
-                    .first()
-                )
-                if connection:
-                    final_price += connection.price
-                    logger.debug(f"Added connection price: {connection.price}")
-
-            # Add length price
-            length = self._to_float(self.current_config.selected_options.get("Length"))
-            if length and material:
-                standard_length = (
-                    self.db.query(StandardLength)
-                    .filter_by(material_id=material.id, length=length)
-                    .first()
-                )
-                if standard_length:
-                    final_price += standard_length.price
-                    logger.debug(f"Added length price: {standard_length.price}")
-
-            # Add miscellaneous options prices
-            for (
-                option_name,
-                option_value,
-            ) in self.current_config.selected_options.items():
-                if option_name not in ["Material", "Voltage", "Connection", "Length"]:
-                    option = (
-                        self.db.query(Option)
-                        .filter_by(
-                            product_family_id=self.current_config.product_family_id,
-                            name=option_name,
-                            value=option_value,
-                        )
-                        .first()
-                    )
-                    if option:
-                        final_price += option.price
-                        logger.debug(f"Added {option_name} price: {option.price}")
+            if changed_option is None or not config.price_ledger:
+                components = list(self._all_components())
+                config.price_ledger.clear()
+            else:
+                components = self._dependent_components(changed_option)
+
+            for component, cents in self._price_components(components).items():
+                config.price_ledger[component] = cents
+                logger.debug(f"Priced component {component}: {cents}")
 
             # Update the final price
-            self.current_config.final_price = final_price
-            logger.info(f"Final price calculated: {final_price}")
+            config.final_price = from_cents(sum(config.price_ledger.values()))
+            logger.info(f"Final price calculated: {config.final_price}")
 
         except Exception as e:
             logger.error(f"Error updating price: {e!s}", exc_info=True)
-            # Set a fallback price
-            self.current_config.final_price = 500.0
+            # Rebuild the whole ledger next time and set a fallback price
+            config.price_ledger.clear()
+            config.final_price = FALLBACK_PRICE
 
     def _to_float(self, value, default=0.0):
         """Convert value to float, handling various types."""
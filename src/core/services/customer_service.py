@@ -15,16 +15,19 @@ The service follows domain-driven design principles and separates business logic
 from data access, providing a clean interface for customer management operations.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.core.models import Customer
 from src.utils.db_utils import (
+    Page,
     add_and_commit,
     delete_and_commit,
     get_all,
     get_by_id,
+    keyset_page,
     update_and_commit,
 )
 
@@ -146,6 +149,46 @@ class CustomerService:
         """
         return get_all(db, Customer)
 
+    @staticmethod
+    def get_customer_page(
+        db: Session,
+        cursor: Optional[Sequence[Any]] = None,
+        page_size: int = 100,
+        search: Optional[str] = None,
+    ) -> Page:
+        """
+        Get a page of customers in name order.
+
+        Pages are keyset-paginated on (name, id), which the customers name
+        index serves directly, so fetching a page costs the same at any depth.
+
+        Args:
+            db: Database session
+            cursor: next_cursor of the previous page, i.e. the (name, id) of
+                its last customer; None for the first page
+            page_size: Maximum number of customers per page
+            search: Only customers whose name, company or email contains this
+                text
+
+        Returns:
+            Page: Customer objects and the next cursor
+        """
+        statement = select(Customer)
+        if search:
+            search_pattern = f'%{search}%'
+            statement = statement.where(
+                (Customer.name.ilike(search_pattern))
+                | (Customer.company.ilike(search_pattern))
+                | (Customer.email.ilike(search_pattern))
+            )
+        return keyset_page(
+            db,
+            statement,
+            (Customer.name, Customer.id),
+            cursor=cursor,
+            page_size=page_size,
+        )
+
     @staticmethod
     def search_customers(db: Session, search_term: str) -> List[Customer]:
         """
@@ -20,12 +20,11 @@ from typing import Dict, Optional
 
 from sqlalchemy.orm import Session
 
-from src.core.models.material import Material
-from src.core.models.option import Option
-from src.core.models.standard_length import StandardLength
-from src.core.models.voltage_option import VoltageOption
-from src.core.models.connection_option import ConnectionOption
-from src.core.models.product_family import ProductFamily
+from src.core.pricing.engine import PricingEngine
+from src.core.pricing.price_memo import default_price_memo
+from src.core.pricing.price_table import lookup_price_cents
+from src.core.pricing.strategies import connection_specs_for
+from src.utils.money import from_cents
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -36,8 +35,11 @@ class PricingService:
     Service class for managing product pricing.
 
     This service provides methods for calculating prices based on various factors
-    such as materials, lengths, options, and special pricing rules. It encapsulates
-    all pricing-related business logic and data access.
+    such as materials, lengths, options, and special pricing rules. Prices come
+    from the PricingEngine, against a catalog snapshot loaded on first use and
+    kept for the lifetime of the service. Until then, standard configurations
+    are looked up in the precomputed price table (see
+    src/core/pricing/price_table.py) without loading the catalog.
 
     Example:
         >>> db = SessionLocal()
@@ -47,14 +49,22 @@ class PricingService:
         ...     material="316SS",
         ...     length=24.0,
         ...     voltage="115VAC",
-        ...     connection="1/2\" NPT"
+        ...     connection="TriClamp_1.5\""
         ... )
     """
 
     def __init__(self, db: Session):
         self.db = db
+        self._engine: Optional[PricingEngine] = None
         logger.debug("PricingService initialized")
 
+    @property
+    def engine(self) -> PricingEngine:
+        """Get the pricing engine, loading its price book on first use."""
+        if self._engine is None:
+            self._engine = PricingEngine(self.db, memo=default_price_memo(self.db))
+        return self._engine
+
     def calculate_price(
         self,
         product_family_id: int,
@@ -69,154 +79,40 @@ class PricingService:
 
         Args:
             product_family_id: ID of the product family
-            material: Material name (e.g., "316SS", "Hastelloy C")
+            material: Material code or name (e.g., "S", "316SS")
             length: Length in inches
             voltage: Optional voltage option
-            connection: Optional connection type
+            connection: Optional connection, as a Connection option adder key
+                (e.g., "Flange_150#_2\"") or a connection type
             options: Optional dictionary of additional options
 
         Returns:
-            float: Total calculated price
+            float: Total calculated price, or 0.0 if the configuration cannot
+            be priced
         """
         try:
-            # Start with base price from product family
-            base_price = self._get_base_price(product_family_id)
-            logger.debug(f"Base price: {base_price}")
-
-            # Add material price
-            material_price = self._get_material_price(material)
-            base_price += material_price
-            logger.debug(f"Material price: {material_price}")
-
-            # Add length price
-            length_price = self._get_length_price(material, length)
-            base_price += length_price
-            logger.debug(f"Length price: {length_price}")
-
-            # Add voltage price if specified
-            if voltage:
-                voltage_price = self._get_voltage_price(voltage)
-                base_price += voltage_price
-                logger.debug(f"Voltage price: {voltage_price}")
-
-            # Add connection price if specified
-            if connection:
-                connection_price = self._get_connection_price(connection)
-                base_price += connection_price
-                logger.debug(f"Connection price: {connection_price}")
-
-            # Add option prices if specified
-            if options:
-                for option_name, option_value in options.items():
-                    option_price = self._get_option_price(
-                        product_family_id, option_name, option_value
-                    )
-                    base_price += option_price
-                    logger.debug(f"Option {option_name} price: {option_price}")
-
-            logger.info(f"Final calculated price: {base_price}")
-            return base_price
-
-        except Exception as e:
-            logger.error(f"Error calculating price: {e!s}", exc_info=True)
-            return 0.0
-
-    def _get_base_price(self, product_family_id: int) -> float:
-        """Get the base price for a product family."""
-        try:
-            # Query the product family's base price
-            product_family = self.db.query(ProductFamily).get(product_family_id)
-            if not product_family:
-                logger.warning(f"Product family {product_family_id} not found")
-                return 500.0  # Default base price
-            return float(product_family.base_price)
-        except Exception as e:
-            logger.error(f"Error getting base price: {e!s}", exc_info=True)
-            return 500.0
-
-    def _get_material_price(self, material: str) -> float:
-        """Get the price for a material."""
-        try:
-            material_obj = self.db.query(Material).filter_by(name=material).first()
-            if not material_obj:
-                logger.warning(f"Material {material} not found")
-                return 0.0
-            return float(material_obj.base_price)
-        except Exception as e:
-            logger.error(f"Error getting material price: {e!s}", exc_info=True)
-            return 0.0
-
-    def _get_length_price(self, material: str, length: float) -> float:
-        """Get the price for a specific length and material combination."""
-        try:
-            material_obj = self.db.query(Material).filter_by(name=material).first()
-            if not material_obj:
-                logger.warning(f"Material {material} not found")
-                return 0.0
-
-            standard_length = (
-                self.db.query(StandardLength)
-                .filter_by(material_id=material_obj.id, length=length)
-                .first()
-            )
-
-            if not standard_length:
-                logger.warning(f'No standard length found for {material} at {length}"')
-                return 0.0
-
-            return float(standard_length.price)
-        except Exception as e:
-            logger.error(f"Error getting length price: {e!s}", exc_info=True)
-            return 0.0
-
-    def _get_voltage_price(self, voltage: str) -> float:
-        """Get the price for a voltage option."""
-        try:
-            voltage_obj = self.db.query(VoltageOption).filter_by(name=voltage).first()
-            if not voltage_obj:
-                logger.warning(f"Voltage {voltage} not found")
-                return 0.0
-            return float(voltage_obj.price)
-        except Exception as e:
-            logger.error(f"Error getting voltage price: {e!s}", exc_info=True)
-            return 0.0
-
-    def _get_connection_price(self, connection: str) -> float:
-        """Get the price for a connection option."""
-        try:
-            connection_obj = (
-                self.db.query(ConnectionOption).filter_by(name=connection).first()
-            )
-            if not connection_obj:
-                logger.warning(f"Connection {connection} not found")
-                return 0.0
-            return float(connection_obj.price)
-        except Exception as e:
-            logger.error(f"Error getting connection price: {e!s}", exc_info=True)
-            return 0.0
-
-    def _get_option_price(
-        self, product_family_id: int, option_name: str, option_value: str
-    ) -> float:
-        """Get the price for a specific option."""
-        try:
-            option = (
-                self.db.query(Option)
-                .filter_by(
-                    product_family_id=product_family_id,
-                    name=option_name,
-                    value=option_value,
+            if self._engine is None and voltage is not None and not options:
+                cents = lookup_price_cents(
+                    self.db, product_family_id, voltage, material, length, connection
                 )
-                .first()
+                if cents is not None:
+                    logger.debug(f"Precomputed price for family {product_family_id}")
+                    return from_cents(cents)
+
+            result = self.engine.price_configuration(
+                product_family_id,
+                voltage=voltage,
+                material=material,
+                length=length,
+                specs=connection_specs_for(connection),
+                options=options,
             )
+            logger.debug(
+                f"Priced {result.product.model_number}: product "
+                f"{result.product_cents}c, options {dict(result.option_cents)}"
+            )
+            return result.price
 
-            if not option:
-                logger.warning(
-                    f"Option {option_name}={option_value} not found for product family {product_family_id}"
-                )
-                return 0.0
-
-            return float(option.price)
         except Exception as e:
-            logger.error(f"Error getting option price: {e!s}", exc_info=True)
+            logger.error(f"Error calculating price: {e!s}", exc_info=True)
             return 0.0
@@ -27,6 +27,7 @@ from src.core.models import (
     Material,
     MaterialOption,
     Option,
+    OptionProductFamily,
     Product,
     ProductFamily,
     VoltageOption,
@@ -35,12 +36,14 @@ from src.core.models import (
     ElectricalProtection,
     MaterialAvailability,
     StandardLength,
+    StandardLengthIndex,
 )
 from src.core.models.connection_option import ConnectionOption
 from src.core.models.product_variant import ProductVariant
 from src.core.pricing import calculate_product_price
 from src.utils.db_utils import get_all, get_by_id
 from src.core.services.validation_service import ValidationService
+from src.utils.option_constraints import OptionConstraints
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -81,6 +84,8 @@ class ProductService:
         """Initialize the service with a database session."""
         self.session = session
         self.validator = ValidationService(session)
+        self._standard_length_index: Optional[StandardLengthIndex] = None
+        self._option_constraints: Dict[int, OptionConstraints] = {}
         logger.debug("ProductService initialized")
 
     def get_products(
@@ -475,7 +480,8 @@ class ProductService:
         """Get additional options for a product family."""
         options = (
             self.session.query(Option)
-            .filter(Option.product_families.like(f"%{product_family}%"))
+            .join(OptionProductFamily)
+            .filter(OptionProductFamily.product_family == product_family)
             .all()
         )
         return [
@@ -489,25 +495,60 @@ class ProductService:
             for o in options
         ]
 
-    def get_valid_options_for_selection(
-        self, family_id: int, selected_options: dict
-    ) -> dict:
-        """Get valid options for selection based on current selections."""
-        try:
-            # Get all options for the family
+    def get_option_constraints(self, family_id: int) -> OptionConstraints:
+        """
+        Get the compiled option rules of a product family.
+
+        The options' dependencies, conflicts and excluded products are compiled
+        into bitsets on first use and cached for the lifetime of the service.
+
+        Args:
+            family_id: ID of the product family
+
+        Returns:
+            OptionConstraints: Compiled rules of the family's options
+
+        Raises:
+            ValueError: If the product family does not exist
+        """
+        constraints = self._option_constraints.get(family_id)
+        if constraints is None:
+            family = self.session.get(ProductFamily, family_id)
+            if family is None:
+                raise ValueError(f"Product family with ID {family_id} not found")
             options = (
                 self.session.query(Option)
-                .filter(Option.product_family_id == family_id)
+                .join(OptionProductFamily)
+                .filter(OptionProductFamily.product_family == family.name)
+                .order_by(Option.sort_order, Option.id)
                 .all()
             )
+            constraints = OptionConstraints.compile(options, family.name)
+            self._option_constraints[family_id] = constraints
+        return constraints
+
+    def get_valid_options_for_selection(
+        self, family_id: int, selected_options: dict, product: Optional[str] = None
+    ) -> dict:
+        """
+        Get valid options for selection based on current selections.
 
-            # Filter options based on compatibility
-            valid_options = {}
-            for option in options:
-                if option.is_compatible_with(selected_options):
-                    valid_options[option.name] = option.choices
+        An option is valid if it is not excluded for the family or product,
+        every option it depends on is selected, and no selected option
+        conflicts with it.
 
-            return valid_options
+        Args:
+            family_id: ID of the product family
+            selected_options: Selected option values by option name
+            product: Selected product model number, for excluded_products
+
+        Returns:
+            dict: Choices of each valid option, by option name
+        """
+        try:
+            return self.get_option_constraints(family_id).valid_choices(
+                selected_options, product
+            )
         except Exception as e:
             logger.error(f"Error getting valid options: {e!s}", exc_info=True)
             return {}
@@ -526,47 +567,44 @@ class ProductService:
             logger.error(f"Error getting standard lengths: {e!s}", exc_info=True)
             return []
 
+    @property
+    def standard_length_index(self) -> StandardLengthIndex:
+        """Standard length index, loaded from the database on first use."""
+        if self._standard_length_index is None:
+            self._standard_length_index = StandardLengthIndex.load(self.session)
+        return self._standard_length_index
+
     def validate_length(
         self, product_family: str, material_code: str, length: float
     ) -> Tuple[bool, str]:
-        """Validate a length for a product family and material."""
+        """
+        Validate a length for a product family and material.
+
+        Uses the cached standard length index, so after the first call this is
+        a binary search with no database access (cheap enough to run on every
+        spin box change).
+        """
         try:
-            # Get material
-            material = (
-                self.session.query(Material)
-                .filter(Material.code == material_code)
-                .first()
-            )
-            if not material:
+            index = self.standard_length_index
+            if not index.has_material(material_code):
                 return False, f"Material {material_code} not found"
 
-            # Check minimum length
-            if length < material.min_length:
-                return (
-                    False,
-                    f"Length {length} is less than minimum {material.min_length}",
-                )
-
-            # Check standard lengths
-            standard_lengths = (
-                self.session.query(StandardLength)
-                .filter(
-                    StandardLength.material_code == material_code,
-                    StandardLength.product_family == product_family,
-                )
-                .all()
-            )
+            if length <= 0:
+                return False, "Length must be greater than 0"
 
             # If no standard lengths, any length is valid
-            if not standard_lengths:
+            if not index.lengths(material_code, product_family):
                 return True, ""
 
             # Check if length is within tolerance of any standard length
-            for std_length in standard_lengths:
-                if abs(length - std_length.length) <= std_length.tolerance:
-                    return True, ""
+            if index.is_standard(material_code, length, product_family):
+                return True, ""
 
-            return False, f"Length {length} is not a standard length"
+            nearest = index.nearest(material_code, length, product_family)
+            return (
+                False,
+                f"Length {length} is not a standard length (nearest: {nearest})",
+            )
         except Exception as e:
             logger.error(f"Error validating length: {e!s}", exc_info=True)
             return False, f"Error validating length: {str(e)}"
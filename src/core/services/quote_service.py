@@ -13,10 +13,11 @@ Follows domain-driven design and separates business logic from data access.
 
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Select, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload
 
 from src.core.models import (
     Customer,
@@ -27,7 +28,17 @@ from src.core.models import (
     QuoteItemOption,
 )
 from src.core.services.customer_service import CustomerService
-from src.utils.db_utils import add_and_commit, generate_quote_number, get_by_id
+from src.utils.db_utils import (
+    Page,
+    add_and_commit,
+    generate_quote_number,
+    get_by_id,
+    keyset_page,
+)
+from src.utils.money import cents_column, from_cents
+
+# Sum of line values in integer cents, so SQL adds exact integers
+LINE_VALUE_CENTS = func.sum(cents_column(QuoteItem.unit_price) * QuoteItem.quantity)
 
 
 class QuoteService:
@@ -133,29 +144,95 @@ class QuoteService:
         return quote
 
     @staticmethod
-    def get_all_quotes_summary(db: Session) -> List[Dict[str, Any]]:
+    def _quote_summary_select() -> Select:
+        """Build the SELECT of quote summary rows (see get_quote_summary_rows)."""
+        return select(
+            Quote.id,
+            Quote.quote_number,
+            Customer.name.label('customer_name'),
+            Quote.date_created,
+            Quote.total_cents,
+        ).join(Customer, Customer.id == Quote.customer_id)
+
+    @staticmethod
+    def get_quote_summary_rows(db: Session) -> List[Row]:
         """
-        Retrieves a summary of all quotes.
+        Get one lightweight row per quote for quote lists, newest first.
+
+        Reads the quote's stored total (see src/core/models/quote.py) joined to
+        its customer's name in a single SELECT, without loading any ORM objects.
+
+        Returns:
+            List[Row]: Rows with id, quote_number, customer_name, date_created
+            and total_cents
         """
-        quotes = (
-            db.query(Quote)
-            .options(
-                joinedload(Quote.customer),
-                selectinload(Quote.items),  # Eager load items to calculate total
+        return db.execute(
+            QuoteService._quote_summary_select().order_by(
+                Quote.date_created.desc(), Quote.id.desc()
             )
-            .order_by(Quote.date_created.desc())
-            .all()
+        ).all()
+
+    @staticmethod
+    def get_quote_summary_page(
+        db: Session,
+        cursor: Optional[Sequence[Any]] = None,
+        page_size: int = 100,
+        status: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> Page:
+        """
+        Get a page of quote summary rows, newest first.
+
+        Pages are keyset-paginated on (date_created, id), which the
+        ix_quotes_date_created index serves directly, so fetching a page costs
+        the same at any depth.
+
+        Args:
+            db: Database session
+            cursor: next_cursor of the previous page, i.e. the (date_created,
+                id) of its last quote; None for the first page
+            page_size: Maximum number of quotes per page
+            status: Only quotes with this status
+            customer_id: Only quotes of this customer
+            search: Only quotes whose number or customer name contains this text
+
+        Returns:
+            Page: Summary rows (as get_quote_summary_rows) and the next cursor
+        """
+        statement = QuoteService._quote_summary_select()
+        if status:
+            statement = statement.where(Quote.status == status)
+        if customer_id is not None:
+            statement = statement.where(Quote.customer_id == customer_id)
+        if search:
+            pattern = f'%{search}%'
+            statement = statement.where(
+                Quote.quote_number.ilike(pattern) | Customer.name.ilike(pattern)
+            )
+        return keyset_page(
+            db,
+            statement,
+            (Quote.date_created, Quote.id),
+            cursor=cursor,
+            page_size=page_size,
+            descending=True,
         )
 
+    @staticmethod
+    def get_all_quotes_summary(db: Session) -> List[Dict[str, Any]]:
+        """
+        Retrieves a summary of all quotes.
+        """
         return [
             {
-                'id': quote.id,
-                'quote_number': quote.quote_number,
-                'customer_name': quote.customer.name,
-                'date_created': quote.date_created.strftime('%Y-%m-%d'),
-                'total': quote.total,
+                'id': row.id,
+                'quote_number': row.quote_number,
+                'customer_name': row.customer_name,
+                'date_created': row.date_created.strftime('%Y-%m-%d'),
+                'total': from_cents(row.total_cents),
             }
-            for quote in quotes
+            for row in QuoteService.get_quote_summary_rows(db)
         ]
 
     @staticmethod
@@ -290,9 +367,7 @@ class QuoteService:
         total_quotes = db.query(func.count(Quote.id)).scalar()
 
         # Get total quote value
-        total_quote_value = (
-            db.query(func.sum(QuoteItem.unit_price * QuoteItem.quantity)).scalar() or 0
-        )
+        total_quote_value = from_cents(db.query(LINE_VALUE_CENTS).scalar() or 0)
 
         # Get total unique customers
         total_customers = db.query(
@@ -327,7 +402,7 @@ class QuoteService:
         sales_by_category = (
             db.query(
                 ProductFamily.category,
-                func.sum(QuoteItem.unit_price * QuoteItem.quantity).label('total'),
+                LINE_VALUE_CENTS.label('total_cents'),
             )
             .join(ProductVariant, ProductVariant.product_family_id == ProductFamily.id)
             .join(QuoteItem, QuoteItem.product_id == ProductVariant.id)
@@ -337,12 +412,12 @@ class QuoteService:
 
         # Calculate percentages for each category
         total_sales = (
-            sum(cat.total for cat in sales_by_category) or 1
+            sum(cat.total_cents for cat in sales_by_category) or 1
         )  # Avoid division by zero
         sales_by_category_data = [
             {
                 'category': cat.category,
-                'percentage': round((cat.total / total_sales) * 100),
+                'percentage': round((cat.total_cents / total_sales) * 100),
             }
             for cat in sales_by_category
         ]
@@ -375,7 +450,7 @@ class QuoteService:
         )
 
         current_month_value = (
-            db.query(func.sum(QuoteItem.unit_price * QuoteItem.quantity))
+            db.query(LINE_VALUE_CENTS)
             .join(Quote, Quote.id == QuoteItem.quote_id)
             .filter(Quote.date_created >= last_month)
             .scalar()
@@ -383,7 +458,7 @@ class QuoteService:
         )
 
         previous_month_value = (
-            db.query(func.sum(QuoteItem.unit_price * QuoteItem.quantity))
+            db.query(LINE_VALUE_CENTS)
             .join(Quote, Quote.id == QuoteItem.quote_id)
             .filter(
                 Quote.date_created >= last_month - timedelta(days=30),
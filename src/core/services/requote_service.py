@@ -0,0 +1,383 @@
+"""
+Service for repricing open quotes after a price list change.
+
+This module reprices every line item of every draft or sent quote against a
+published price list version (see src/core/pricing/price_lists.py). Each line
+keeps whatever was negotiated on top of the list price: its unit price moves by
+exactly the change in list price for its configuration between the price list
+in effect when the quote was created and the new one.
+
+The job shards quotes across a process pool. Every worker opens its own
+read-only SQLite connection and builds in-memory price books from the version
+snapshots, so workers never query the catalog. The parent writes repriced unit
+prices back in batched transactions as shards complete and collects a diff
+report.
+
+Example:
+    >>> db = SessionLocal()
+    >>> report = RequoteService.requote_open_quotes(db, "2026-04")
+    >>> report.write_csv("data/requote_2026-04.csv")
+    >>> print(report.summary())
+"""
+
+import csv
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core.database import DEFAULT_SQLITE_SETTINGS, create_sqlite_engine
+from src.core.models import PriceListVersion, ProductVariant, Quote, QuoteItem
+from src.core.models.quote import refresh_totals
+from src.core.pricing.engine import PricingEngine
+from src.core.pricing.price_lists import registry
+from src.utils.money import from_cents, to_cents
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+OPEN_QUOTE_STATUSES = ('draft', 'sent')
+
+# Quotes per worker task and line items per write-back transaction
+DEFAULT_SHARD_SIZE = 50
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ItemRequote:
+    """
+    Repricing result for one quote line item.
+
+    Attributes:
+        quote_id: ID of the quote
+        quote_number: Quote number
+        item_id: ID of the line item
+        quantity: Quantity of the line item
+        old_unit_cents: Unit price before repricing, in cents
+        new_unit_cents: Unit price after repricing, in cents (unchanged if skipped)
+        skipped_reason: Why the item could not be repriced, if it was skipped
+    """
+
+    quote_id: int
+    quote_number: str
+    item_id: int
+    quantity: int
+    old_unit_cents: int
+    new_unit_cents: int
+    skipped_reason: str = ''
+
+    @property
+    def changed(self) -> bool:
+        """Whether repricing changed the unit price."""
+        return self.new_unit_cents != self.old_unit_cents
+
+
+@dataclass
+class RequoteReport:
+    """
+    Diff report of a mass requote.
+
+    Attributes:
+        version: Label of the price list the quotes were repriced against
+        dry_run: True if no prices were written back
+        items: Result for every line item of every open quote
+    """
+
+    version: str
+    dry_run: bool = False
+    items: List[ItemRequote] = field(default_factory=list)
+
+    @property
+    def changed_items(self) -> List[ItemRequote]:
+        """Line items whose unit price changed."""
+        return [item for item in self.items if item.changed]
+
+    @property
+    def skipped_items(self) -> List[ItemRequote]:
+        """Line items that could not be repriced."""
+        return [item for item in self.items if item.skipped_reason]
+
+    def quote_totals(self) -> Dict[str, tuple]:
+        """
+        Get the old and new line value of each quote, in cents.
+
+        Returns:
+            Dict[str, tuple]: (old cents, new cents) by quote number
+        """
+        totals: Dict[str, List[int]] = {}
+        for item in self.items:
+            total = totals.setdefault(item.quote_number, [0, 0])
+            total[0] += item.old_unit_cents * item.quantity
+            total[1] += item.new_unit_cents * item.quantity
+        return {number: tuple(total) for number, total in totals.items()}
+
+    def summary(self) -> str:
+        """Get a one-paragraph summary of the requote."""
+        totals = self.quote_totals()
+        old = sum(old for old, _ in totals.values())
+        new = sum(new for _, new in totals.values())
+        changed_quotes = sum(1 for old, new in totals.values() if old != new)
+        action = 'would change' if self.dry_run else 'changed'
+        return (
+            f'Repriced {len(totals)} open quotes ({len(self.items)} items) against '
+            f'price list {self.version}: {changed_quotes} quotes and '
+            f'{len(self.changed_items)} items {action}, '
+            f'{len(self.skipped_items)} items skipped. '
+            f'Line value ${from_cents(old):,.2f} -> ${from_cents(new):,.2f}.'
+        )
+
+    def write_csv(self, path: str) -> None:
+        """Write the per-item diff report as CSV."""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    'quote_number',
+                    'item_id',
+                    'quantity',
+                    'old_unit_price',
+                    'new_unit_price',
+                    'change',
+                    'skipped_reason',
+                ]
+            )
+            for item in self.items:
+                writer.writerow(
+                    [
+                        item.quote_number,
+                        item.item_id,
+                        item.quantity,
+                        f'{from_cents(item.old_unit_cents):.2f}',
+                        f'{from_cents(item.new_unit_cents):.2f}',
+                        f'{from_cents(item.new_unit_cents - item.old_unit_cents):.2f}',
+                        item.skipped_reason,
+                    ]
+                )
+
+
+class _Repricer:
+    """Reprices line items of a set of quotes against one price list version."""
+
+    def __init__(self, db: Session, version_id: int):
+        self.db = db
+        self.target = PricingEngine(db, registry.book(db, version_id))
+        self._baselines: Dict[int, PricingEngine] = {}
+        # Version in effect on each quote creation date seen by this job
+        self._versions: Dict[date, int] = {}
+
+    def _baseline(self, created: datetime) -> PricingEngine:
+        """Get the engine of the price list in effect when a quote was created."""
+        created = created.date()
+        version_id = self._versions.get(created)
+        if version_id is None:
+            version_id = self._versions[created] = registry.version_id_as_of(
+                self.db, created
+            )
+        engine = self._baselines.get(version_id)
+        if engine is None:
+            engine = self._baselines[version_id] = PricingEngine(
+                self.db, registry.book(self.db, version_id)
+            )
+        return engine
+
+    def reprice(self, quote_ids: Sequence[int]) -> List[ItemRequote]:
+        """Reprice every line item of the given quotes (one query)."""
+        rows = (
+            self.db.query(
+                QuoteItem.id,
+                QuoteItem.quote_id,
+                Quote.quote_number,
+                Quote.date_created,
+                QuoteItem.quantity,
+                QuoteItem.unit_price,
+                QuoteItem.length,
+                QuoteItem.material,
+                QuoteItem.voltage,
+                ProductVariant.product_family_id,
+                ProductVariant.material.label('variant_material'),
+                ProductVariant.voltage.label('variant_voltage'),
+            )
+            .join(Quote, Quote.id == QuoteItem.quote_id)
+            .join(ProductVariant, ProductVariant.id == QuoteItem.product_id)
+            .filter(QuoteItem.quote_id.in_(quote_ids))
+            .order_by(QuoteItem.quote_id, QuoteItem.id)
+        )
+
+        results = []
+        for row in rows:
+            old_cents = to_cents(row.unit_price)
+            new_cents = old_cents
+            reason = ''
+            try:
+                configuration = {
+                    'voltage': row.voltage or row.variant_voltage,
+                    'material': row.material or row.variant_material,
+                    'length': row.length,
+                }
+                baseline = self._baseline(row.date_created or datetime.now())
+                old_list = baseline.price_configuration(
+                    row.product_family_id, **configuration
+                ).price_cents
+                new_list = self.target.price_configuration(
+                    row.product_family_id, **configuration
+                ).price_cents
+                new_cents = old_cents + new_list - old_list
+            except ValueError as e:
+                reason = str(e)
+
+            results.append(
+                ItemRequote(
+                    quote_id=row.quote_id,
+                    quote_number=row.quote_number,
+                    item_id=row.id,
+                    quantity=row.quantity or 1,
+                    old_unit_cents=old_cents,
+                    new_unit_cents=new_cents,
+                    skipped_reason=reason,
+                )
+            )
+        return results
+
+
+# State of a process pool worker, set by _init_worker
+_worker_repricer: Optional[_Repricer] = None
+
+
+def _init_worker(database_path: str, version_id: int) -> None:
+    """Open a read-only connection and load the target price list in a worker."""
+    global _worker_repricer
+    engine = create_sqlite_engine(
+        f'sqlite:///file:{database_path}?mode=ro&uri=true',
+        # A read-only connection cannot change the journal mode
+        replace(DEFAULT_SQLITE_SETTINGS, journal_mode=None),
+    )
+    session = sessionmaker(bind=engine)()
+    _worker_repricer = _Repricer(session, version_id)
+
+
+def _reprice_shard(quote_ids: Sequence[int]) -> List[ItemRequote]:
+    """Reprice one shard of quotes in a worker."""
+    try:
+        return _worker_repricer.reprice(quote_ids)
+    finally:
+        # Release the read lock between shards so the parent can write
+        _worker_repricer.db.rollback()
+
+
+def _shards(ids: Sequence[int], size: int) -> Iterable[List[int]]:
+    for start in range(0, len(ids), size):
+        yield list(ids[start : start + size])
+
+
+class RequoteService:
+    """
+    Service class for repricing open quotes against a new price list.
+
+    The service is implemented using static methods, like the other services.
+    """
+
+    @staticmethod
+    def requote_open_quotes(
+        db: Session,
+        version: str,
+        workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> RequoteReport:
+        """
+        Reprice every draft or sent quote against a published price list.
+
+        Args:
+            db: Database session (used to find the quotes and write back prices)
+            version: Label of the price list version to reprice against
+            workers: Number of worker processes; defaults to the CPU count.
+                     0 or 1 reprices in this process (always the case for an
+                     in-memory database).
+            shard_size: Number of quotes per worker task
+            batch_size: Number of line items written per transaction
+            dry_run: If True, only report the changes
+
+        Returns:
+            RequoteReport: Old and new unit price of every line item
+
+        Raises:
+            ValueError: If the price list version does not exist
+        """
+        version_id = (
+            db.query(PriceListVersion.id)
+            .filter(PriceListVersion.version == version)
+            .scalar()
+        )
+        if version_id is None:
+            raise ValueError(f'Price list version {version} not found')
+
+        quote_ids = [
+            quote_id
+            for (quote_id,) in db.query(Quote.id)
+            .filter(Quote.status.in_(OPEN_QUOTE_STATUSES))
+            .order_by(Quote.id)
+        ]
+        # End the read transaction so workers and write-back see the same data
+        db.commit()
+
+        report = RequoteReport(version=version, dry_run=dry_run)
+        pending: List[ItemRequote] = []
+
+        def collect(results: List[ItemRequote]) -> None:
+            report.items.extend(results)
+            pending.extend(item for item in results if item.changed)
+            if not dry_run and len(pending) >= batch_size:
+                RequoteService._write_back(db, pending)
+                pending.clear()
+
+        database_path = db.get_bind().url.database
+        workers = os.cpu_count() if workers is None else workers
+        shards = list(_shards(quote_ids, max(1, shard_size)))
+        if workers <= 1 or len(shards) <= 1 or database_path in (None, '', ':memory:'):
+            repricer = _Repricer(db, version_id)
+            for shard in shards:
+                collect(repricer.reprice(shard))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(shards)),
+                # Fresh interpreters: never fork the GUI's threads or open connections
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(os.path.abspath(database_path), version_id),
+            ) as pool:
+                futures = [pool.submit(_reprice_shard, shard) for shard in shards]
+                for future in as_completed(futures):
+                    collect(future.result())
+
+        if not dry_run and pending:
+            RequoteService._write_back(db, pending)
+
+        report.items.sort(key=lambda item: (item.quote_id, item.item_id))
+        logger.info(report.summary())
+        return report
+
+    @staticmethod
+    def _write_back(db: Session, items: List[ItemRequote]) -> None:
+        """Write repriced unit prices and the totals they change in one transaction."""
+        try:
+            db.execute(
+                update(QuoteItem),
+                [
+                    {'id': item.item_id, 'unit_price': from_cents(item.new_unit_cents)}
+                    for item in items
+                ],
+            )
+            # Bulk updates bypass the flush that keeps stored totals current
+            refresh_totals(db.connection(), quote_ids={item.quote_id for item in items})
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f'Error writing back repriced items: {e!s}', exc_info=True)
+            raise
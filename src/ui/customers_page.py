@@ -7,20 +7,36 @@ It provides functionality to:
 - Add new customers
 - Edit existing customers
 - View customer details and history
+
+Customers are listed a page at a time, in name order; further pages are
+fetched as the list is scrolled.
 """
 
+import logging
+
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QComboBox,
     QFrame,
     QHBoxLayout,
     QLabel,
     QLineEdit,
     QListWidget,
+    QListWidgetItem,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
+from src.core.database import session_scope
+from src.core.services.customer_service import CustomerService
+
+logger = logging.getLogger(__name__)
+
+# Customers fetched per page, and how close (in scroll steps) to the end of the
+# list the next page is fetched
+CUSTOMER_PAGE_SIZE = 200
+FETCH_MARGIN = 20
+
 
 class CustomersPage(QWidget):
     """
@@ -36,7 +52,10 @@ class CustomersPage(QWidget):
     def __init__(self, parent=None):
         """Initialize the CustomersPage."""
         super().__init__(parent)
+        self._next_cursor = None
+        self._has_more = False
         self.init_ui()
+        self._load_customers()
 
     def init_ui(self):
         """Set up the UI components."""
@@ -78,16 +97,16 @@ class CustomersPage(QWidget):
         header_layout.addWidget(header_title)
         header_layout.addStretch()
 
-        # Filter dropdown
-        self.filter_combo = QComboBox()
-        self.filter_combo.addItems(['All Customers', 'Active', 'Inactive'])
-        header_layout.addWidget(self.filter_combo)
-
         customers_layout.addLayout(header_layout)
 
         # Customers list
         self.customers_list = QListWidget()
         self.customers_list.setMinimumHeight(400)
+        scroll_bar = self.customers_list.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scrolled)
+        scroll_bar.rangeChanged.connect(
+            lambda minimum, maximum: self._on_scrolled(scroll_bar.value())
+        )
         customers_layout.addWidget(self.customers_list)
 
         main_layout.addWidget(customers_card)
@@ -103,14 +122,51 @@ class CustomersPage(QWidget):
 
         # Connect signals
         self.search_bar.textChanged.connect(self._filter_customers)
-        self.filter_combo.currentTextChanged.connect(self._filter_customers)
         self.add_customer_btn.clicked.connect(self._add_customer)
         self.customers_list.itemClicked.connect(self._on_customer_selected)
 
     def _filter_customers(self):
-        """Filter customers based on search text and filter selection."""
-        # TODO: Implement customer filtering logic
-        pass
+        """Filter customers based on the search text."""
+        self._load_customers()
+
+    def _load_customers(self):
+        """Show the first page of customers matching the search text."""
+        self._next_cursor = None
+        self._has_more = False
+        self.customers_list.clear()
+        self._fetch_customers()
+
+    def _fetch_customers(self):
+        """Append the next page of customers to the list."""
+        # Scroll signals emitted while the page is added must not fetch again
+        self._has_more = False
+        with session_scope() as db:
+            try:
+                page = CustomerService.get_customer_page(
+                    db,
+                    cursor=self._next_cursor,
+                    page_size=CUSTOMER_PAGE_SIZE,
+                    search=self.search_bar.text().strip() or None,
+                )
+            except Exception as e:
+                logger.error(f'Error loading customers: {e}', exc_info=True)
+                return
+
+            for customer in page.items:
+                text = customer.name
+                if customer.company:
+                    text = f'{text} - {customer.company}'
+                item = QListWidgetItem(text)
+                item.setData(Qt.UserRole, customer.id)
+                self.customers_list.addItem(item)
+        self._next_cursor = page.next_cursor
+        self._has_more = page.has_more
+
+    def _on_scrolled(self, value):
+        """Fetch the next page when the list is scrolled near its end."""
+        maximum = self.customers_list.verticalScrollBar().maximum()
+        if self._has_more and value >= maximum - FETCH_MARGIN:
+            self._fetch_customers()
 
     def _add_customer(self):
         """Handle add customer button click."""
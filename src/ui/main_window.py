@@ -27,7 +27,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from src.core.database import SessionLocal
+from src.core.database import session_scope
 from src.core.services.quote_service import QuoteService
 from src.ui.analytics_page import AnalyticsPage
 from src.ui.customers_page import CustomersPage
@@ -214,62 +214,62 @@ class MainWindow(QMainWindow):
                 if child.widget():
                     child.widget().deleteLater()
 
-        db = SessionLocal()
-        try:
-            stats = QuoteService.get_dashboard_statistics(db)
-            stats_layout = QHBoxLayout()
-            stats_layout.setSpacing(20)
-
-            card1 = self._create_stat_card(
-                "Total Quotes",
-                str(stats["total_quotes"]),
-                f"{stats['quote_change']:+}% from last month",
-                "📄",
-            )
-            card2 = self._create_stat_card(
-                "Quote Value",
-                f"${stats['total_quote_value']:,.2f}",
-                f"{stats['value_change']:+}% from last month",
-                "$",
-            )
-            card3 = self._create_stat_card(
-                "Customers",
-                str(stats["total_customers"]),
-                "Total unique customers",
-                "👥",
-            )
-            card4 = self._create_stat_card(
-                "Products",
-                str(stats["total_products"]),
-                "Total unique products quoted",
-                "📦",
-            )
-
-            stats_layout.addWidget(card1)
-            stats_layout.addWidget(card2)
-            stats_layout.addWidget(card3)
-            stats_layout.addWidget(card4)
-            overview_layout.addLayout(stats_layout)
-
-            main_content_layout = QHBoxLayout()
-            main_content_layout.setSpacing(20)
-            recent_quotes_group = self._create_recent_quotes_section(
-                stats.get("recent_quotes", [])
-            )
-            main_content_layout.addWidget(recent_quotes_group)
-            sales_category_group = self._create_sales_by_category_section(
-                stats.get("sales_by_category", [])
-            )
-            main_content_layout.addWidget(sales_category_group)
-
-            overview_layout.addLayout(main_content_layout)
-            overview_layout.addStretch()
-
-        except Exception as e:
-            logger.error(f"Error getting dashboard statistics: {e}", exc_info=True)
-            overview_layout.addWidget(QLabel("Could not load dashboard statistics."))
-        finally:
-            db.close()
+        with session_scope() as db:
+            try:
+                stats = QuoteService.get_dashboard_statistics(db)
+                stats_layout = QHBoxLayout()
+                stats_layout.setSpacing(20)
+
+                card1 = self._create_stat_card(
+                    "Total Quotes",
+                    str(stats["total_quotes"]),
+                    f"{stats['quote_change']:+}% from last month",
+                    "📄",
+                )
+                card2 = self._create_stat_card(
+                    "Quote Value",
+                    f"${stats['total_quote_value']:,.2f}",
+                    f"{stats['value_change']:+}% from last month",
+                    "$",
+                )
+                card3 = self._create_stat_card(
+                    "Customers",
+                    str(stats["total_customers"]),
+                    "Total unique customers",
+                    "👥",
+                )
+                card4 = self._create_stat_card(
+                    "Products",
+                    str(stats["total_products"]),
+                    "Total unique products quoted",
+                    "📦",
+                )
+
+                stats_layout.addWidget(card1)
+                stats_layout.addWidget(card2)
+                stats_layout.addWidget(card3)
+                stats_layout.addWidget(card4)
+                overview_layout.addLayout(stats_layout)
+
+                main_content_layout = QHBoxLayout()
+                main_content_layout.setSpacing(20)
+                recent_quotes_group = self._create_recent_quotes_section(
+                    stats.get("recent_quotes", [])
+                )
+                main_content_layout.addWidget(recent_quotes_group)
+                sales_category_group = self._create_sales_by_category_section(
+                    stats.get("sales_by_category", [])
+                )
+                main_content_layout.addWidget(sales_category_group)
+
+                overview_layout.addLayout(main_content_layout)
+                overview_layout.addStretch()
+
+            except Exception as e:
+                logger.error(f"Error getting dashboard statistics: {e}", exc_info=True)
+                overview_layout.addWidget(
+                    QLabel("Could not load dashboard statistics.")
+                )
 
     def _create_stat_card(self, title_text, value_text, sub_text, icon_text=""):
         """Creates a styled card for displaying a statistic."""
@@ -0,0 +1,184 @@
+"""
+Background pricing for the product configuration dialog.
+
+PricingWorker prices configurations on a private QThreadPool so option changes
+never block the Qt main thread. The worker owns its own database session and
+ConfigurationService, which keeps its price ledger and lookup caches between
+requests. Each request carries a full snapshot of the configuration, so when
+options change faster than they can be priced, queued requests are dropped
+and only the latest one is priced (latest wins).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from src.core.database import SessionLocal
+from src.core.services.configuration_service import ConfigurationService
+from src.core.services.product_service import ProductService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PricingRequest:
+    """Snapshot of a configuration to price."""
+
+    request_id: int
+    product_family_id: int
+    product_family_name: str
+    base_product: Dict[str, Any] = field(default_factory=dict)
+    selected_options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PricingResult:
+    """Price and model number computed for a pricing request."""
+
+    request_id: int
+    final_price: float
+    model_number: str
+
+
+class _PricingTask(QRunnable):
+    """Runnable that prices one request unless a newer one has arrived."""
+
+    def __init__(self, worker: "PricingWorker", request: PricingRequest):
+        super().__init__()
+        self.worker = worker
+        self.request = request
+
+    def run(self):
+        self.worker._run(self.request)
+
+
+class PricingWorker(QObject):
+    """
+    Prices configurations off the GUI thread, delivering results by signal.
+
+    Signals:
+        price_ready(float, str): Final price and model number of the latest
+            configuration
+        price_failed(str): Error message if pricing the latest request failed
+    """
+
+    price_ready = Signal(float, str)
+    price_failed = Signal(str)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # One thread: the session and service are never used concurrently
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._lock = threading.Lock()
+        self._latest_id = 0
+        self._latest_result: Optional[PricingResult] = None
+
+        self._db = SessionLocal()
+        self._config_service = ConfigurationService(self._db, ProductService(self._db))
+
+    def request_price(
+        self,
+        product_family_id: int,
+        product_family_name: str,
+        base_product: Dict[str, Any],
+        selected_options: Dict[str, Any],
+    ) -> int:
+        """
+        Queue a configuration for pricing, superseding any pending request.
+
+        Returns:
+            int: ID of the queued request
+        """
+        with self._lock:
+            self._latest_id += 1
+            request = PricingRequest(
+                request_id=self._latest_id,
+                product_family_id=product_family_id,
+                product_family_name=product_family_name,
+                base_product=dict(base_product),
+                selected_options=dict(selected_options),
+            )
+        # Requests still waiting in the queue are stale now
+        self._pool.clear()
+        self._pool.start(_PricingTask(self, request))
+        return request.request_id
+
+    def _is_stale(self, request: PricingRequest) -> bool:
+        with self._lock:
+            return request.request_id != self._latest_id
+
+    def _run(self, request: PricingRequest):
+        """Price a request on the pool thread."""
+        if self._is_stale(request):
+            return
+
+        try:
+            config = self._sync_configuration(request)
+            result = PricingResult(
+                request_id=request.request_id,
+                final_price=config.final_price,
+                model_number=config.model_number,
+            )
+        except Exception as e:
+            logger.error(f"Error pricing configuration: {e!s}", exc_info=True)
+            self._db.rollback()
+            if not self._is_stale(request):
+                self.price_failed.emit(str(e))
+            return
+
+        with self._lock:
+            if request.request_id != self._latest_id:
+                return
+            self._latest_result = result
+        self.price_ready.emit(result.final_price, result.model_number)
+
+    def _sync_configuration(self, request: PricingRequest):
+        """Bring the worker's configuration in line with a request snapshot."""
+        service = self._config_service
+        config = service.current_config
+        if (
+            config is None
+            or config.product_family_id != request.product_family_id
+            or config.base_product != request.base_product
+            or not config.selected_options.keys() <= request.selected_options.keys()
+        ):
+            service.start_configuration(
+                product_family_id=request.product_family_id,
+                product_family_name=request.product_family_name,
+                base_product_info=request.base_product,
+            )
+            config = service.current_config
+
+        # Only options that changed since the last request are repriced
+        for name, value in request.selected_options.items():
+            if config.selected_options.get(name, object()) != value:
+                service.select_option(name, value)
+        return config
+
+    def wait_for_latest(self) -> Optional[PricingResult]:
+        """
+        Block until pending requests finish and return the latest result.
+
+        Returns:
+            Optional[PricingResult]: Result of the latest request, or None if
+            it failed or nothing has been priced
+        """
+        self._pool.waitForDone()
+        with self._lock:
+            result = self._latest_result
+            if result is None or result.request_id != self._latest_id:
+                return None
+            return result
+
+    def shutdown(self):
+        """Drop pending requests, wait for the running one and close the session."""
+        with self._lock:
+            self._latest_id += 1
+        self._pool.clear()
+        self._pool.waitForDone()
+        self._db.close()
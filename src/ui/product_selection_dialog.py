@@ -33,6 +33,8 @@ from PySide6.QtWidgets import (
 from src.core.database import SessionLocal
 from src.core.services.configuration_service import ConfigurationService
 from src.core.services.product_service import ProductService
+from src.ui.pricing_worker import PricingWorker
+from src.utils.option_constraints import OptionSelection
 
 # Set up logging with more detailed format
 logging.basicConfig(
@@ -68,9 +70,15 @@ class ProductSelectionDialog(QDialog):
         self.product_service = product_service
         self.config_service = ConfigurationService(self.db, self.product_service)
 
+        # Pricing runs off the GUI thread; results arrive by signal
+        self.pricing_worker = PricingWorker(self)
+        self.pricing_worker.price_ready.connect(self._on_price_calculated)
+        self.pricing_worker.price_failed.connect(self._on_price_failed)
+
         # State
         self.products = []
         self.quantity = 1  # Default quantity
+        self._option_selection: Optional[OptionSelection] = None
         self._fetch_products()
 
         self._init_ui()
@@ -78,6 +86,11 @@ class ProductSelectionDialog(QDialog):
         if self.is_edit_mode:
             self._populate_for_edit()
 
+    def done(self, result: int):
+        """Stop background pricing before the dialog closes."""
+        self.pricing_worker.shutdown()
+        super().done(result)
+
     def __del__(self):
         # Ensure the database session is closed when the dialog is destroyed
         if self.db:
@@ -194,9 +207,11 @@ class ProductSelectionDialog(QDialog):
                 product_family_id=product_data["id"],
                 product_family_name=product_data["name"],
                 base_product_info=product_data,
+                update_price=False,
             )
             self.quantity = 1
             self._show_product_config(product_data)
+            self._request_price()
         except Exception as e:
             logger.error(f"Error starting configuration: {e!s}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to configure product: {e!s}")
@@ -214,6 +229,7 @@ class ProductSelectionDialog(QDialog):
         logger.debug(f"Showing product config for: {product['name']}")
         self._clear_config_panel()
         self.option_widgets = {}
+        self._start_option_selection()
 
         form_layout = QFormLayout()
         form_layout.setSpacing(15)
@@ -247,6 +263,53 @@ class ProductSelectionDialog(QDialog):
         self._setup_add_button()
         self._update_total_price()
         self._update_model_number_label()
+        if self._option_selection:
+            self._apply_option_constraints(self._option_selection.constraints.names)
+
+    def _start_option_selection(self):
+        """Track the configuration's selection against its family's option rules."""
+        self._option_selection = None
+        config = self.config_service.current_config
+        if not config:
+            return
+        try:
+            constraints = self.product_service.get_option_constraints(
+                config.product_family_id
+            )
+            self._option_selection = OptionSelection(
+                constraints, config.selected_options
+            )
+        except Exception as e:
+            logger.error(f"Error loading option rules: {e!s}", exc_info=True)
+
+    def _track_option_selection(self, option_name: str, value):
+        """Update the option selection and narrow the options it affects."""
+        if self._option_selection:
+            changed = self._option_selection.set(option_name, value)
+            self._apply_option_constraints(changed)
+
+    def _apply_option_constraints(self, option_names):
+        """Enable the given options if they are valid for the selection.
+
+        Selected options stay enabled so the selection can always be undone.
+        """
+        selection = self._option_selection
+        mechanical_list = self.option_widgets.get("Mechanical Options")
+        for name in option_names:
+            enabled = selection.is_valid(name) or selection.is_selected(name)
+            widget = self.option_widgets.get(name)
+            if widget is not None:
+                widget.setEnabled(enabled)
+            if isinstance(mechanical_list, QListWidget):
+                for row in range(mechanical_list.count()):
+                    item = mechanical_list.item(row)
+                    if item.data(Qt.UserRole)["name"] == name:
+                        flags = item.flags()
+                        item.setFlags(
+                            flags | Qt.ItemIsEnabled
+                            if enabled
+                            else flags & ~Qt.ItemIsEnabled
+                        )
 
     def _setup_core_options(self, form_layout: QFormLayout, product: dict):
         """Set up the core configuration options for the selected product."""
@@ -721,27 +784,42 @@ class ProductSelectionDialog(QDialog):
         self.add_button.clicked.connect(self._on_add_to_quote)
         self.config_layout.addWidget(self.add_button)
 
+    def _request_price(self):
+        """Queue the current configuration for pricing on the pricing worker."""
+        config = self.config_service.current_config
+        if not config:
+            return
+        self.pricing_worker.request_price(
+            config.product_family_id,
+            config.product_family_name,
+            config.base_product,
+            config.selected_options,
+        )
+
+    def _on_price_calculated(self, final_price: float, model_number: str):
+        """Store a price delivered by the pricing worker and display it."""
+        config = self.config_service.current_config
+        if not config:
+            return
+        config.final_price = final_price
+        config.model_number = model_number
+        self._update_total_price()
+
+    def _on_price_failed(self, message: str):
+        """Handle a pricing error reported by the pricing worker."""
+        logger.warning(f"Background pricing failed: {message}")
+        self._update_total_price()
+
     def _update_total_price(self):
         """Update the total price display."""
         try:
-            logger.info("Starting total price update in dialog")
             if not self.config_service.current_config:
                 logger.warning("No current configuration when updating total price")
                 self.total_price_label.setText("$0.00")
                 return
 
             final_price = self.config_service.current_config.final_price
-            logger.info(
-                f"Retrieved final price from config service: ${final_price:,.2f}"
-            )
-
-            # Format the price
-            formatted_price = f"${final_price:,.2f}"
-            logger.info(f"Formatted price for display: {formatted_price}")
-
-            # Update the label
-            self.total_price_label.setText(formatted_price)
-            logger.info("Updated total price label in UI")
+            self.total_price_label.setText(f"${final_price:,.2f}")
 
         except Exception as e:
             logger.error(f"Error updating total price: {e!s}", exc_info=True)
@@ -769,13 +847,12 @@ class ProductSelectionDialog(QDialog):
     ):
         """Handle changes to any option value."""
         try:
-            logger.info(f"Option changed: {option_name}={value}")
-            self.config_service.select_option(option_name, value)
-            logger.info("Updated configuration service with new option")
+            logger.debug(f"Option changed: {option_name}={value}")
+            self.config_service.select_option(option_name, value, update_price=False)
+            self._track_option_selection(option_name, value)
 
-            # Update the price display
-            self._update_total_price()
-            logger.info("Triggered total price update after option change")
+            # Reprice in the background; the price label updates on completion
+            self._request_price()
             self._update_model_number_label()
         except Exception as e:
             logger.error(f"Error handling option change: {e!s}", exc_info=True)
@@ -823,9 +900,11 @@ class ProductSelectionDialog(QDialog):
 
         # Add selected connection type to config
         self.config_service.select_option(
-            "Connection Type", selected_type if selected_type != "None" else None
+            "Connection Type",
+            selected_type if selected_type != "None" else None,
+            update_price=False,
         )
-        self._update_total_price()
+        self._request_price()
 
         if selected_type == "None":
             return
@@ -904,8 +983,10 @@ class ProductSelectionDialog(QDialog):
         if sender_combo:
             actual_value = sender_combo.currentData()
             logger.debug(f"Sub-option '{option_name}' changed to '{actual_value}'")
-            self.config_service.select_option(option_name, actual_value)
-            self._update_total_price()
+            self.config_service.select_option(
+                option_name, actual_value, update_price=False
+            )
+            self._request_price()
 
     def _clear_config_panel(self):
         """Clears all widgets from the configuration panel."""
@@ -936,6 +1017,11 @@ class ProductSelectionDialog(QDialog):
             QMessageBox.warning(self, "Warning", "Please select a product.")
             return
 
+        # Make sure the latest option change has been priced
+        result = self.pricing_worker.wait_for_latest()
+        if result:
+            self._on_price_calculated(result.final_price, result.model_number)
+
         final_config = self.config_service.current_config
         product_data = {
             "id": str(final_config.product_family_id),
@@ -1077,11 +1163,12 @@ class ProductSelectionDialog(QDialog):
 
         # Always use select_option for both selection and deselection
         if is_selected:
-            self.config_service.select_option(option_name, price)
+            self.config_service.select_option(option_name, price, update_price=False)
         else:
-            self.config_service.select_option(option_name, None)
+            self.config_service.select_option(option_name, None, update_price=False)
+        self._track_option_selection(option_name, price if is_selected else None)
 
-        self._update_total_price()
+        self._request_price()
 
     def _update_option_price(self, option_name: str, value: any):
         """Update the price display for a specific option."""
@@ -16,12 +16,18 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from src.core.database import SessionLocal
+from src.core.database import session_scope
 from src.core.services.export_service import QuoteExportService
 from src.core.services.quote_service import QuoteService
+from src.utils.money import from_cents
 
 logger = logging.getLogger(__name__)
 
+# Quotes fetched per page, and how close (in scroll steps) to the end of the
+# list the next page is fetched
+QUOTE_PAGE_SIZE = 200
+FETCH_MARGIN = 20
+
 
 class QuoteSelectionDialog(QDialog):
     """
@@ -35,6 +41,8 @@ class QuoteSelectionDialog(QDialog):
         self.setWindowTitle('Load Quote')
         self.setMinimumSize(600, 400)
         self.selected_quote_id = None
+        self._next_cursor = None
+        self._has_more = False
         self.init_ui()
         self.populate_quotes()
 
@@ -43,6 +51,11 @@ class QuoteSelectionDialog(QDialog):
 
         self.quote_list = QListWidget()
         self.quote_list.itemDoubleClicked.connect(self.accept)
+        scroll_bar = self.quote_list.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scrolled)
+        scroll_bar.rangeChanged.connect(
+            lambda minimum, maximum: self._on_scrolled(scroll_bar.value())
+        )
         main_layout.addWidget(self.quote_list)
 
         button_layout = QHBoxLayout()
@@ -68,27 +81,43 @@ class QuoteSelectionDialog(QDialog):
         self.delete_btn.setEnabled(len(self.quote_list.selectedItems()) > 0)
 
     def populate_quotes(self):
+        """Show the newest quotes; older pages are fetched as the list scrolls."""
+        self._next_cursor = None
+        self._has_more = False
         self.quote_list.clear()
-        db = SessionLocal()
-        try:
-            # This method will be re-added in the next step
-            quotes = QuoteService.get_all_quotes_summary(db)
-            if not quotes:
-                self.quote_list.addItem('No quotes found.')
+        self._fetch_quotes()
+        if self.quote_list.count() == 0:
+            self.quote_list.addItem('No quotes found.')
+
+    def _fetch_quotes(self):
+        """Append the next page of quotes to the list."""
+        # Scroll signals emitted while the page is added must not fetch again
+        self._has_more = False
+        with session_scope() as db:
+            try:
+                page = QuoteService.get_quote_summary_page(
+                    db, cursor=self._next_cursor, page_size=QUOTE_PAGE_SIZE
+                )
+            except Exception as e:
+                logger.error(f'Error populating quotes: {e}', exc_info=True)
+                QMessageBox.critical(
+                    self, 'Error', 'Could not load quotes from the database.'
+                )
                 return
 
-            for quote in quotes:
-                item_text = f"Quote {quote['quote_number']} - {quote['customer_name']} - ${quote['total']:,.2f} ({quote['date_created']})"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, quote['id'])
-                self.quote_list.addItem(item)
-        except Exception as e:
-            logger.error(f'Error populating quotes: {e}', exc_info=True)
-            QMessageBox.critical(
-                self, 'Error', 'Could not load quotes from the database.'
-            )
-        finally:
-            db.close()
+        for row in page.items:
+            item_text = f"Quote {row.quote_number} - {row.customer_name} - ${from_cents(row.total_cents):,.2f} ({row.date_created:%Y-%m-%d})"
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.UserRole, row.id)
+            self.quote_list.addItem(item)
+        self._next_cursor = page.next_cursor
+        self._has_more = page.has_more
+
+    def _on_scrolled(self, value):
+        """Fetch the next page when the list is scrolled near its end."""
+        maximum = self.quote_list.verticalScrollBar().maximum()
+        if self._has_more and value >= maximum - FETCH_MARGIN:
+            self._fetch_quotes()
 
     def delete_quote(self):
         selected_items = self.quote_list.selectedItems()
@@ -107,27 +136,27 @@ class QuoteSelectionDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
-            db = SessionLocal()
-            try:
-                success = QuoteService.delete_quote(db, quote_id)
-                if success:
-                    QMessageBox.information(
-                        self, 'Success', 'Quote deleted successfully.'
-                    )
-                    self.quote_deleted.emit()
-                    # Refresh the list
-                    self.populate_quotes()
-                else:
-                    QMessageBox.warning(
-                        self, 'Error', 'Could not find the quote to delete.'
+            with session_scope() as db:
+                try:
+                    success = QuoteService.delete_quote(db, quote_id)
+                    if success:
+                        QMessageBox.information(
+                            self, 'Success', 'Quote deleted successfully.'
+                        )
+                        self.quote_deleted.emit()
+                        # Refresh the list
+                        self.populate_quotes()
+                    else:
+                        QMessageBox.warning(
+                            self, 'Error', 'Could not find the quote to delete.'
+                        )
+                except Exception as e:
+                    logger.error(f'Error deleting quote: {e}', exc_info=True)
+                    QMessageBox.critical(
+                        self,
+                        'Error',
+                        f'An error occurred while deleting the quote: {e}',
                     )
-            except Exception as e:
-                logger.error(f'Error deleting quote: {e}', exc_info=True)
-                QMessageBox.critical(
-                    self, 'Error', f'An error occurred while deleting the quote: {e}'
-                )
-            finally:
-                db.close()
 
     def export_quote(self):
         selected_items = self.quote_list.selectedItems()
@@ -138,37 +167,35 @@ class QuoteSelectionDialog(QDialog):
             return
 
         quote_id = selected_items[0].data(Qt.UserRole)
-        db = SessionLocal()
-        try:
-            quote_details = QuoteService.get_quote_details(db, quote_id)
-            if not quote_details:
-                QMessageBox.critical(self, 'Error', 'Could not find quote details.')
-                return
+        with session_scope() as db:
+            try:
+                quote_details = QuoteService.get_quote_details(db, quote_id)
+                if not quote_details:
+                    QMessageBox.critical(self, 'Error', 'Could not find quote details.')
+                    return
 
-            customer_name = quote_details['customer']['name'].replace(' ', '_')
-            quote_number = quote_details['quote_number']
-            default_filename = f'Quote_{quote_number}_{customer_name}.docx'
+                customer_name = quote_details['customer']['name'].replace(' ', '_')
+                quote_number = quote_details['quote_number']
+                default_filename = f'Quote_{quote_number}_{customer_name}.docx'
 
-            # For now, we assume a template exists at this path.
-            # We will create this template next.
-            template_path = 'data/templates/quote_template.docx'
+                # For now, we assume a template exists at this path.
+                # We will create this template next.
+                template_path = 'data/templates/quote_template.docx'
 
-            save_path, _ = QFileDialog.getSaveFileName(
-                self, 'Save Quote', default_filename, 'Word Documents (*.docx)'
-            )
-
-            if save_path:
-                exporter = QuoteExportService(template_path)
-                exporter.generate_word_document(quote_details, save_path)
-                QMessageBox.information(
-                    self, 'Success', f'Quote successfully exported to {save_path}'
+                save_path, _ = QFileDialog.getSaveFileName(
+                    self, 'Save Quote', default_filename, 'Word Documents (*.docx)'
                 )
 
-        except Exception as e:
-            logger.error(f'Error exporting quote: {e}', exc_info=True)
-            QMessageBox.critical(self, 'Error', f'Could not export quote: {e}')
-        finally:
-            db.close()
+                if save_path:
+                    exporter = QuoteExportService(template_path)
+                    exporter.generate_word_document(quote_details, save_path)
+                    QMessageBox.information(
+                        self, 'Success', f'Quote successfully exported to {save_path}'
+                    )
+
+            except Exception as e:
+                logger.error(f'Error exporting quote: {e}', exc_info=True)
+                QMessageBox.critical(self, 'Error', f'Could not export quote: {e}')
 
     def accept(self):
         selected_items = self.quote_list.selectedItems()
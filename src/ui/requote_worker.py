@@ -0,0 +1,70 @@
+"""
+Background mass requote for the settings page.
+
+RequoteWorker runs RequoteService.requote_open_quotes on a QThreadPool so the
+Qt main thread stays responsive while open quotes are repriced. The job itself
+shards quotes across worker processes; this thread only waits for them and
+writes the results back with its own database session.
+"""
+
+import logging
+from typing import Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from src.core.database import session_scope
+from src.core.services.requote_service import RequoteReport, RequoteService
+
+logger = logging.getLogger(__name__)
+
+
+class _RequoteTask(QRunnable):
+    """Runnable that reprices open quotes and writes the diff report."""
+
+    def __init__(self, worker: "RequoteWorker", version: str, report_path: str):
+        super().__init__()
+        self.worker = worker
+        self.version = version
+        self.report_path = report_path
+
+    def run(self):
+        try:
+            with session_scope() as db:
+                report = RequoteService.requote_open_quotes(db, self.version)
+            report.write_csv(self.report_path)
+        except Exception as e:
+            logger.error(f"Error requoting open quotes: {e!s}", exc_info=True)
+            self.worker.failed.emit(str(e))
+            return
+        self.worker.finished.emit(report, self.report_path)
+
+
+class RequoteWorker(QObject):
+    """
+    Reprices open quotes off the GUI thread, delivering the outcome by signal.
+
+    Signals:
+        finished(RequoteReport, str): Report of the requote and the path of
+            its CSV diff report
+        failed(str): Error message if the requote failed
+    """
+
+    finished = Signal(RequoteReport, str)
+    failed = Signal(str)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def start(self, version: str, report_path: str):
+        """Queue a requote against a price list version."""
+        self._pool.start(_RequoteTask(self, version, report_path))
+
+    def is_running(self) -> bool:
+        """Whether a requote is queued or running."""
+        return self._pool.activeThreadCount() > 0
+
+    def wait(self):
+        """Block until the running requote finishes."""
+        self._pool.waitForDone()
@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QMessageBox,
@@ -25,7 +26,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.core.database import session_scope
+from src.core.models import PriceListVersion
 from src.core.services.settings_service import SettingsService
+from src.ui.requote_worker import RequoteWorker
 from src.ui.themes import THEMES
 
 
@@ -40,6 +44,7 @@ class SettingsPage(QWidget):
         super().__init__(parent)
         self.setWindowTitle('Settings')
         self.settings_service = SettingsService()
+        self.requote_worker = RequoteWorker(self)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -90,6 +95,9 @@ class SettingsPage(QWidget):
         self.reseed_btn = QPushButton('Reseed Database')
         db_layout.addWidget(self.reseed_btn)
 
+        self.requote_btn = QPushButton('Reprice Open Quotes...')
+        db_layout.addWidget(self.requote_btn)
+
         main_layout.addWidget(db_group)
 
         main_layout.addStretch()
@@ -109,6 +117,9 @@ class SettingsPage(QWidget):
         self.save_btn.clicked.connect(self.save_settings)
         self.browse_export_path_btn.clicked.connect(self.browse_for_export_path)
         self.reseed_btn.clicked.connect(self.reseed_database)
+        self.requote_btn.clicked.connect(self.requote_open_quotes)
+        self.requote_worker.finished.connect(self._on_requote_finished)
+        self.requote_worker.failed.connect(self._on_requote_failed)
         self.theme_combo.currentTextChanged.connect(self.theme_changed.emit)
 
     def load_settings(self):
@@ -203,3 +214,68 @@ class SettingsPage(QWidget):
                 QMessageBox.critical(
                     self, 'Error', f'An unexpected error occurred: {e}'
                 )
+
+    def requote_open_quotes(self):
+        """Reprice all draft and sent quotes against a published price list."""
+        with session_scope() as db:
+            versions = [
+                version
+                for (version,) in db.query(PriceListVersion.version).order_by(
+                    PriceListVersion.effective_date.desc()
+                )
+            ]
+
+        if not versions:
+            QMessageBox.information(
+                self,
+                'Reprice Open Quotes',
+                'No price list versions have been published.',
+            )
+            return
+
+        version, ok = QInputDialog.getItem(
+            self,
+            'Reprice Open Quotes',
+            'Price list version:',
+            versions,
+            0,
+            False,
+        )
+        if not ok:
+            return
+
+        reply = QMessageBox.question(
+            self,
+            'Reprice Open Quotes',
+            f'This will update the unit prices of all draft and sent quotes to price list {version}. Are you sure you want to continue?',
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        report_path = os.path.join(
+            self.default_export_path_input.text() or os.path.expanduser('~'),
+            f'requote_{version}.csv',
+        )
+        self.requote_btn.setEnabled(False)
+        self.requote_btn.setText('Repricing...')
+        self.requote_worker.start(version, report_path)
+
+    def _on_requote_finished(self, report, report_path):
+        self._reset_requote_button()
+        QMessageBox.information(
+            self,
+            'Reprice Open Quotes',
+            f'{report.summary()}\n\nDiff report saved to {report_path}',
+        )
+
+    def _on_requote_failed(self, message):
+        self._reset_requote_button()
+        QMessageBox.critical(
+            self, 'Error', f'Failed to reprice open quotes:\n{message}'
+        )
+
+    def _reset_requote_button(self):
+        self.requote_btn.setEnabled(True)
+        self.requote_btn.setText('Reprice Open Quotes...')
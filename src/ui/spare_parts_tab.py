@@ -29,7 +29,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from src.core.database import SessionLocal
+from src.core.database import session_scope
 from src.core.models import ProductFamily, SparePart
 from src.core.services.spare_part_service import SparePartService
 
@@ -47,7 +47,6 @@ class SparePartsTab(QWidget):
     system for seamless part addition.
 
     Attributes:
-        db (Session): Database session for data access
         spare_part_service (SparePartService): Service for spare part operations
         family_filter (QComboBox): Dropdown for product family filtering
         category_filter (QComboBox): Dropdown for category filtering
@@ -75,7 +74,6 @@ class SparePartsTab(QWidget):
             parent (QWidget, optional): Parent widget. Defaults to None.
         """
         super().__init__(parent)
-        self.db = SessionLocal()
         self.spare_part_service = SparePartService()
         self.init_ui()
 
@@ -180,9 +178,10 @@ class SparePartsTab(QWidget):
         Queries the database for all product families and adds them
         to the family filter dropdown.
         """
-        families = self.db.query(ProductFamily).all()
-        for family in families:
-            self.family_filter.addItem(family.name, family.id)
+        with session_scope() as db:
+            families = db.query(ProductFamily).all()
+            for family in families:
+                self.family_filter.addItem(family.name, family.id)
 
     def populate_category_filter(self):
         """
@@ -191,9 +190,10 @@ class SparePartsTab(QWidget):
         Queries the spare part service for all available categories
         and adds them to the category filter dropdown.
         """
-        categories = self.spare_part_service.get_spare_part_categories(self.db)
-        for category in categories:
-            self.category_filter.addItem(category.capitalize(), category)
+        with session_scope() as db:
+            categories = self.spare_part_service.get_spare_part_categories(db)
+            for category in categories:
+                self.category_filter.addItem(category.capitalize(), category)
 
     def load_spare_parts(self):
         """
@@ -205,38 +205,41 @@ class SparePartsTab(QWidget):
         # Clear existing items
         self.parts_table.setRowCount(0)
 
-        # Get all spare parts
-        parts = self.spare_part_service.get_all_spare_parts(self.db)
-
-        # Sort by product family name, then part number
-        parts = sorted(
-            parts,
-            key=lambda p: (
-                p.product_family.name if p.product_family else '',
-                p.part_number or '',
-            ),
-        )
-
-        print(f'Loading {len(parts)} spare parts')
-
-        # Populate table
-        self.parts_table.setRowCount(len(parts))
-        for row, part in enumerate(parts):
-            family_name = part.product_family.name if part.product_family else ''
-
-            # Create table items
-            self.parts_table.setItem(row, 0, QTableWidgetItem(part.part_number))
-            self.parts_table.setItem(row, 1, QTableWidgetItem(part.name))
-            self.parts_table.setItem(
-                row,
-                2,
-                QTableWidgetItem(part.category.capitalize() if part.category else ''),
+        with session_scope() as db:
+            # Get all spare parts
+            parts = self.spare_part_service.get_all_spare_parts(db)
+
+            # Sort by product family name, then part number
+            parts = sorted(
+                parts,
+                key=lambda p: (
+                    p.product_family.name if p.product_family else '',
+                    p.part_number or '',
+                ),
             )
-            self.parts_table.setItem(row, 3, QTableWidgetItem(family_name))
-            self.parts_table.setItem(row, 4, QTableWidgetItem(f'${part.price:.2f}'))
 
-            # Store part ID in the first column item
-            self.parts_table.item(row, 0).setData(Qt.UserRole, part.id)
+            print(f'Loading {len(parts)} spare parts')
+
+            # Populate table
+            self.parts_table.setRowCount(len(parts))
+            for row, part in enumerate(parts):
+                family_name = part.product_family.name if part.product_family else ''
+
+                # Create table items
+                self.parts_table.setItem(row, 0, QTableWidgetItem(part.part_number))
+                self.parts_table.setItem(row, 1, QTableWidgetItem(part.name))
+                self.parts_table.setItem(
+                    row,
+                    2,
+                    QTableWidgetItem(
+                        part.category.capitalize() if part.category else ''
+                    ),
+                )
+                self.parts_table.setItem(row, 3, QTableWidgetItem(family_name))
+                self.parts_table.setItem(row, 4, QTableWidgetItem(f'${part.price:.2f}'))
+
+                # Store part ID in the first column item
+                self.parts_table.item(row, 0).setData(Qt.UserRole, part.id)
 
     def show_debug_info(self):
         """
@@ -248,46 +251,47 @@ class SparePartsTab(QWidget):
         data consistency issues.
         """
         try:
-            # Get counts of spare parts
-            all_parts = self.spare_part_service.get_all_spare_parts(self.db)
-
-            # Get LS2000 and LS2100 product family IDs
-            ls2000 = (
-                self.db.query(ProductFamily)
-                .filter(ProductFamily.name == 'LS2000')
-                .first()
-            )
-            ls2100 = (
-                self.db.query(ProductFamily)
-                .filter(ProductFamily.name == 'LS2100')
-                .first()
-            )
-
-            debug_info = f'Total spare parts: {len(all_parts)}\n\n'
-
-            if ls2000:
-                ls2000_parts = (
-                    self.db.query(SparePart)
-                    .filter(SparePart.product_family_id == ls2000.id)
-                    .all()
+            with session_scope() as db:
+                # Get counts of spare parts
+                all_parts = self.spare_part_service.get_all_spare_parts(db)
+
+                # Get LS2000 and LS2100 product family IDs
+                ls2000 = (
+                    db.query(ProductFamily)
+                    .filter(ProductFamily.name == 'LS2000')
+                    .first()
                 )
-                debug_info += f'LS2000 parts count: {len(ls2000_parts)}\n'
-                for part in ls2000_parts:
-                    debug_info += f'  - {part.part_number} ({part.name})\n'
-            else:
-                debug_info += 'LS2000 product family not found\n'
-
-            if ls2100:
-                ls2100_parts = (
-                    self.db.query(SparePart)
-                    .filter(SparePart.product_family_id == ls2100.id)
-                    .all()
+                ls2100 = (
+                    db.query(ProductFamily)
+                    .filter(ProductFamily.name == 'LS2100')
+                    .first()
                 )
-                debug_info += f'\nLS2100 parts count: {len(ls2100_parts)}\n'
-                for part in ls2100_parts:
-                    debug_info += f'  - {part.part_number} ({part.name})\n'
-            else:
-                debug_info += '\nLS2100 product family not found\n'
+
+                debug_info = f'Total spare parts: {len(all_parts)}\n\n'
+
+                if ls2000:
+                    ls2000_parts = (
+                        db.query(SparePart)
+                        .filter(SparePart.product_family_id == ls2000.id)
+                        .all()
+                    )
+                    debug_info += f'LS2000 parts count: {len(ls2000_parts)}\n'
+                    for part in ls2000_parts:
+                        debug_info += f'  - {part.part_number} ({part.name})\n'
+                else:
+                    debug_info += 'LS2000 product family not found\n'
+
+                if ls2100:
+                    ls2100_parts = (
+                        db.query(SparePart)
+                        .filter(SparePart.product_family_id == ls2100.id)
+                        .all()
+                    )
+                    debug_info += f'\nLS2100 parts count: {len(ls2100_parts)}\n'
+                    for part in ls2100_parts:
+                        debug_info += f'  - {part.part_number} ({part.name})\n'
+                else:
+                    debug_info += '\nLS2100 product family not found\n'
 
             QMessageBox.information(self, 'Spare Parts Debug Info', debug_info)
         except Exception as e:
@@ -308,59 +312,62 @@ class SparePartsTab(QWidget):
         # Clear existing items
         self.parts_table.setRowCount(0)
 
-        # Get filtered parts
-        if family_id and category:
-            # Both filters applied
-            family = self.db.query(ProductFamily).get(family_id)
-            if family:
-                parts = (
-                    self.db.query(SparePart)
-                    .filter(
-                        SparePart.product_family_id == family_id,
-                        SparePart.category == category,
+        with session_scope() as db:
+            # Get filtered parts
+            if family_id and category:
+                # Both filters applied
+                family = db.query(ProductFamily).get(family_id)
+                if family:
+                    parts = (
+                        db.query(SparePart)
+                        .filter(
+                            SparePart.product_family_id == family_id,
+                            SparePart.category == category,
+                        )
+                        .all()
+                    )
+                else:
+                    parts = []
+            elif family_id:
+                # Only family filter
+                family = db.query(ProductFamily).get(family_id)
+                if family:
+                    parts = (
+                        db.query(SparePart)
+                        .filter(SparePart.product_family_id == family_id)
+                        .all()
                     )
-                    .all()
+                else:
+                    parts = []
+            elif category:
+                # Only category filter
+                parts = self.spare_part_service.get_spare_parts_by_category(
+                    db, category
                 )
             else:
-                parts = []
-        elif family_id:
-            # Only family filter
-            family = self.db.query(ProductFamily).get(family_id)
-            if family:
-                parts = (
-                    self.db.query(SparePart)
-                    .filter(SparePart.product_family_id == family_id)
-                    .all()
+                # No filters
+                parts = self.spare_part_service.get_all_spare_parts(db)
+
+            # Populate table
+            self.parts_table.setRowCount(len(parts))
+            for row, part in enumerate(parts):
+                family_name = part.product_family.name if part.product_family else ''
+
+                # Create table items
+                self.parts_table.setItem(row, 0, QTableWidgetItem(part.part_number))
+                self.parts_table.setItem(row, 1, QTableWidgetItem(part.name))
+                self.parts_table.setItem(
+                    row,
+                    2,
+                    QTableWidgetItem(
+                        part.category.capitalize() if part.category else ''
+                    ),
                 )
-            else:
-                parts = []
-        elif category:
-            # Only category filter
-            parts = self.spare_part_service.get_spare_parts_by_category(
-                self.db, category
-            )
-        else:
-            # No filters
-            parts = self.spare_part_service.get_all_spare_parts(self.db)
-
-        # Populate table
-        self.parts_table.setRowCount(len(parts))
-        for row, part in enumerate(parts):
-            family_name = part.product_family.name if part.product_family else ''
-
-            # Create table items
-            self.parts_table.setItem(row, 0, QTableWidgetItem(part.part_number))
-            self.parts_table.setItem(row, 1, QTableWidgetItem(part.name))
-            self.parts_table.setItem(
-                row,
-                2,
-                QTableWidgetItem(part.category.capitalize() if part.category else ''),
-            )
-            self.parts_table.setItem(row, 3, QTableWidgetItem(family_name))
-            self.parts_table.setItem(row, 4, QTableWidgetItem(f'${part.price:.2f}'))
+                self.parts_table.setItem(row, 3, QTableWidgetItem(family_name))
+                self.parts_table.setItem(row, 4, QTableWidgetItem(f'${part.price:.2f}'))
 
-            # Store part ID in the first column item
-            self.parts_table.item(row, 0).setData(Qt.UserRole, part.id)
+                # Store part ID in the first column item
+                self.parts_table.item(row, 0).setData(Qt.UserRole, part.id)
 
     def reset_filters(self):
         """Reset all filters and reload parts."""
@@ -381,30 +388,31 @@ class SparePartsTab(QWidget):
         row = selected_items[0].row()
         part_id = self.parts_table.item(row, 0).data(Qt.UserRole)
 
-        # Get part details
-        part = self.db.query(SparePart).get(part_id)
-        if not part:
-            self.clear_details()
-            self.add_to_quote_btn.setEnabled(False)
-            return
-
-        # Update details section
-        self.part_number_label.setText(part.part_number)
-        self.part_name_label.setText(part.name)
-        self.part_description_label.setText(part.description or '')
-        self.part_price_label.setText(f'${part.price:.2f}')
-
-        if part.product_family:
-            self.part_family_label.setText(part.product_family.name)
-        else:
-            self.part_family_label.setText('N/A')
+        with session_scope() as db:
+            # Get part details
+            part = db.query(SparePart).get(part_id)
+            if not part:
+                self.clear_details()
+                self.add_to_quote_btn.setEnabled(False)
+                return
+
+            # Update details section
+            self.part_number_label.setText(part.part_number)
+            self.part_name_label.setText(part.name)
+            self.part_description_label.setText(part.description or '')
+            self.part_price_label.setText(f'${part.price:.2f}')
+
+            if part.product_family:
+                self.part_family_label.setText(part.product_family.name)
+            else:
+                self.part_family_label.setText('N/A')
 
-        self.part_category_label.setText(
-            part.category.capitalize() if part.category else 'N/A'
-        )
+            self.part_category_label.setText(
+                part.category.capitalize() if part.category else 'N/A'
+            )
 
-        # Enable add to quote button
-        self.add_to_quote_btn.setEnabled(True)
+            # Enable add to quote button
+            self.add_to_quote_btn.setEnabled(True)
 
     def clear_details(self):
         """Clear the details section."""
@@ -426,27 +434,25 @@ class SparePartsTab(QWidget):
         row = selected_items[0].row()
         part_id = self.parts_table.item(row, 0).data(Qt.UserRole)
 
-        # Get part details
-        part = self.db.query(SparePart).get(part_id)
-        if not part:
-            return
-
-        # Create part info dictionary
-        part_info = {
-            'type': 'spare_part',
-            'id': part.id,
-            'part_number': part.part_number,
-            'name': part.name,
-            'description': part.description,
-            'price': part.price,
-            'category': part.category,
-            'product_family': part.product_family.name if part.product_family else '',
-        }
+        with session_scope() as db:
+            # Get part details
+            part = db.query(SparePart).get(part_id)
+            if not part:
+                return
+
+            # Create part info dictionary
+            part_info = {
+                'type': 'spare_part',
+                'id': part.id,
+                'part_number': part.part_number,
+                'name': part.name,
+                'description': part.description,
+                'price': part.price,
+                'category': part.category,
+                'product_family': (
+                    part.product_family.name if part.product_family else ''
+                ),
+            }
 
         # Emit signal with part info
         self.part_selected.emit(part_info)
-
-    def closeEvent(self, event):
-        """Close database connection when widget is closed."""
-        self.db.close()
-        super().closeEvent(event)
@@ -36,7 +36,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from src.core.database import SessionLocal
+from src.core.database import session_scope
 from src.core.services.product_service import ProductService
 
 
@@ -378,14 +378,11 @@ class SpecificationsTab(QWidget):
         if self.current_product and 'model' in self.current_product:
             product_family = self.current_product['model'].split()[0]
 
-            db = SessionLocal()
-            try:
+            with session_scope() as db:
                 available_voltages = self.product_service.get_available_voltages(
                     db, product_family
                 )
                 voltage.addItems(available_voltages)
-            finally:
-                db.close()
 
         layout.addRow('Supply Voltage:', voltage)
         self.specs_widgets['voltage'] = voltage
@@ -408,16 +405,13 @@ class SpecificationsTab(QWidget):
         if self.current_product and 'model' in self.current_product:
             product_family = self.current_product['model'].split()[0]
 
-            db = SessionLocal()
-            try:
+            with session_scope() as db:
                 available_materials = (
                     self.product_service.get_available_materials_for_product(
                         db, product_family
                     )
                 )
                 material.addItems([m['display_name'] for m in available_materials])
-            finally:
-                db.close()
 
         layout.addRow('Material:', material)
         self.specs_widgets['material'] = material
@@ -688,8 +682,7 @@ class SpecificationsTab(QWidget):
         """Add additional options section."""
         group = QGroupBox('Additional Options')
         layout = QVBoxLayout()
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             options = self.product_service.get_all_additional_options(db)
             for opt in options:
                 label = f'{opt.name} (+${opt.price:.2f})' if opt.price else opt.name
@@ -698,8 +691,6 @@ class SpecificationsTab(QWidget):
                     checkbox.setToolTip(opt.description)
                 layout.addWidget(checkbox)
                 self.specs_widgets[opt.name] = checkbox
-        finally:
-            db.close()
         group.setLayout(layout)
         self.specs_layout.addWidget(group)
 
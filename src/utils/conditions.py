@@ -0,0 +1,232 @@
+"""
+Compiled, sandboxed evaluation of pricing condition expressions.
+
+Price components store conditions as expression strings over the pricing
+inputs, e.g. ``"quantity >= 10 and length < 48"``. This module parses each
+expression once, validates its AST against a small whitelist (numbers,
+comparisons, arithmetic, and/or/not, and the four input variables) and
+compiles it into a plain Python function. Compiled conditions are cached by
+expression text, so evaluating a condition is an ordinary function call with
+no string handling and no access to builtins.
+
+Every condition also compiles to a NumPy variant that evaluates a whole
+vector of inputs at once, for bulk evaluation of break tables.
+"""
+
+import ast
+from functools import lru_cache
+from typing import Callable, FrozenSet, Optional
+
+import numpy as np
+
+CONDITION_VARIABLES = ("quantity", "length", "volume", "weight")
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.Eq,
+    ast.NotEq,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+)
+
+
+class _VectorizeBoolOps(ast.NodeTransformer):
+    """Rewrite and/or/not and chained comparisons into elementwise NumPy calls."""
+
+    @staticmethod
+    def _call(name: str, args) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        name = "_and" if isinstance(node.op, ast.And) else "_or"
+        result = node.values[0]
+        for value in node.values[1:]:
+            result = self._call(name, [result, value])
+        return result
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._call("_not", [node.operand])
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        left = node.left
+        result = None
+        for op, right in zip(node.ops, node.comparators):
+            pair = ast.Compare(left=left, ops=[op], comparators=[right])
+            result = pair if result is None else self._call("_and", [result, pair])
+            left = right
+        return result
+
+
+def _validate(tree: ast.Expression, condition: str) -> FrozenSet[str]:
+    """Check a parsed condition against the whitelist; return the variables used."""
+    variables = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(
+                f"Unsupported syntax {type(node).__name__} in condition: {condition}"
+            )
+        if isinstance(node, ast.Name):
+            if node.id not in CONDITION_VARIABLES:
+                raise ValueError(f"Unknown name '{node.id}' in condition: {condition}")
+            variables.add(node.id)
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant in condition: {condition}")
+    return frozenset(variables)
+
+
+def _to_function(body: ast.expr, namespace: dict) -> Callable:
+    """Compile an expression AST into a function of the condition variables."""
+    arguments = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name) for name in CONDITION_VARIABLES],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    tree = ast.Expression(body=ast.Lambda(args=arguments, body=body))
+    ast.fix_missing_locations(tree)
+    return eval(compile(tree, "<condition>", "eval"), namespace)  # noqa: S307
+
+
+class CompiledCondition:
+    """
+    A validated condition expression compiled to Python functions.
+
+    Attributes:
+        text (str): Original condition expression
+        variables (FrozenSet[str]): Input variables the expression uses
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        tree = ast.parse(text.strip(), mode="eval")
+        self.variables = _validate(tree, text)
+
+        self._scalar = _to_function(tree.body, {"__builtins__": {}})
+        vector_tree = _VectorizeBoolOps().visit(tree)
+        self._vector = _to_function(
+            vector_tree.body,
+            {
+                "__builtins__": {},
+                "_and": np.logical_and,
+                "_or": np.logical_or,
+                "_not": np.logical_not,
+            },
+        )
+
+    def __call__(
+        self,
+        quantity: Optional[float] = None,
+        length: Optional[float] = None,
+        volume: Optional[float] = None,
+        weight: Optional[float] = None,
+    ) -> bool:
+        """
+        Evaluate the condition for one set of inputs.
+
+        A condition that uses an input which is None, or that fails to evaluate
+        (e.g. division by zero), is False.
+        """
+        values = {
+            "quantity": quantity,
+            "length": length,
+            "volume": volume,
+            "weight": weight,
+        }
+        if any(values[name] is None for name in self.variables):
+            return False
+        try:
+            return bool(self._scalar(quantity, length, volume, weight))
+        except (ArithmeticError, TypeError):
+            return False
+
+    def evaluate_many(
+        self,
+        quantity=None,
+        length=None,
+        volume=None,
+        weight=None,
+    ) -> np.ndarray:
+        """
+        Evaluate the condition for a vector of inputs.
+
+        Each input may be an array, a scalar (broadcast) or None. NaN or None
+        in an input the condition uses makes that row False. Rows are False
+        wherever the scalar evaluation would be, including division by zero.
+
+        Returns:
+            np.ndarray: Boolean mask, one entry per row
+        """
+        arrays = [
+            np.asarray(np.nan if value is None else value, dtype=np.float64)
+            for value in (quantity, length, volume, weight)
+        ]
+        arrays = np.broadcast_arrays(*arrays)
+        missing = np.zeros(arrays[0].shape, dtype=bool)
+        for name, values in zip(CONDITION_VARIABLES, arrays):
+            if name in self.variables:
+                missing |= np.isnan(values)
+        try:
+            with np.errstate(divide="raise", invalid="raise"):
+                result = np.broadcast_to(self._vector(*arrays), missing.shape)
+        except FloatingPointError:
+            # Rare: fall back to row by row so failing rows are False
+            result = np.fromiter(
+                (
+                    self(*(float(a[i]) for a in arrays))
+                    for i in np.ndindex(missing.shape)
+                ),
+                dtype=bool,
+                count=missing.size,
+            ).reshape(missing.shape)
+        return np.asarray(result, dtype=bool) & ~missing
+
+    def __repr__(self) -> str:
+        return f"<CompiledCondition({self.text!r})>"
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> CompiledCondition:
+    """
+    Parse, validate and compile a condition expression (cached by text).
+
+    Args:
+        condition: Expression over quantity, length, volume and weight
+
+    Returns:
+        CompiledCondition: Callable condition
+
+    Raises:
+        ValueError: If the expression is not valid or uses unsupported syntax
+    """
+    try:
+        return CompiledCondition(condition)
+    except SyntaxError as e:
+        raise ValueError(f"Invalid condition: {condition}") from e
@@ -2,8 +2,10 @@
 Database utility functions for common operations.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 
+from sqlalchemy import Select, tuple_
 from sqlalchemy.orm import Session
 
 from src.core.database import Base
@@ -59,6 +61,78 @@ def delete_and_commit(db: Session, obj: T) -> bool:
     return True
 
 
+@dataclass(frozen=True)
+class Page:
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items: Rows (or objects) of the page
+        next_cursor: Sort key of the last item, to pass as the cursor for the
+            next page; None on the last page
+    """
+
+    items: List[Any]
+    next_cursor: Optional[Tuple[Any, ...]]
+
+    @property
+    def has_more(self) -> bool:
+        """Whether there is a next page."""
+        return self.next_cursor is not None
+
+
+def keyset_page(
+    db: Session,
+    statement: Select,
+    keys: Sequence[Any],
+    cursor: Optional[Sequence[Any]] = None,
+    page_size: int = 100,
+    descending: bool = False,
+) -> Page:
+    """
+    Fetch the page of a statement that follows a cursor.
+
+    The statement is ordered by the keys, which must identify a row uniquely
+    (end with the primary key), and filtered to the rows past the cursor with
+    a row value comparison. An index on the keys turns every page into one
+    range scan, however deep into the listing it is, where OFFSET paging
+    would read and discard all the earlier rows.
+
+    Args:
+        db: Database session
+        statement: SELECT of one ORM entity or of named columns that include
+            the keys
+        keys: Sort key columns, e.g. (Quote.date_created, Quote.id)
+        cursor: Key values of the last item of the previous page (None for
+            the first page)
+        page_size: Maximum number of items per page
+        descending: Sort newest/largest first
+
+    Returns:
+        Page: The items and the cursor of the next page
+    """
+    if page_size < 1:
+        raise ValueError('page_size must be at least 1')
+    if cursor is not None:
+        key, after = tuple_(*keys), tuple_(*cursor)
+        statement = statement.where(key < after if descending else key > after)
+    statement = statement.order_by(
+        *(key.desc() if descending else key for key in keys)
+    ).limit(page_size + 1)
+
+    result = db.execute(statement)
+    first, *others = statement.column_descriptions
+    if not others and first['expr'] is first['entity']:
+        result = result.scalars()
+    items = result.all()
+
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = tuple(getattr(items[-1], key.key) for key in keys)
+    return Page(items=items, next_cursor=next_cursor)
+
+
 def generate_quote_number(db: Session) -> str:
     """Generate a unique quote number."""
     from src.core.models import Quote
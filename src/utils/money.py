@@ -0,0 +1,94 @@
+"""
+Fixed-point money in integer cents.
+
+Prices are entered and displayed in dollars, but adding many float dollar
+amounts drifts (0.1 + 0.2 != 0.3), and the drift grows with the size of a
+quote. Pricing and quote totals therefore accumulate integer cents: every
+amount is rounded to a whole cent once, when it enters a sum, and converted
+back to dollars only for display or storage.
+
+All conversions round halves away from zero, the same as SQL ROUND(), so a
+total computed in Python, in a NumPy batch or in a SQL SUM agrees to the cent.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import Integer, cast, func
+from sqlalchemy.sql.elements import ColumnElement
+
+CENTS_PER_DOLLAR = 100
+
+
+def _round_half_away(value: float) -> int:
+    """Round to the nearest integer, halves away from zero."""
+    rounded = math.floor(abs(value) + 0.5)
+    return -rounded if value < 0 else rounded
+
+
+def to_cents(amount: Optional[float]) -> int:
+    """
+    Convert a dollar amount to whole cents.
+
+    Args:
+        amount: Amount in dollars (None is zero)
+
+    Returns:
+        int: Amount in cents, halves rounded away from zero
+    """
+    if not amount:
+        return 0
+    if isinstance(amount, int):
+        return amount * CENTS_PER_DOLLAR
+    return _round_half_away(float(amount) * CENTS_PER_DOLLAR)
+
+
+def from_cents(cents: int) -> float:
+    """Convert whole cents to a dollar amount."""
+    return cents / CENTS_PER_DOLLAR
+
+
+def percent_of(cents: int, percent: Optional[float]) -> int:
+    """
+    Get a percentage of an amount in cents (e.g. a discount).
+
+    Args:
+        cents: Amount in cents
+        percent: Percentage, e.g. 12.5 for 12.5% (None is zero)
+
+    Returns:
+        int: The percentage of the amount in cents, halves rounded away from zero
+    """
+    if not percent or not cents:
+        return 0
+    return _round_half_away(cents * percent / 100)
+
+
+def to_cents_array(amounts) -> np.ndarray:
+    """
+    Convert an array of dollar amounts to int64 cents.
+
+    NaN amounts become 0; callers that price invalid rows as NaN must keep
+    their own mask.
+
+    Args:
+        amounts: Array-like of amounts in dollars
+
+    Returns:
+        np.ndarray: int64 array of cents, halves rounded away from zero
+    """
+    amounts = np.nan_to_num(np.asarray(amounts, dtype=np.float64), nan=0.0)
+    cents = np.floor(np.abs(amounts) * CENTS_PER_DOLLAR + 0.5)
+    return (np.sign(amounts) * cents).astype(np.int64)
+
+
+def cents_column(column) -> ColumnElement:
+    """
+    Build a SQL expression converting a dollar column to integer cents.
+
+    Use it inside aggregates, e.g. ``func.sum(cents_column(QuoteItem.unit_price)
+    * QuoteItem.quantity)``, so the database adds exact integers instead of
+    floats.
+    """
+    return cast(func.round(column * CENTS_PER_DOLLAR), Integer)
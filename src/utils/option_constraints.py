@@ -0,0 +1,276 @@
+"""
+Bitset constraint solver for configurable options.
+
+Options carry three kinds of compatibility rules: ``dependencies`` (IDs of
+options that must be selected first), ``conflicts`` (IDs of options that
+cannot be selected together with it) and ``excluded_products`` (products the
+option is not offered for). OptionConstraints compiles the rules of one
+product family's options into integer bitsets, one bit per option, so the
+options still available for a selection are found with a handful of bitwise
+operations instead of re-checking every rule:
+
+    valid = offered & ~(conflicts of selected options)
+                    & ~(dependents of unselected options)
+
+OptionSelection keeps a selection and its valid set up to date as values are
+picked, and reports which options changed validity so only their menus need
+refreshing.
+
+Example:
+    >>> constraints = OptionConstraints.compile(options, "LS2000")
+    >>> constraints.valid_choices({"Cable": "PVC"})
+    {'Cable': ['PVC', 'Teflon'], 'Cable Length': ['10', '20']}
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+def is_selected(value: Any) -> bool:
+    """Whether an option value counts as selected ("None" and empty do not)."""
+    return value not in (None, "", False) and value != "None"
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """Yield the indexes of the set bits of a mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass(frozen=True)
+class OptionConstraints:
+    """
+    Compatibility rules of one product family's options, compiled to bitsets.
+
+    Bit i of every mask stands for option ``names[i]``.
+
+    Attributes:
+        product_family: Product family name the rules were compiled for
+        names: Option names, in bit order
+        choices: Choices of each option, in bit order
+        bits: Bit index of each option, by name
+        requires: Per option, the options it depends on
+        conflicts: Per option, the options it conflicts with (either way)
+        dependents: Per option, the options that depend on it
+        offered: Options offered to the family: not excluded for it and with
+            every dependency offered too
+        excluded_by_product: Options excluded for each listed product
+    """
+
+    product_family: str
+    names: Tuple[str, ...]
+    choices: Tuple[Tuple[Any, ...], ...]
+    bits: Mapping[str, int]
+    requires: Tuple[int, ...]
+    conflicts: Tuple[int, ...]
+    dependents: Tuple[int, ...]
+    offered: int
+    excluded_by_product: Mapping[str, int]
+
+    @classmethod
+    def compile(
+        cls, options: Iterable[Any], product_family: str
+    ) -> "OptionConstraints":
+        """
+        Compile the rules of a product family's options.
+
+        Args:
+            options: Option rows (or objects with the same attributes) offered
+                to the family
+            product_family: Product family name; options listing it in
+                excluded_products are not offered
+
+        Returns:
+            OptionConstraints: Compiled rules
+        """
+        options = [o for o in options if getattr(o, "is_active", True) is not False]
+        # One bit per option name; the first option with a name wins
+        by_name: Dict[str, Any] = {}
+        for option in options:
+            by_name.setdefault(option.name, option)
+        options = list(by_name.values())
+        position = {option.id: i for i, option in enumerate(options)}
+
+        n = len(options)
+        requires = [0] * n
+        conflicts = [0] * n
+        dependents = [0] * n
+        unsatisfiable = 0
+        excluded = 0
+        excluded_by_product: Dict[str, int] = {}
+        for i, option in enumerate(options):
+            for option_id in option.dependencies or ():
+                j = position.get(option_id)
+                if j is None:
+                    # Depends on an option the family does not offer
+                    unsatisfiable |= 1 << i
+                elif j != i:
+                    requires[i] |= 1 << j
+                    dependents[j] |= 1 << i
+            for option_id in option.conflicts or ():
+                j = position.get(option_id)
+                if j is not None and j != i:
+                    conflicts[i] |= 1 << j
+                    conflicts[j] |= 1 << i
+            for product in option.excluded_products or ():
+                if product == product_family:
+                    excluded |= 1 << i
+                else:
+                    excluded_by_product[product] = (
+                        excluded_by_product.get(product, 0) | 1 << i
+                    )
+
+        # Options depending (transitively) on an unoffered option are unoffered
+        unoffered = unsatisfiable | excluded
+        pending = unoffered
+        while pending:
+            spread = 0
+            for i in iter_bits(pending):
+                spread |= dependents[i]
+            pending = spread & ~unoffered
+            unoffered |= pending
+
+        return cls(
+            product_family=product_family,
+            names=tuple(option.name for option in options),
+            choices=tuple(tuple(option.choices or ()) for option in options),
+            bits={option.name: i for i, option in enumerate(options)},
+            requires=tuple(requires),
+            conflicts=tuple(conflicts),
+            dependents=tuple(dependents),
+            offered=((1 << n) - 1) & ~unoffered,
+            excluded_by_product=excluded_by_product,
+        )
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Get the mask of the named options (unknown names are ignored)."""
+        mask = 0
+        for name in names:
+            i = self.bits.get(name)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def selection_mask(self, selected_options: Mapping[str, Any]) -> int:
+        """Get the mask of the options selected in a name -> value mapping."""
+        return self.mask(
+            name for name, value in selected_options.items() if is_selected(value)
+        )
+
+    def blocked_by(self, selected: int) -> int:
+        """Get the options a selection rules out through conflicts."""
+        blocked = 0
+        for i in iter_bits(selected):
+            blocked |= self.conflicts[i]
+        return blocked
+
+    def unmet(self, selected: int) -> int:
+        """Get the options with a dependency missing from a selection."""
+        unmet = 0
+        for i in iter_bits(self.offered & ~selected):
+            unmet |= self.dependents[i]
+        return unmet
+
+    def valid_mask(self, selected: int, product: Optional[str] = None) -> int:
+        """
+        Get the options available for a selection.
+
+        An option is available if it is offered, none of the selected options
+        conflicts with it, every option it depends on is selected, and it is
+        not excluded for the product. Selected options are included while they
+        remain valid.
+
+        Args:
+            selected: Mask of the selected options
+            product: Selected product (model number), if any
+
+        Returns:
+            int: Mask of the available options
+        """
+        valid = self.offered & ~self.blocked_by(selected) & ~self.unmet(selected)
+        if product is not None:
+            valid &= ~self.excluded_by_product.get(product, 0)
+        return valid
+
+    def valid_choices(
+        self, selected_options: Mapping[str, Any], product: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Get the choices of the options available for a selection.
+
+        Args:
+            selected_options: Selected option values by option name
+            product: Selected product (model number), if any
+
+        Returns:
+            Dict[str, List[Any]]: Choices of each available option, by name
+        """
+        valid = self.valid_mask(self.selection_mask(selected_options), product)
+        return {self.names[i]: list(self.choices[i]) for i in iter_bits(valid)}
+
+
+class OptionSelection:
+    """
+    Selection of options kept in step with its compiled constraints.
+
+    Each change updates the selection and the valid options with bitwise
+    operations and returns the options whose validity changed.
+
+    Attributes:
+        constraints: Compiled rules of the family's options
+        product: Selected product (model number), if any
+        selected: Mask of the selected options
+        valid: Mask of the options available for the selection
+    """
+
+    def __init__(
+        self,
+        constraints: OptionConstraints,
+        selected_options: Optional[Mapping[str, Any]] = None,
+        product: Optional[str] = None,
+    ):
+        self.constraints = constraints
+        self.product = product
+        self.selected = constraints.selection_mask(selected_options or {})
+        self.valid = constraints.valid_mask(self.selected, product)
+
+    def set(self, name: str, value: Any) -> List[str]:
+        """
+        Set the value of an option.
+
+        Args:
+            name: Option name (options without rules are ignored)
+            value: New value; None, "" and "None" deselect the option
+
+        Returns:
+            List[str]: Names of the options that became available or
+            unavailable
+        """
+        i = self.constraints.bits.get(name)
+        if i is None:
+            return []
+        bit = 1 << i
+        selected = self.selected | bit if is_selected(value) else self.selected & ~bit
+        if selected == self.selected:
+            return []
+        self.selected = selected
+        previous = self.valid
+        self.valid = self.constraints.valid_mask(selected, self.product)
+        return [self.constraints.names[j] for j in iter_bits(previous ^ self.valid)]
+
+    def is_selected(self, name: str) -> bool:
+        """Whether an option is selected."""
+        i = self.constraints.bits.get(name)
+        return i is not None and bool(self.selected >> i & 1)
+
+    def is_valid(self, name: str) -> bool:
+        """Whether an option is available for the current selection."""
+        i = self.constraints.bits.get(name)
+        return i is not None and bool(self.valid >> i & 1)
+
+    def valid_choices(self) -> Dict[str, List[Any]]:
+        """Get the choices of the available options, by name."""
+        names, choices = self.constraints.names, self.constraints.choices
+        return {names[i]: list(choices[i]) for i in iter_bits(self.valid)}
@@ -0,0 +1,52 @@
+"""Tests for keeping OptionProductFamily links in sync with Option.product_families."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base
+from src.core.models import Option, OptionProductFamily
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _linked_families(db, option):
+    return sorted(
+        family
+        for (family,) in db.query(OptionProductFamily.product_family).filter_by(
+            option_id=option.id
+        )
+    )
+
+
+def test_reassigning_an_overlapping_family_list(db):
+    option = Option(
+        name="Connection", category="Connection", product_families=["LS2000", "LS7000"]
+    )
+    db.add(option)
+    db.commit()
+
+    option.product_families = ["LS7000", "LS2000", "LS8000"]
+    db.commit()
+    assert _linked_families(db, option) == ["LS2000", "LS7000", "LS8000"]
+
+    option.product_families = "LS8000,LS9000"
+    db.commit()
+    assert _linked_families(db, option) == ["LS8000", "LS9000"]
+
+
+def test_clearing_the_family_list(db):
+    option = Option(name="Material", category="Material", product_families=["LS2000"])
+    db.add(option)
+    db.commit()
+
+    option.product_families = []
+    db.commit()
+    assert _linked_families(db, option) == []